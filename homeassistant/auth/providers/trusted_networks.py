@@ -7,6 +7,7 @@ Abort login flow if not access from trusted network.
 from __future__ import annotations
 
 from collections.abc import Mapping
+from functools import cached_property
 from ipaddress import (
     IPv4Address,
     IPv4Network,
@@ -23,6 +24,7 @@ from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.network import is_cloud_connection
+from homeassistant.util.network import IPNetworkSet
 
 from .. import InvalidAuthError
 from ..models import AuthFlowResult, Credentials, RefreshToken, UserMeta
@@ -77,6 +79,11 @@ class TrustedNetworksAuthProvider(AuthProvider):
         """Return trusted networks."""
         return cast(list[IPNetwork], self.config[CONF_TRUSTED_NETWORKS])
 
+    @cached_property
+    def _trusted_networks_set(self) -> IPNetworkSet:
+        """Return trusted networks as a set for fast lookups."""
+        return IPNetworkSet(self.trusted_networks)
+
     @property
     def trusted_users(self) -> dict[IPNetwork, Any]:
         """Return trusted users per network."""
@@ -185,9 +192,7 @@ class TrustedNetworksAuthProvider(AuthProvider):
         if not self.trusted_networks:
             raise InvalidAuthError("trusted_networks is not configured")
 
-        if not any(
-            ip_addr in trusted_network for trusted_network in self.trusted_networks
-        ):
+        if ip_addr not in self._trusted_networks_set:
             raise InvalidAuthError("Not in trusted_networks")
 
         if any(ip_addr in trusted_proxy for trusted_proxy in self.trusted_proxies):
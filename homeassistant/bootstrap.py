@@ -69,6 +69,7 @@ from .const import (
     REQUIRED_NEXT_PYTHON_HA_RELEASE,
     REQUIRED_NEXT_PYTHON_VER,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
+    __version__,
 )
 from .exceptions import HomeAssistantError
 from .helpers import (
@@ -87,7 +88,7 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
-from .helpers.storage import get_internal_store_manager
+from .helpers.storage import Store, get_internal_store_manager
 from .helpers.system_info import async_get_system_info
 from .helpers.typing import ConfigType
 from .setup import (
@@ -95,7 +96,9 @@ from .setup import (
     # that it is not part of the public API and should not be used
     # by integrations. It is only used for internal tracking of
     # which integrations are being set up.
+    SetupPhases,
     _setup_started,
+    async_get_setup_timeline,
     async_get_setup_timings,
     async_notify_setup_error,
     async_set_domains_to_be_loaded,
@@ -244,6 +247,14 @@ PRELOAD_STORAGE = [
     "auth_module.totp",
 ]
 
+# The import plan is built from the setup timeline of the previous
+# start and is used to import integrations ahead of their setup
+IMPORT_PLAN_STORAGE_KEY = "core.bootstrap_import_plan"
+IMPORT_PLAN_STORAGE_VERSION = 1
+# The number of import jobs queued at once by the import planner
+# to avoid starving the imports requested by the setups
+IMPORT_PLAN_MAX_QUEUED = 4
+
 
 async def async_setup_hass(
     runtime_config: RuntimeConfig,
@@ -277,6 +288,7 @@ async def async_setup_hass(
     _LOGGER.info("Config directory: %s", runtime_config.config_dir)
 
     loader.async_setup(hass)
+    await loader.async_load_manifest_cache(hass)
     block_async_io.enable()
 
     config_dict = None
@@ -762,6 +774,98 @@ async def async_setup_multi_components(
             )
 
 
+@core.callback
+def _async_build_import_plan(hass: core.HomeAssistant) -> dict[str, Any]:
+    """Build the import plan from the setup timeline."""
+    timeline = async_get_setup_timeline(hass)
+    durations: defaultdict[str, float] = defaultdict(float)
+    for event in timeline["events"]:
+        if event["phase"] == SetupPhases.IMPORT and event["end"] is not None:
+            durations[event["domain"]] += event["end"] - event["start"]
+    for domain, seconds in async_get_setup_timings(hass).items():
+        durations[domain] += seconds
+    return {
+        "ha_version": __version__,
+        "dependencies": timeline["dependencies"],
+        "durations": durations,
+    }
+
+
+def _import_plan_waves(plan: dict[str, Any], domains: set[str]) -> list[list[str]]:
+    """Return the domains to import in waves of independent domains.
+
+    A domain is in the wave after the last of its dependencies. Each wave
+    is ordered by the longest chain of setup time that waits on the domain,
+    so the domains on the critical path are imported first.
+    """
+    dependencies: dict[str, list[str]] = plan["dependencies"]
+    durations: dict[str, float] = plan["durations"]
+    dependents: defaultdict[str, set[str]] = defaultdict(set)
+    for domain, deps in dependencies.items():
+        for dep in deps:
+            dependents[dep].add(domain)
+
+    levels: dict[str, int] = {}
+    ranks: dict[str, float] = {}
+
+    def _level(domain: str) -> int:
+        if (level := levels.get(domain)) is not None:
+            return level
+        levels[domain] = 0  # Guard against cycles
+        levels[domain] = level = max(
+            (_level(dep) + 1 for dep in dependencies.get(domain, ()) if dep in domains),
+            default=0,
+        )
+        return level
+
+    def _rank(domain: str) -> float:
+        if (rank := ranks.get(domain)) is not None:
+            return rank
+        ranks[domain] = 0  # Guard against cycles
+        ranks[domain] = rank = durations.get(domain, 0) + max(
+            (_rank(dependent) for dependent in dependents.get(domain, ())),
+            default=0,
+        )
+        return rank
+
+    waves: defaultdict[int, list[str]] = defaultdict(list)
+    for domain in domains:
+        waves[_level(domain)].append(domain)
+    return [
+        sorted(waves[level], key=lambda domain: (-_rank(domain), domain))
+        for level in sorted(waves)
+    ]
+
+
+async def _async_preimport_integrations(
+    hass: core.HomeAssistant,
+    plan: dict[str, Any],
+    integration_cache: dict[str, loader.Integration],
+    domains_to_setup: set[str],
+) -> None:
+    """Import the integrations of the import plan ahead of their setup."""
+    domains = {
+        domain
+        for domain in domains_to_setup
+        if (integration := integration_cache.get(domain)) is not None
+        and integration.import_executor
+        and integration.pkg_path not in sys.modules
+    }
+    for wave in _import_plan_waves(plan, domains):
+        for idx in range(0, len(wave), IMPORT_PLAN_MAX_QUEUED):
+            results = await asyncio.gather(
+                *(
+                    integration_cache[domain].async_get_component()
+                    for domain in wave[idx : idx + IMPORT_PLAN_MAX_QUEUED]
+                ),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    # The setup of the integration will log the error
+                    _LOGGER.debug("Pre-import failed: %s", result)
+
+
 async def _async_resolve_domains_to_setup(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> tuple[set[str], dict[str, loader.Integration]]:
@@ -927,6 +1031,13 @@ async def _async_set_up_integrations(
     watcher = _WatchPendingSetups(hass, _setup_started(hass))
     watcher.async_start()
 
+    import_plan_store = Store[dict[str, Any]](
+        hass, IMPORT_PLAN_STORAGE_VERSION, IMPORT_PLAN_STORAGE_KEY, private=True
+    )
+    import_plan_task = create_eager_task(
+        import_plan_store.async_load(), name="load import plan", loop=hass.loop
+    )
+
     domains_to_setup, integration_cache = await _async_resolve_domains_to_setup(
         hass, config
     )
@@ -977,6 +1088,20 @@ async def _async_set_up_integrations(
             async_set_domains_to_be_loaded(hass, to_be_loaded)
             await async_setup_multi_components(hass, domain_group, config)
 
+    # Import the integrations ahead of their setup in the order
+    # recorded during the previous start, once the import executor
+    # is no longer busy with the domains of the pre stages
+    if (import_plan := await import_plan_task) and import_plan.get(
+        "ha_version"
+    ) == __version__:
+        hass.async_create_background_task(
+            _async_preimport_integrations(
+                hass, import_plan, integration_cache, domains_to_setup
+            ),
+            "preimport integrations",
+            eager_start=True,
+        )
+
     # Enables after dependencies when setting up stage 1 domains
     async_set_domains_to_be_loaded(hass, stage_1_domains)
 
@@ -1023,6 +1148,17 @@ async def _async_set_up_integrations(
 
     watcher.async_stop()
 
+    hass.async_create_background_task(
+        import_plan_store.async_save(_async_build_import_plan(hass)),
+        "save import plan",
+        eager_start=True,
+    )
+    hass.async_create_background_task(
+        loader.async_save_manifest_cache(hass),
+        "save manifest cache",
+        eager_start=True,
+    )
+
     if _LOGGER.isEnabledFor(logging.DEBUG):
         setup_time = async_get_setup_timings(hass)
         _LOGGER.debug(
@@ -1,10 +1,20 @@
 """Constants for the Backup integration."""
 
+from __future__ import annotations
+
 from logging import getLogger
+from typing import TYPE_CHECKING
+
+from homeassistant.util.signal_type import SignalType
+
+if TYPE_CHECKING:
+    from .manager import BackupProgress
 
 DOMAIN = "backup"
 LOGGER = getLogger(__package__)
 
+SIGNAL_BACKUP_PROGRESS: SignalType[BackupProgress] = SignalType("backup_progress")
+
 EXCLUDE_FROM_BACKUP = [
     "__pycache__/*",
     ".DS_Store",
@@ -7,26 +7,35 @@ from dataclasses import asdict, dataclass
 import hashlib
 import io
 import json
+import os
 from pathlib import Path
 import tarfile
 from tarfile import TarError
 import time
 from typing import Any, Protocol, cast
 
-from securetar import SecureTarFile, atomic_contents_add
+from securetar import SecureTarFile
 
 from homeassistant.const import __version__ as HAVERSION
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import integration_platform
+from homeassistant.helpers.dispatcher import dispatcher_send
 from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads_object
 
-from .const import DOMAIN, EXCLUDE_FROM_BACKUP, LOGGER
+from .const import DOMAIN, EXCLUDE_FROM_BACKUP, LOGGER, SIGNAL_BACKUP_PROGRESS
+from .util import GzipBlockWriter, add_contents, add_stream, collect_contents
 
 BUF_SIZE = 2**20 * 4  # 4MB
 
+# Most threads compressing a backup, to leave some cores to the rest
+MAX_COMPRESS_WORKERS = 4
+
+# Least seconds between two progress reports of a backup
+PROGRESS_INTERVAL = 1
+
 
 @dataclass(slots=True)
 class Backup:
@@ -43,6 +52,22 @@ class Backup:
         return {**asdict(self), "path": self.path.as_posix()}
 
 
+@dataclass(slots=True)
+class BackupProgress:
+    """Progress of a backup being generated."""
+
+    slug: str
+    done: bool
+    bytes_done: int
+    """Bytes of the files backed up so far."""
+    bytes_total: int
+    """Bytes of all the files to back up."""
+
+    def as_dict(self) -> dict:
+        """Return a dict representation of the progress."""
+        return asdict(self)
+
+
 class BackupPlatformProtocol(Protocol):
     """Define the format that backup platforms can have."""
 
@@ -236,11 +261,39 @@ class BackupManager:
         tar_file_path: Path,
         backup_data: dict[str, Any],
     ) -> int:
-        """Generate backup contents and return the size."""
+        """Generate backup contents and return the size.
+
+        The files are streamed into the compressed inner tar file, which is
+        written straight into the backup file.
+        """
         if not self.backup_dir.exists():
             LOGGER.debug("Creating backup directory")
             self.backup_dir.mkdir()
 
+        contents, bytes_total = collect_contents(
+            Path(self.hass.config.path()), EXCLUDE_FROM_BACKUP, "data"
+        )
+        last_report = 0.0
+
+        def report_progress(bytes_done: int, done: bool = False) -> None:
+            """Report the progress of the backup at an interval."""
+            nonlocal last_report
+            now = time.monotonic()
+            if not done and now - last_report < PROGRESS_INTERVAL:
+                return
+            last_report = now
+            dispatcher_send(
+                self.hass,
+                SIGNAL_BACKUP_PROGRESS,
+                BackupProgress(
+                    backup_data["slug"],
+                    done,
+                    # The tar headers are counted too
+                    min(bytes_done, bytes_total),
+                    bytes_total,
+                ),
+            )
+
         outer_secure_tarfile = SecureTarFile(
             tar_file_path, "w", gzip=False, bufsize=BUF_SIZE
         )
@@ -251,16 +304,24 @@ class BackupManager:
             tar_info.size = len(raw_bytes)
             tar_info.mtime = int(time.time())
             outer_secure_tarfile_tarfile.addfile(tar_info, fileobj=fileobj)
-            with outer_secure_tarfile.create_inner_tar(
-                "./homeassistant.tar.gz", gzip=True
-            ) as core_tar:
-                atomic_contents_add(
-                    tar_file=core_tar,
-                    origin_path=Path(self.hass.config.path()),
-                    excludes=EXCLUDE_FROM_BACKUP,
-                    arcname="data",
-                )
-
+            with (
+                add_stream(
+                    outer_secure_tarfile_tarfile, "./homeassistant.tar.gz"
+                ) as core_stream,
+                GzipBlockWriter(
+                    core_stream,
+                    workers=min(MAX_COMPRESS_WORKERS, os.cpu_count() or 1),
+                    on_write=report_progress,
+                ) as core_gzip,
+                tarfile.open(
+                    fileobj=core_gzip,  # type: ignore[call-overload]
+                    mode="w:",
+                    bufsize=BUF_SIZE,
+                ) as core_tar,
+            ):
+                add_contents(core_tar, contents)
+
+        report_progress(bytes_total, done=True)
         return tar_file_path.stat().st_size
 
 
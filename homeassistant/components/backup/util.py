@@ -0,0 +1,233 @@
+"""Utilities for the Backup integration."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path, PurePath
+import struct
+import tarfile
+import time
+from types import TracebackType
+from typing import IO, Self
+import zlib
+
+from .const import LOGGER
+
+# Size of the blocks of a gzip stream that are compressed on their own
+GZIP_BLOCK_SIZE = 2**20  # 1MB
+
+# A block is compressed with the end of the block before it as dictionary,
+# this is the size of the deflate window
+GZIP_DICT_SIZE = 2**15  # 32KB
+
+# A gzip header without file name or modification time, and the final
+# empty deflate block that ends the blocks of the stream
+GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+DEFLATE_END = b"\x03\x00"
+
+
+def _deflate_block(block: bytes, zdict: bytes, compresslevel: int) -> bytes:
+    """Compress a block to deflate blocks that end on a byte boundary."""
+    if zdict:
+        compressor = zlib.compressobj(
+            compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=zdict
+        )
+    else:
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(block) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+class GzipBlockWriter:
+    """Write a gzip stream to a file, compressing blocks of it in parallel.
+
+    The data is split in blocks which are compressed by a pool of threads,
+    each with the end of the block before it as dictionary, so the
+    compressed blocks join to a single deflate stream which compresses
+    about as well as one compressed at once. zlib releases the GIL while
+    compressing, so the threads make use of multiple cores.
+
+    Only a couple of blocks per thread are kept in memory, a write waits
+    for the oldest block to be compressed and written when it gets ahead.
+    """
+
+    def __init__(
+        self,
+        fileobj: IO[bytes],
+        compresslevel: int = 6,
+        workers: int = 1,
+        on_write: Callable[[int], None] | None = None,
+    ) -> None:
+        """Initialize the writer and write the gzip header.
+
+        on_write is called with the number of bytes written so far each
+        time a block has been handed over to be compressed.
+        """
+        self._fileobj = fileobj
+        self._compresslevel = compresslevel
+        self._on_write = on_write
+        self._executor: ThreadPoolExecutor | None = None
+        if workers > 1:
+            self._executor = ThreadPoolExecutor(
+                workers, thread_name_prefix="BackupCompress"
+            )
+        self._max_pending = 2 * workers
+        self._pending: deque[Future[bytes]] = deque()
+        self._buffer = bytearray()
+        self._zdict = b""
+        self._crc = 0
+        self._size = 0
+        fileobj.write(GZIP_HEADER)
+
+    def __enter__(self) -> Self:
+        """Return the writer."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """End the gzip stream, or give up the blocks after an error."""
+        if exc_type is None:
+            self.close()
+        elif self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+
+    def tell(self) -> int:
+        """Return the number of bytes written."""
+        return self._size + len(self._buffer)
+
+    def write(self, data: bytes) -> int:
+        """Write data to the stream."""
+        buffer = self._buffer
+        buffer += data
+        while len(buffer) >= GZIP_BLOCK_SIZE:
+            block = bytes(buffer[:GZIP_BLOCK_SIZE])
+            del buffer[:GZIP_BLOCK_SIZE]
+            self._compress(block)
+        return len(data)
+
+    def _compress(self, block: bytes) -> None:
+        """Compress a block and write the blocks compressed before it."""
+        self._crc = zlib.crc32(block, self._crc)
+        self._size += len(block)
+        zdict = self._zdict
+        self._zdict = block[-GZIP_DICT_SIZE:]
+
+        if self._executor is None:
+            self._fileobj.write(_deflate_block(block, zdict, self._compresslevel))
+        else:
+            if len(self._pending) >= self._max_pending:
+                self._fileobj.write(self._pending.popleft().result())
+            self._pending.append(
+                self._executor.submit(_deflate_block, block, zdict, self._compresslevel)
+            )
+
+        if self._on_write is not None:
+            self._on_write(self._size)
+
+    def close(self) -> None:
+        """Compress what is left and write the end of the gzip stream."""
+        if self._buffer:
+            self._compress(bytes(self._buffer))
+            self._buffer.clear()
+        while self._pending:
+            self._fileobj.write(self._pending.popleft().result())
+        if self._executor is not None:
+            self._executor.shutdown()
+        self._fileobj.write(DEFLATE_END)
+        self._fileobj.write(struct.pack("<II", self._crc, self._size & 0xFFFFFFFF))
+
+
+@contextmanager
+def add_stream(tar: tarfile.TarFile, name: str) -> Iterator[IO[bytes]]:
+    """Add a member to an uncompressed tar file and yield a file to write it.
+
+    The header of the member is written again with its size once the
+    member has been written, so it never has to be kept anywhere else.
+    """
+    tar_info = tarfile.TarInfo(name)
+    # A float mtime makes sure the header is a PAX header, which keeps
+    # the same length when the size of a large member is added to it
+    tar_info.mtime = time.time()
+    fileobj = tar.fileobj
+    assert fileobj is not None
+    start = fileobj.tell()
+    header = tar_info.tobuf(tar.format, tar.encoding, tar.errors)
+    fileobj.write(header)
+
+    yield fileobj
+
+    end = fileobj.tell()
+    tar_info.size = end - start - len(header)
+    if remainder := tar_info.size % tarfile.BLOCKSIZE:
+        fileobj.write(tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+    padded_end = fileobj.tell()
+    tar.offset += padded_end - start - len(header)
+    fileobj.seek(start)
+    tar.addfile(tar_info)
+    if fileobj.tell() != start + len(header):
+        raise tarfile.TarError(f"Header of {name} changed length")
+    fileobj.seek(padded_end)
+
+
+def _is_excluded(path: PurePath, excludes: list[str]) -> bool:
+    """Return if a path matches one of the exclude patterns."""
+    for exclude in excludes:
+        if path.match(exclude):
+            LOGGER.debug("Ignoring %s because of %s", path, exclude)
+            return True
+    return False
+
+
+def collect_contents(
+    origin_path: Path, excludes: list[str], arcname: str
+) -> tuple[list[tuple[Path, str]], int]:
+    """Return the paths to back up with their names, and the size of the files.
+
+    Directories are listed on their own before their contents, so empty
+    directories are kept too.
+    """
+    contents: list[tuple[Path, str]] = []
+    size = _collect_contents(origin_path, excludes, arcname, contents)
+    return contents, size
+
+
+def _collect_contents(
+    path: Path, excludes: list[str], name: str, contents: list[tuple[Path, str]]
+) -> int:
+    """Collect the contents of a directory and return the size of its files."""
+    if _is_excluded(path, excludes):
+        return 0
+
+    contents.append((path, name))
+    size = 0
+    for item in path.iterdir():
+        if _is_excluded(item, excludes):
+            continue
+
+        item_name = PurePath(name, item.name).as_posix()
+        if item.is_dir() and not item.is_symlink():
+            size += _collect_contents(item, excludes, item_name, contents)
+            continue
+
+        contents.append((item, item_name))
+        if item.is_file() and not item.is_symlink():
+            size += item.stat().st_size
+    return size
+
+
+def add_contents(tar: tarfile.TarFile, contents: Iterable[tuple[Path, str]]) -> None:
+    """Add the paths from collect_contents to a tar file.
+
+    Files removed since they were collected are skipped.
+    """
+    for path, name in contents:
+        try:
+            tar.add(path.as_posix(), arcname=name, recursive=False)
+        except FileNotFoundError:
+            LOGGER.debug("Skipping %s which has been removed", path)
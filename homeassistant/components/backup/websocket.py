@@ -6,9 +6,10 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .const import DOMAIN, LOGGER
-from .manager import BackupManager
+from .const import DOMAIN, LOGGER, SIGNAL_BACKUP_PROGRESS
+from .manager import BackupManager, BackupProgress
 
 
 @callback
@@ -22,6 +23,7 @@ def async_register_websocket_handlers(hass: HomeAssistant, with_hassio: bool) ->
     websocket_api.async_register_command(hass, handle_info)
     websocket_api.async_register_command(hass, handle_create)
     websocket_api.async_register_command(hass, handle_remove)
+    websocket_api.async_register_command(hass, handle_subscribe_progress)
 
 
 @websocket_api.require_admin
@@ -77,6 +79,29 @@ async def handle_create(
     connection.send_result(msg["id"], backup)
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "backup/subscribe_progress"})
+@callback
+def handle_subscribe_progress(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Subscribe to the progress of generating backups."""
+
+    @callback
+    def async_forward_progress(progress: BackupProgress) -> None:
+        """Forward the progress of a backup to the subscriber."""
+        connection.send_message(
+            websocket_api.event_message(msg["id"], progress.as_dict())
+        )
+
+    connection.subscriptions[msg["id"]] = async_dispatcher_connect(
+        hass, SIGNAL_BACKUP_PROGRESS, async_forward_progress
+    )
+    connection.send_result(msg["id"])
+
+
 @websocket_api.ws_require_user(only_supervisor=True)
 @websocket_api.websocket_command({vol.Required("type"): "backup/start"})
 @websocket_api.async_response
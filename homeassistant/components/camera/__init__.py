@@ -67,6 +67,7 @@ from homeassistant.helpers.template import Template
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 
+from .broker import CameraFrameBroker
 from .const import (  # noqa: F401
     _DEPRECATED_STREAM_TYPE_HLS,
     _DEPRECATED_STREAM_TYPE_WEB_RTC,
@@ -397,6 +398,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     websocket_api.async_register_command(hass, ws_camera_web_rtc_offer)
     websocket_api.async_register_command(hass, websocket_get_prefs)
     websocket_api.async_register_command(hass, websocket_update_prefs)
+    websocket_api.async_register_command(hass, websocket_frame_stats)
 
     await component.async_setup(config)
 
@@ -510,6 +512,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
         self._rtsp_to_webrtc = False
+        self.frame_broker = CameraFrameBroker()
 
     @cached_property
     def entity_picture(self) -> str:
@@ -659,9 +662,21 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     async def handle_async_still_stream(
         self, request: web.Request, interval: float
     ) -> web.StreamResponse:
-        """Generate an HTTP MJPEG stream from camera images."""
+        """Generate an HTTP MJPEG stream from camera images.
+
+        The viewers of the stream share the frames fetched within half of
+        the interval so the camera is not polled for every viewer.
+        """
         return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
+            request,
+            partial(
+                self.frame_broker.async_get_frame,
+                "still_stream",
+                self.async_camera_image,
+                interval / 2,
+            ),
+            self.content_type,
+            interval,
         )
 
     async def handle_async_mjpeg_stream(
@@ -830,11 +845,14 @@ class CameraImageView(CameraView):
         width = request.query.get("width")
         height = request.query.get("height")
         try:
-            image = await _async_get_image(
-                camera,
-                CAMERA_IMAGE_TIMEOUT,
-                int(width) if width else None,
-                int(height) if height else None,
+            width_px = int(width) if width else None
+            height_px = int(height) if height else None
+            # Concurrent requests for the same size share a single fetch
+            image = await camera.frame_broker.async_get_frame(
+                ("image", width_px, height_px),
+                partial(
+                    _async_get_image, camera, CAMERA_IMAGE_TIMEOUT, width_px, height_px
+                ),
             )
         except (HomeAssistantError, ValueError) as ex:
             raise web.HTTPInternalServerError from ex
@@ -947,6 +965,33 @@ async def ws_camera_web_rtc_offer(
         connection.send_result(msg["id"], {"answer": answer})
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "camera/frame_stats",
+        vol.Optional("entity_id"): cv.entity_id,
+    }
+)
+@callback
+def websocket_frame_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle request for the frame statistics of the cameras."""
+    component: EntityComponent[Camera] = hass.data[DOMAIN]
+    if (entity_id := msg.get("entity_id")) is not None:
+        if (camera := component.get_entity(entity_id)) is None:
+            connection.send_error(
+                msg["id"], websocket_api.ERR_NOT_FOUND, "Camera not found"
+            )
+            return
+        cameras: Iterable[Camera] = (camera,)
+    else:
+        cameras = component.entities
+    connection.send_result(
+        msg["id"],
+        {camera.entity_id: camera.frame_broker.stats.as_dict() for camera in cameras},
+    )
+
+
 @websocket_api.websocket_command(
     {vol.Required("type"): "camera/get_prefs", vol.Required("entity_id"): cv.entity_id}
 )
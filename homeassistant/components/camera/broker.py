@@ -0,0 +1,109 @@
+"""Share the frames of a camera between concurrent viewers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import asdict, dataclass
+import time
+from typing import Any
+
+from homeassistant.util.async_ import create_eager_task
+
+
+@dataclass(slots=True)
+class CameraFrameStats:
+    """Frame statistics of a camera."""
+
+    fetches: int = 0
+    """Frames fetched from the camera."""
+    shared: int = 0
+    """Requests that waited for a fetch already in progress."""
+    reused: int = 0
+    """Requests served a frame fetched within the freshness window."""
+    failures: int = 0
+    """Fetches that failed or returned no frame."""
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the statistics as a dict."""
+        return asdict(self)
+
+
+def _retrieve_exception(task: asyncio.Task[Any]) -> None:
+    """Retrieve the exception of a fetch all its viewers stopped waiting for.
+
+    The viewers that are still waiting get the exception from the shield.
+    """
+    if not task.cancelled():
+        task.exception()
+
+
+class CameraFrameBroker:
+    """Fetch a frame of a camera once for all the viewers waiting for it.
+
+    Viewers asking for the same kind of frame while a fetch is in progress
+    wait for that fetch instead of starting their own, and viewers asking
+    within the freshness window of the last fetch get the same frame.
+
+    Only the last frame is kept, viewers pull frames at their own pace so
+    a slow viewer skips frames instead of making frames queue up.
+    """
+
+    __slots__ = ("_frames", "_fetches", "stats")
+
+    def __init__(self) -> None:
+        """Initialize the broker."""
+        self._frames: dict[Hashable, tuple[float, Any]] = {}
+        self._fetches: dict[Hashable, asyncio.Task[Any]] = {}
+        self.stats = CameraFrameStats()
+
+    async def async_get_frame[_T](
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[_T]],
+        freshness: float = 0,
+    ) -> _T:
+        """Return a frame, fetching it if there is no usable frame.
+
+        The key identifies the kind of frame, for example its size.
+        The freshness is how old, since the start of its fetch, a frame
+        can be to be reused.
+        """
+        stats = self.stats
+        if freshness and (frame := self._frames.get(key)):
+            started, result = frame
+            if time.monotonic() - started < freshness:
+                stats.reused += 1
+                return result  # type: ignore[no-any-return]
+
+        if (task := self._fetches.get(key)) is not None:
+            stats.shared += 1
+        else:
+            stats.fetches += 1
+            task = create_eager_task(self._async_fetch(key, fetch, freshness))
+            task.add_done_callback(_retrieve_exception)
+            if not task.done():
+                self._fetches[key] = task
+        # Shield the fetch since the other viewers waiting for
+        # it must not be affected when this viewer goes away
+        return await asyncio.shield(task)  # type: ignore[no-any-return]
+
+    async def _async_fetch[_T](
+        self, key: Hashable, fetch: Callable[[], Awaitable[_T]], freshness: float
+    ) -> _T:
+        """Fetch a frame and keep it for the viewers within the freshness."""
+        started = time.monotonic()
+        try:
+            result = await fetch()
+        except BaseException:
+            self.stats.failures += 1
+            self._frames.pop(key, None)
+            raise
+        finally:
+            self._fetches.pop(key, None)
+        if result is None:
+            self.stats.failures += 1
+            self._frames.pop(key, None)
+        elif freshness:
+            self._frames[key] = (started, result)
+        return result
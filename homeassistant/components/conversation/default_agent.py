@@ -4,24 +4,43 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import Awaitable, Callable, Iterable
-from dataclasses import dataclass
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass, field, replace
 import functools
+import itertools
 import logging
 from pathlib import Path
 import re
 from typing import IO, Any
 
-from hassil.expression import Expression, ListReference, Sequence
-from hassil.intents import Intents, SlotList, TextSlotList, WildcardSlotList
+from hassil.expression import (
+    Expression,
+    ListReference,
+    RuleReference,
+    Sentence,
+    Sequence,
+    SequenceType,
+    TextChunk,
+)
+from hassil.intents import (
+    Intent,
+    IntentData,
+    Intents,
+    SlotList,
+    TextSlotList,
+    TextSlotValue,
+    WildcardSlotList,
+)
 from hassil.recognize import (
     MISSING_ENTITY,
+    PUNCTUATION_STR,
     RecognizeResult,
     UnmatchedTextEntity,
     recognize_all,
 )
-from hassil.util import merge_dict
+from hassil.util import merge_dict, normalize_text
 from home_assistant_intents import ErrorKey, get_intents, get_languages
+from lru import LRU
 import yaml
 
 from homeassistant import core
@@ -29,7 +48,7 @@ from homeassistant.components.homeassistant.exposed_entities import (
     async_listen_entity_updates,
     async_should_expose,
 )
-from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
+from homeassistant.const import ATTR_FRIENDLY_NAME, EVENT_STATE_CHANGED, MATCH_ALL
 from homeassistant.helpers import (
     area_registry as ar,
     device_registry as dr,
@@ -51,6 +70,10 @@ from .models import ConversationInput, ConversationResult
 _LOGGER = logging.getLogger(__name__)
 _DEFAULT_ERROR_TEXT = "Sorry, I couldn't understand that"
 _ENTITY_REGISTRY_UPDATE_FIELDS = ["aliases", "name", "original_name"]
+_STATE_SLOT_LIST_ATTRIBUTES = [ATTR_FRIENDLY_NAME, *DEFAULT_EXPOSED_ATTRIBUTES]
+
+# Text that hassil skips between the characters of a name when matching it
+_NAME_SEPARATORS = re.compile(rf"[\s\-_{re.escape(PUNCTUATION_STR)}]+")
 
 REGEX_TYPE = type(re.compile(""))
 TRIGGER_CALLBACK_TYPE = Callable[
@@ -59,6 +82,9 @@ TRIGGER_CALLBACK_TYPE = Callable[
 METADATA_CUSTOM_SENTENCE = "hass_custom_sentence"
 METADATA_CUSTOM_FILE = "hass_custom_file"
 
+# Number of recent sentences to keep the recognition result for
+RECOGNIZE_CACHE_SIZE = 128
+
 DATA_DEFAULT_ENTITY = "conversation_default_entity"
 
 
@@ -82,6 +108,7 @@ class LanguageIntents:
     intent_responses: dict[str, Any]
     error_responses: dict[str, Any]
     language_variant: str | None
+    intents_index: IntentsIndex
 
 
 @dataclass(slots=True)
@@ -101,6 +128,213 @@ class SentenceTriggerResult:
     matched_triggers: dict[int, RecognizeResult]
 
 
+def _name_key(name: str) -> str:
+    """Return the longest part of a name that has to be in a sentence."""
+    return max(_NAME_SEPARATORS.split(normalize_text(name)), key=len)
+
+
+@dataclass
+class NameSlotList(TextSlotList):
+    """Slot list of entity names indexed by the key of each name.
+
+    hassil tries every value of a slot list at each reference to it, which
+    gets slow with thousands of names. A name can only match a sentence
+    containing its key, the longest part of the name without whitespace or
+    punctuation, so only the names with a key found in the sentence are
+    given to hassil. Looking up every part of the sentence in the index
+    keeps this independent of the number of names.
+    """
+
+    index: dict[str, list[int]] = field(default_factory=dict)
+    """Positions of the values by key."""
+
+    max_key_length: int = 0
+
+    @classmethod
+    def from_keyed_values(
+        cls, keyed_values: Iterable[tuple[str, TextSlotValue]]
+    ) -> NameSlotList:
+        """Create a slot list from values and their keys."""
+        slot_list = cls(values=[])
+        index = slot_list.index
+        for position, (key, value) in enumerate(keyed_values):
+            slot_list.values.append(value)
+            index.setdefault(key, []).append(position)
+        slot_list.max_key_length = max(map(len, index), default=0)
+        return slot_list
+
+    def for_sentence(self, text: str) -> TextSlotList:
+        """Return a slot list with only the names that can match a sentence."""
+        positions = _find_keys(
+            self.index,
+            self.max_key_length,
+            _NAME_SEPARATORS.sub("", normalize_text(text)),
+        )
+        values = self.values
+        return TextSlotList(
+            values=[values[position] for position in sorted(set(positions))]
+        )
+
+
+def _find_keys(
+    index: Mapping[str, list[int]], max_key_length: int, text: str
+) -> Iterator[int]:
+    """Yield the positions of the keys found in a text and of the empty key."""
+    yield from index.get("", ())
+    for begin in range(len(text)):
+        for end in range(begin + 1, min(len(text), begin + max_key_length) + 1):
+            if (found := index.get(text[begin:end])) is not None:
+                yield from found
+
+
+def _clause_strength(clause: frozenset[str]) -> tuple[int, int]:
+    """Return how few sentences a set of literal text parts is likely in."""
+    return min(map(len, clause)), -len(clause)
+
+
+def _literal_clauses(
+    expression: Expression,
+    expansion_rules: Mapping[str, Sentence],
+    rules_seen: frozenset[str] = frozenset(),
+) -> list[frozenset[str]]:
+    """Return sets of literal text parts, a match contains a part of each set.
+
+    The parts are split on the text that hassil skips in a sentence, so
+    each part is found in the sentence once that text is removed from it.
+    """
+    if isinstance(expression, TextChunk):
+        return [
+            frozenset((run,)) for run in _NAME_SEPARATORS.split(expression.text) if run
+        ]
+
+    if isinstance(expression, Sequence):
+        item_clauses = [
+            _literal_clauses(item, expansion_rules, rules_seen)
+            for item in expression.items
+        ]
+        if expression.type == SequenceType.GROUP:
+            return list(dict.fromkeys(itertools.chain.from_iterable(item_clauses)))
+        if expression.type != SequenceType.ALTERNATIVE or not all(item_clauses):
+            # An alternative without literal text, like an optional one
+            return []
+        # The parts all the alternatives contain, and one of the parts
+        # that differ between them
+        common = set.intersection(*(set(clauses) for clauses in item_clauses))
+        clauses = list(common)
+        if not all(any(clause in common for clause in c) for c in item_clauses):
+            clauses.append(
+                frozenset().union(*(max(c, key=_clause_strength) for c in item_clauses))
+            )
+        return clauses
+
+    if (
+        isinstance(expression, RuleReference)
+        and expression.rule_name not in rules_seen
+        and (rule := expansion_rules.get(expression.rule_name)) is not None
+    ):
+        return _literal_clauses(
+            rule, expansion_rules, rules_seen | {expression.rule_name}
+        )
+
+    # Slot lists can match any text
+    return []
+
+
+def _remove_skip_words(text: str, intents: Intents) -> str:
+    """Remove the skip words of the intents from a sentence like hassil does."""
+    for skip_word in sorted(intents.skip_words, key=len, reverse=True):
+        skip_word = normalize_text(skip_word)
+        if intents.settings.ignore_whitespace:
+            text = text.replace(skip_word, "")
+        else:
+            text = re.sub(rf"\b{re.escape(skip_word)}\b", "", text)
+    return text
+
+
+@dataclass(slots=True)
+class _SentenceTemplate:
+    """A sentence template of an intent and the literal text it needs."""
+
+    intent: Intent
+    intent_data: IntentData
+    sentence: Sentence
+    clauses: list[frozenset[str]]
+    """Literal text parts, a matching sentence contains a part of each set."""
+
+
+class IntentsIndex:
+    """Index of the sentence templates of intents by their literal text.
+
+    hassil tries every sentence template of every intent on a sentence,
+    while most templates contain literal words the sentence does not. Each
+    template is indexed by the literal text a match of it has to contain,
+    like one of the words of "(close|shut)", so only the templates with a
+    key found in the sentence, and with the rest of their literal text in
+    it, are given to hassil.
+    """
+
+    __slots__ = ("intents", "_templates", "_index", "_max_key_length")
+
+    def __init__(self, intents: Intents) -> None:
+        """Index the sentence templates of the intents."""
+        self.intents = intents
+        self._templates: list[_SentenceTemplate] = []
+        self._index: dict[str, list[int]] = {}
+        for intent_obj in intents.intents.values():
+            for intent_data in intent_obj.data:
+                expansion_rules = {
+                    **intents.expansion_rules,
+                    **intent_data.expansion_rules,
+                }
+                for sentence in intent_data.sentences:
+                    clauses = _literal_clauses(sentence, expansion_rules)
+                    keys = frozenset(("",))
+                    if clauses:
+                        keys = max(clauses, key=_clause_strength)
+                        clauses.remove(keys)
+                    for key in keys:
+                        self._index.setdefault(key, []).append(len(self._templates))
+                    self._templates.append(
+                        _SentenceTemplate(intent_obj, intent_data, sentence, clauses)
+                    )
+        self._max_key_length = max(map(len, self._index), default=0)
+
+    def for_sentence(self, text: str) -> Intents:
+        """Return the intents with only the templates that can match a sentence."""
+        intents = self.intents
+        text = normalize_text(text).strip()
+        if intents.skip_words:
+            text = _remove_skip_words(text, intents)
+        text = _NAME_SEPARATORS.sub("", text)
+
+        templates = self._templates
+        sentences: dict[int, list[Sentence]] = {}
+        candidates: list[_SentenceTemplate] = []
+        for position in sorted(
+            set(_find_keys(self._index, self._max_key_length, text))
+        ):
+            template = templates[position]
+            if not all(
+                any(part in text for part in clause) for clause in template.clauses
+            ):
+                continue
+            if (data_sentences := sentences.get(id(template.intent_data))) is None:
+                data_sentences = sentences[id(template.intent_data)] = []
+                candidates.append(template)
+            data_sentences.append(template.sentence)
+
+        pruned: dict[str, Intent] = {}
+        for template in candidates:
+            intent_data = replace(template.intent_data)
+            # Set the sentences cached by hassil to the candidates only
+            intent_data.__dict__["sentences"] = sentences[id(template.intent_data)]
+            name = template.intent.name
+            if (intent_obj := pruned.get(name)) is None:
+                intent_obj = pruned[name] = Intent(name)
+            intent_obj.data.append(intent_data)
+        return replace(intents, intents=pruned)
+
+
 def _get_language_variations(language: str) -> Iterable[str]:
     """Generate language codes with and without region."""
     yield language
@@ -159,11 +393,18 @@ class DefaultAgent(ConversationEntity):
         # intent -> [sentences]
         self._config_intents: dict[str, Any] = config_intents
         self._slot_lists: dict[str, SlotList] | None = None
+        # entity_id -> (key, value) of the names and aliases of exposed entities
+        self._entity_names: dict[str, list[tuple[str, TextSlotValue]]] | None = None
+        # (language, sentence, intent context) -> (intents index, result)
+        self._recognize_cache: LRU[
+            tuple[Any, ...], tuple[IntentsIndex, RecognizeResult | None]
+        ] = LRU(RECOGNIZE_CACHE_SIZE)
 
         # Sentences that will trigger a callback (skipping intent recognition)
         self._trigger_sentences: list[TriggerData] = []
         self._trigger_intents: Intents | None = None
-        self._unsub_clear_slot_list: list[Callable[[], None]] | None = None
+        self._trigger_index: IntentsIndex | None = None
+        self._unsub_slot_list_updates: list[Callable[[], None]] | None = None
 
     @property
     def supported_languages(self) -> list[str]:
@@ -182,14 +423,24 @@ class DefaultAgent(ConversationEntity):
     @core.callback
     def _filter_state_changes(self, event_data: core.EventStateChangedData) -> bool:
         """Filter state changed events."""
-        return not event_data["old_state"] or not event_data["new_state"]
+        if not (old_state := event_data["old_state"]) or not (
+            new_state := event_data["new_state"]
+        ):
+            return True
+        old_attributes = old_state.attributes
+        new_attributes = new_state.attributes
+        return old_attributes is not new_attributes and any(
+            old_attributes.get(attr) != new_attributes.get(attr)
+            for attr in _STATE_SLOT_LIST_ATTRIBUTES
+        )
 
     @core.callback
-    def _listen_clear_slot_list(self) -> None:
-        """Listen for changes that can invalidate slot list."""
-        assert self._unsub_clear_slot_list is None
+    def _listen_slot_list_updates(self) -> None:
+        """Listen for changes that update the slot lists."""
+        if self._unsub_slot_list_updates is not None:
+            return
 
-        self._unsub_clear_slot_list = [
+        self._unsub_slot_list_updates = [
             self.hass.bus.async_listen(
                 ar.EVENT_AREA_REGISTRY_UPDATED,
                 self._async_clear_slot_list,
@@ -200,15 +451,17 @@ class DefaultAgent(ConversationEntity):
             ),
             self.hass.bus.async_listen(
                 er.EVENT_ENTITY_REGISTRY_UPDATED,
-                self._async_clear_slot_list,
+                self._async_update_entity_names,
                 event_filter=self._filter_entity_registry_changes,
             ),
             self.hass.bus.async_listen(
                 EVENT_STATE_CHANGED,
-                self._async_clear_slot_list,
+                self._async_update_entity_names,
                 event_filter=self._filter_state_changes,
             ),
-            async_listen_entity_updates(self.hass, DOMAIN, self._async_clear_slot_list),
+            async_listen_entity_updates(
+                self.hass, DOMAIN, self._async_clear_entity_names
+            ),
         ]
 
     async def async_recognize(
@@ -234,7 +487,19 @@ class DefaultAgent(ConversationEntity):
         slot_lists = self._make_slot_lists()
         intent_context = self._make_intent_context(user_input)
 
-        return await self.hass.async_add_executor_job(
+        # The cache is cleared when the slot lists change, and results
+        # for intents that have been reloaded since are not used.
+        cache_key = (
+            language,
+            normalize_text(user_input.text).strip(),
+            _intent_context_key(intent_context),
+        )
+        intents_index = lang_intents.intents_index
+        cached = self._recognize_cache.get(cache_key)
+        if cached is not None and cached[0] is intents_index:
+            return cached[1]
+
+        result = await self.hass.async_add_executor_job(
             self._recognize,
             user_input,
             lang_intents,
@@ -242,6 +507,9 @@ class DefaultAgent(ConversationEntity):
             intent_context,
             language,
         )
+        if self._slot_lists is slot_lists:
+            self._recognize_cache[cache_key] = (intents_index, result)
+        return result
 
     async def async_process(self, user_input: ConversationInput) -> ConversationResult:
         """Process a sentence."""
@@ -421,9 +689,12 @@ class DefaultAgent(ConversationEntity):
         name_result: RecognizeResult | None = None
         best_results: list[RecognizeResult] = []
         best_text_chunks_matched: int | None = None
+        if isinstance(names := slot_lists.get("name"), NameSlotList):
+            slot_lists = {**slot_lists, "name": names.for_sentence(user_input.text)}
+
         for result in recognize_all(
             user_input.text,
-            lang_intents.intents,
+            lang_intents.intents_index.for_sentence(user_input.text),
             slot_lists=slot_lists,
             intent_context=intent_context,
             language=language,
@@ -734,6 +1005,7 @@ class DefaultAgent(ConversationEntity):
         # But it will likely only be called once anyways, unless new
         # components with sentences are often being loaded.
         intents = Intents.from_dict(intents_dict)
+        intents_index = IntentsIndex(intents)
 
         # Load responses
         responses_dict = intents_dict.get("responses", {})
@@ -747,10 +1019,12 @@ class DefaultAgent(ConversationEntity):
                 intent_responses,
                 error_responses,
                 language_variant,
+                intents_index,
             )
             self._lang_intents[language] = lang_intents
         else:
             lang_intents.intents = intents
+            lang_intents.intents_index = intents_index
             lang_intents.intent_responses = intent_responses
             lang_intents.error_responses = error_responses
 
@@ -758,12 +1032,65 @@ class DefaultAgent(ConversationEntity):
 
     @core.callback
     def _async_clear_slot_list(self, event: core.Event[Any] | None = None) -> None:
-        """Clear slot lists when a registry has changed."""
+        """Clear slot lists when the areas or floors have changed."""
         self._slot_lists = None
-        assert self._unsub_clear_slot_list is not None
-        for unsub in self._unsub_clear_slot_list:
-            unsub()
-        self._unsub_clear_slot_list = None
+
+    @core.callback
+    def _async_clear_entity_names(self) -> None:
+        """Clear entity names when the exposed entities have changed."""
+        self._entity_names = None
+        self._slot_lists = None
+
+    @core.callback
+    def _async_update_entity_names(
+        self,
+        event: core.Event[er.EventEntityRegistryUpdatedData]
+        | core.Event[core.EventStateChangedData],
+    ) -> None:
+        """Update the names of an entity that was added, removed or renamed."""
+        if (entity_names := self._entity_names) is None:
+            return
+
+        entity_id = event.data["entity_id"]
+        if names := self._get_entity_names(entity_id):
+            entity_names[entity_id] = names
+        elif entity_names.pop(entity_id, None) is None:
+            return
+        self._slot_lists = None
+
+    @core.callback
+    def _get_entity_names(self, entity_id: str) -> list[tuple[str, TextSlotValue]]:
+        """Return the keys and slot values of the names of an exposed entity."""
+        if (state := self.hass.states.get(entity_id)) is None or (
+            not async_should_expose(self.hass, DOMAIN, entity_id)
+        ):
+            return []
+
+        # Checked against "requires_context" and "excludes_context" in hassil
+        context = {"domain": state.domain}
+        if state.attributes:
+            # Include some attributes
+            for attr in DEFAULT_EXPOSED_ATTRIBUTES:
+                if attr not in state.attributes:
+                    continue
+                context[attr] = state.attributes[attr]
+
+        names: list[str] = []
+        if (entity := er.async_get(self.hass).async_get(entity_id)) and (
+            entity.aliases
+        ):
+            names.extend(alias for alias in entity.aliases if alias.strip())
+
+        # Default name
+        names.append(state.name)
+
+        return [
+            (
+                _name_key(name),
+                TextSlotValue.from_tuple((name, name, context), allow_template=False),
+            )
+            for name in names
+        ]
 
     @core.callback
     def _make_slot_lists(self) -> dict[str, SlotList]:
@@ -771,48 +1098,27 @@ class DefaultAgent(ConversationEntity):
         if self._slot_lists is not None:
             return self._slot_lists
 
-        entity_registry = er.async_get(self.hass)
-        states = [
-            state
-            for state in self.hass.states.async_all()
-            if async_should_expose(self.hass, DOMAIN, state.entity_id)
-        ]
-
-        # Gather exposed entity names.
+        # Gather exposed entity names. They are kept between slot lists
+        # and updated for each entity as it changes.
         #
         # NOTE: We do not pass entity ids in here because multiple entities may
         # have the same name. The intent matcher doesn't gather all matching
         # values for a list, just the first. So we will need to match by name no
         # matter what.
-        entity_names = []
-        for state in states:
-            # Checked against "requires_context" and "excludes_context" in hassil
-            context = {"domain": state.domain}
-            if state.attributes:
-                # Include some attributes
-                for attr in DEFAULT_EXPOSED_ATTRIBUTES:
-                    if attr not in state.attributes:
-                        continue
-                    context[attr] = state.attributes[attr]
-
-            entity = entity_registry.async_get(state.entity_id)
-
-            if not entity:
-                # Default name
-                entity_names.append((state.name, state.name, context))
-                continue
-
-            if entity.aliases:
-                for alias in entity.aliases:
-                    if not alias.strip():
-                        continue
-
-                    entity_names.append((alias, alias, context))
+        if (entity_names := self._entity_names) is None:
+            entity_names = self._entity_names = {}
+            for state in self.hass.states.async_all():
+                if names := self._get_entity_names(state.entity_id):
+                    entity_names[state.entity_id] = names
 
-            # Default name
-            entity_names.append((state.name, state.name, context))
-
-        _LOGGER.debug("Exposed entities: %s", entity_names)
+            _LOGGER.debug(
+                "Exposed entities: %s",
+                [
+                    value.value_out
+                    for names in entity_names.values()
+                    for _, value in names
+                ],
+            )
 
         # Expose all areas.
         areas = ar.async_get(self.hass)
@@ -844,13 +1150,16 @@ class DefaultAgent(ConversationEntity):
 
                 floor_names.append((alias, floor.name))
 
+        self._recognize_cache.clear()
         self._slot_lists = {
             "area": TextSlotList.from_tuples(area_names, allow_template=False),
-            "name": TextSlotList.from_tuples(entity_names, allow_template=False),
+            "name": NameSlotList.from_keyed_values(
+                keyed_value for names in entity_names.values() for keyed_value in names
+            ),
             "floor": TextSlotList.from_tuples(floor_names, allow_template=False),
         }
 
-        self._listen_clear_slot_list()
+        self._listen_slot_list_updates()
         return self._slot_lists
 
     def _make_intent_context(
@@ -933,6 +1242,8 @@ class DefaultAgent(ConversationEntity):
         for wildcard_name in wildcard_names:
             self._trigger_intents.slot_lists[wildcard_name] = WildcardSlotList()
 
+        self._trigger_index = IntentsIndex(self._trigger_intents)
+
         _LOGGER.debug("Rebuilt trigger intents: %s", intents_dict)
 
     def _unregister_trigger(self, trigger_data: TriggerData) -> None:
@@ -956,11 +1267,13 @@ class DefaultAgent(ConversationEntity):
             # Need to rebuild intents before matching
             self._rebuild_trigger_intents()
 
-        assert self._trigger_intents is not None
+        assert self._trigger_index is not None
 
         matched_triggers: dict[int, RecognizeResult] = {}
         matched_template: str | None = None
-        for result in recognize_all(sentence, self._trigger_intents):
+        for result in recognize_all(
+            sentence, self._trigger_index.for_sentence(sentence)
+        ):
             if result.intent_sentence is not None:
                 matched_template = result.intent_sentence.text
 
@@ -1107,6 +1420,15 @@ def _get_match_error_response(
     return ErrorKey.NO_INTENT, {}
 
 
+def _intent_context_key(
+    intent_context: dict[str, Any] | None,
+) -> tuple[tuple[str, tuple[tuple[str, Any], ...]], ...] | None:
+    """Return a hashable key of an intent recognition context."""
+    if intent_context is None:
+        return None
+    return tuple((name, tuple(value.items())) for name, value in intent_context.items())
+
+
 def _collect_list_references(expression: Expression, list_names: set[str]) -> None:
     """Collect list reference names recursively."""
     if isinstance(expression, Sequence):
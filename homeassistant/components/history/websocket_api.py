@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 import logging
@@ -73,25 +74,47 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
-) -> bytes:
+    columnar: bool = False,
+    partial_results: bool = False,
+) -> bytes | Iterator[bytes]:
     """Fetch history significant_states and convert them to json in the executor."""
-    return json_bytes(
-        messages.result_message(
+    result: dict[str, Any]
+    if columnar:
+        result = history.get_significant_states_columnar(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+    else:
+        result = history.get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        )
+    if partial_results:
+        # The entities are serialized here and dropped from the result
+        # once serialized, so only joining the fragments into messages
+        # is left for the event loop. The fragments are released as the
+        # messages are sent.
+        fragments = deque(messages.dict_of_lists_fragments(result))
+        return messages.partial_result_messages(
             msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
+            (fragments.popleft() for _ in range(len(fragments))),
+            is_object=True,
         )
-    )
+    return json_bytes(messages.result_message(msg_id, result))
 
 
 @websocket_api.websocket_command(
@@ -104,6 +127,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("columnar", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -168,6 +192,8 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg["columnar"],
+            connection.can_send_partial_results,
         )
     )
 
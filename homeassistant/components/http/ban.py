@@ -7,7 +7,14 @@ from collections.abc import Awaitable, Callable, Coroutine
 from contextlib import suppress
 from datetime import datetime
 from http import HTTPStatus
-from ipaddress import IPv4Address, IPv6Address, ip_address
+from ipaddress import (
+    IPv4Address,
+    IPv4Network,
+    IPv6Address,
+    IPv6Network,
+    ip_address,
+    ip_network,
+)
 import logging
 from socket import gethostbyaddr, herror
 from typing import Any, Concatenate, Final
@@ -28,6 +35,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.util import dt as dt_util, yaml
+from homeassistant.util.network import IPNetworkSet
 
 from .const import KEY_HASS
 from .view import HomeAssistantView
@@ -75,10 +83,10 @@ async def ban_middleware(
         _LOGGER.error("IP Ban middleware loaded but banned IPs not loaded")
         return await handler(request)
 
-    if ip_bans_lookup := ban_manager.ip_bans_lookup:
+    if ip_bans := ban_manager.ip_bans:
         # Verify if IP is not banned
         ip_address_ = ip_address(request.remote)  # type: ignore[arg-type]
-        if ip_address_ in ip_bans_lookup:
+        if ip_address_ in ip_bans:
             raise HTTPForbidden
 
     try:
@@ -195,15 +203,21 @@ def process_success_login(request: Request) -> None:
 
 
 class IpBan:
-    """Represents banned IP address."""
+    """Represents banned IP address or network."""
 
     def __init__(
         self,
-        ip_ban: str | IPv4Address | IPv6Address,
+        ip_ban: str | IPv4Address | IPv6Address | IPv4Network | IPv6Network,
         banned_at: datetime | None = None,
     ) -> None:
         """Initialize IP Ban object."""
-        self.ip_address = ip_address(ip_ban)
+        self.ip_address: IPv4Address | IPv6Address | IPv4Network | IPv6Network
+        if isinstance(ip_ban, str) and "/" in ip_ban:
+            self.ip_address = ip_network(ip_ban)
+        elif isinstance(ip_ban, (IPv4Network, IPv6Network)):
+            self.ip_address = ip_ban
+        else:
+            self.ip_address = ip_address(ip_ban)
         self.banned_at = banned_at or dt_util.utcnow()
 
 
@@ -214,7 +228,10 @@ class IpBanManager:
         """Init the ban manager."""
         self.hass = hass
         self.path = hass.config.path(IP_BANS_FILE)
-        self.ip_bans_lookup: dict[IPv4Address | IPv6Address, IpBan] = {}
+        self.ip_bans_lookup: dict[
+            IPv4Address | IPv6Address | IPv4Network | IPv6Network, IpBan
+        ] = {}
+        self.ip_bans = IPNetworkSet()
 
     async def async_load(self) -> None:
         """Load the existing IP bans."""
@@ -228,17 +245,20 @@ class IpBanManager:
             _LOGGER.error("Unable to load %s: %s", self.path, str(err))
             return
 
-        ip_bans_lookup: dict[IPv4Address | IPv6Address, IpBan] = {}
+        ip_bans_lookup: dict[
+            IPv4Address | IPv6Address | IPv4Network | IPv6Network, IpBan
+        ] = {}
         for ip_ban, ip_info in list_.items():
             try:
                 ip_info = SCHEMA_IP_BAN_ENTRY(ip_info)
                 ban = IpBan(ip_ban, ip_info["banned_at"])
                 ip_bans_lookup[ban.ip_address] = ban
-            except vol.Invalid as err:
+            except (vol.Invalid, ValueError) as err:
                 _LOGGER.error("Failed to load IP ban %s: %s", ip_info, err)
                 continue
 
         self.ip_bans_lookup = ip_bans_lookup
+        self.ip_bans = IPNetworkSet(ip_bans_lookup)
 
     def _add_ban(self, ip_ban: IpBan) -> None:
         """Update config file with new banned IP address."""
@@ -251,6 +271,7 @@ class IpBanManager:
 
     async def async_add_ban(self, remote_addr: IPv4Address | IPv6Address) -> None:
         """Add a new IP address to the banned list."""
-        if remote_addr not in self.ip_bans_lookup:
+        if remote_addr not in self.ip_bans:
             new_ban = self.ip_bans_lookup[remote_addr] = IpBan(remote_addr)
+            self.ip_bans.add(remote_addr)
             await self.hass.async_add_executor_job(self._add_ban, new_ban)
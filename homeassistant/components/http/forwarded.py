@@ -11,6 +11,7 @@ from aiohttp.web import Application, HTTPBadRequest, Request, StreamResponse, mi
 from hass_nabucasa import remote
 
 from homeassistant.core import callback
+from homeassistant.util.network import IPNetworkSet
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -66,6 +67,7 @@ def async_setup_forwarded(
       - If an empty X-Forwarded-Proto is provided, or an empty element in the list,
         an HTTP 400 status code is thrown.
     """
+    trusted_proxies_set = IPNetworkSet(trusted_proxies)
 
     @middleware
     async def forwarded_middleware(
@@ -104,7 +106,7 @@ def async_setup_forwarded(
             raise HTTPBadRequest
 
         # Ensure the IP of the connected peer is trusted
-        if not any(connected_ip in trusted_proxy for trusted_proxy in trusted_proxies):
+        if connected_ip not in trusted_proxies_set:
             _LOGGER.error(
                 "Received X-Forwarded-For header from an untrusted proxy %s",
                 connected_ip,
@@ -133,7 +135,7 @@ def async_setup_forwarded(
         # Find the last trusted index in the X-Forwarded-For list
         forwarded_for_index = 0
         for forwarded_ip in forwarded_for:
-            if any(forwarded_ip in trusted_proxy for trusted_proxy in trusted_proxies):
+            if forwarded_ip in trusted_proxies_set:
                 forwarded_for_index += 1
                 continue
             overrides["remote"] = str(forwarded_ip)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
@@ -20,8 +21,10 @@ from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
+from homeassistant.util.event_type import EventType
+from homeassistant.util.hass_dict import HassKey
 
-from .const import DOMAIN
+from .const import DOMAIN, LOGBOOK_ENTRY_WHEN
 from .helpers import (
     async_determine_event_types,
     async_filter_entities,
@@ -36,24 +39,240 @@ EVENT_COALESCE_TIME = 0.35
 BIG_QUERY_HOURS = 25
 # how many hours to deliver in the first chunk when we split the query
 BIG_QUERY_RECENT_HOURS = 24
+# how many of the most recent live rows are kept for new subscribers
+LIVE_RECENT_ROWS_MAX = 2048
+# how long the most recent live rows are kept for new subscribers
+LIVE_RECENT_ROWS_MAX_AGE = timedelta(minutes=30)
 
 _LOGGER = logging.getLogger(__name__)
 
+type LivePipelineKey = tuple[
+    tuple[str, ...] | None, tuple[str, ...] | None, tuple[EventType[Any] | str, ...]
+]
+
+DATA_LIVE_PIPELINES: HassKey[dict[LivePipelineKey, LogbookLivePipeline]] = HassKey(
+    f"{DOMAIN}_live_pipelines"
+)
+
 
 @dataclass(slots=True)
 class LogbookLiveStream:
     """Track a logbook live stream."""
 
-    stream_queue: asyncio.Queue[Event]
+    stream_queue: asyncio.Queue[dict[str, Any]]
     subscriptions: list[CALLBACK_TYPE]
     end_time_unsub: CALLBACK_TYPE | None = None
     task: asyncio.Task | None = None
     wait_sync_task: asyncio.Task | None = None
 
 
+class LogbookLivePipeline:
+    """Humanify the live events of a filter set once for all its live streams.
+
+    Every live stream with the same entity and device ids and event
+    types gets the same rows, so the events are humanified once and the
+    rows are handed to all the streams. The event types are part of the
+    key since they depend on the config entries of the entities and
+    devices when the stream starts.
+
+    The most recent rows are kept so a new live stream starting within
+    them is answered without querying the database.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: LivePipelineKey,
+        entity_ids: list[str] | None,
+        device_ids: list[str] | None,
+        event_types: tuple[EventType[Any] | str, ...],
+    ) -> None:
+        """Initialize the pipeline."""
+        self.hass = hass
+        self.key = key
+        self.entity_ids = entity_ids
+        self.device_ids = device_ids
+        self.event_types = event_types
+        self.event_processor = EventProcessor(
+            hass,
+            self.event_types,
+            entity_ids,
+            device_ids,
+            None,
+            timestamp=True,
+            include_entity_name=False,
+        )
+        self.event_processor.switch_to_live()
+        self.recent_rows: deque[dict[str, Any]] = deque()
+        # The recent rows include every row from this timestamp
+        self.recent_rows_since = 0.0
+        self._queue: asyncio.Queue[Event] = asyncio.Queue(MAX_PENDING_LOGBOOK_EVENTS)
+        self._subscriptions: list[CALLBACK_TYPE] = []
+        self._targets: dict[
+            Callable[[list[dict[str, Any]]], None], Callable[[], None]
+        ] = {}
+        self._task: asyncio.Task | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start humanifying the events."""
+        entities_filter: Callable[[str], bool] | None = None
+        if not self.event_processor.limited_select:
+            logbook_config: LogbookConfig = self.hass.data[DOMAIN]
+            entities_filter = logbook_config.entity_filter
+
+        async_subscribe_events(
+            self.hass,
+            self._subscriptions,
+            self._async_queue_or_stop,
+            self.event_types,
+            entities_filter,
+            self.entity_ids,
+            self.device_ids,
+        )
+        self.recent_rows_since = dt_util.utcnow().timestamp()
+        self._task = create_eager_task(self._async_process_events())
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop humanifying the events and cancel the live streams."""
+        for subscription in self._subscriptions:
+            subscription()
+        self._subscriptions.clear()
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        pipelines = self.hass.data[DATA_LIVE_PIPELINES]
+        if pipelines.get(self.key) is self:
+            del pipelines[self.key]
+        targets = self._targets
+        self._targets = {}
+        for cancel in targets.values():
+            cancel()
+
+    @callback
+    def async_add_target(
+        self,
+        target: Callable[[list[dict[str, Any]]], None],
+        cancel: Callable[[], None],
+    ) -> CALLBACK_TYPE:
+        """Add a target for the rows of the live events.
+
+        The cancel callback is called if the pipeline stops
+        because it can't keep up with the events.
+        """
+        self._targets[target] = cancel
+
+        @callback
+        def _remove_target() -> None:
+            """Remove the target and stop the pipeline if it was the last."""
+            if self._targets.pop(target, None) is not None and not self._targets:
+                self.async_stop()
+
+        return _remove_target
+
+    @callback
+    def async_get_recent_rows(
+        self, start_timestamp: float
+    ) -> list[dict[str, Any]] | None:
+        """Return the recent rows from a timestamp.
+
+        Returns None if rows from that timestamp are no longer kept.
+        """
+        self._async_trim_recent_rows()
+        if start_timestamp < self.recent_rows_since:
+            return None
+        return [
+            row
+            for row in self.recent_rows
+            if row[LOGBOOK_ENTRY_WHEN] >= start_timestamp
+        ]
+
+    @callback
+    def _async_trim_recent_rows(self) -> None:
+        """Remove the rows that are too old or too many."""
+        recent_rows = self.recent_rows
+        min_timestamp = (dt_util.utcnow() - LIVE_RECENT_ROWS_MAX_AGE).timestamp()
+        while recent_rows and (
+            len(recent_rows) > LIVE_RECENT_ROWS_MAX
+            or recent_rows[0][LOGBOOK_ENTRY_WHEN] < min_timestamp
+        ):
+            row = recent_rows.popleft()
+            # Rows fired at the same time as the removed row may
+            # remain, but they are no longer complete
+            self.recent_rows_since = max(
+                self.recent_rows_since, row[LOGBOOK_ENTRY_WHEN] + 0.000001
+            )
+        self.recent_rows_since = max(self.recent_rows_since, min_timestamp)
+
+    @callback
+    def _async_queue_or_stop(self, event: Event) -> None:
+        """Queue an event to be processed or stop."""
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            _LOGGER.debug(
+                "Live logbook exceeded max pending events of %s",
+                MAX_PENDING_LOGBOOK_EVENTS,
+            )
+            self.async_stop()
+
+    async def _async_process_events(self) -> None:
+        """Humanify the events from the queue and hand the rows to the targets."""
+        queue = self._queue
+        while True:
+            events: list[Event] = [await queue.get()]
+            # We sleep for the EVENT_COALESCE_TIME so
+            # we can group events together to minimize
+            # the number of websocket messages when the
+            # system is overloaded with an event storm
+            await asyncio.sleep(EVENT_COALESCE_TIME)
+            while not queue.empty():
+                events.append(queue.get_nowait())
+
+            if not (
+                rows := self.event_processor.humanify(
+                    async_event_to_row(e) for e in events
+                )
+            ):
+                continue
+            self.recent_rows.extend(rows)
+            self._async_trim_recent_rows()
+            for target in list(self._targets):
+                target(rows)
+
+
+@callback
+def _async_get_live_pipeline(
+    hass: HomeAssistant, entity_ids: list[str] | None, device_ids: list[str] | None
+) -> tuple[LogbookLivePipeline, bool]:
+    """Get the live pipeline for the entity and device ids.
+
+    The event types are determined again for every stream since
+    they change when config entries are added or removed.
+
+    Returns the pipeline and if it was already running.
+    """
+    event_types = async_determine_event_types(hass, entity_ids, device_ids)
+    key: LivePipelineKey = (
+        tuple(sorted(entity_ids)) if entity_ids else None,
+        tuple(sorted(device_ids)) if device_ids else None,
+        tuple(sorted(event_types)),
+    )
+    pipelines = hass.data[DATA_LIVE_PIPELINES]
+    if (pipeline := pipelines.get(key)) is not None:
+        return pipeline, True
+    pipeline = pipelines[key] = LogbookLivePipeline(
+        hass, key, entity_ids, device_ids, event_types
+    )
+    pipeline.async_start()
+    return pipeline, False
+
+
 @callback
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the logbook websocket API."""
+    hass.data[DATA_LIVE_PIPELINES] = {}
     websocket_api.async_register_command(hass, ws_get_events)
     websocket_api.async_register_command(hass, ws_event_stream)
 
@@ -218,30 +437,26 @@ async def _async_events_consumer(
     subscriptions_setup_complete_time: dt,
     connection: ActiveConnection,
     msg_id: int,
-    stream_queue: asyncio.Queue[Event],
-    event_processor: EventProcessor,
+    stream_queue: asyncio.Queue[dict[str, Any]],
 ) -> None:
-    """Stream events from the queue."""
+    """Stream rows from the queue."""
     subscriptions_setup_complete_timestamp = (
         subscriptions_setup_complete_time.timestamp()
     )
     while True:
-        events: list[Event] = [await stream_queue.get()]
-        # If the event is older than the last db
-        # event we already sent it so we skip it.
-        if events[0].time_fired_timestamp <= subscriptions_setup_complete_timestamp:
-            continue
-        # We sleep for the EVENT_COALESCE_TIME so
-        # we can group events together to minimize
-        # the number of websocket messages when the
-        # system is overloaded with an event storm
-        await asyncio.sleep(EVENT_COALESCE_TIME)
+        # The pipeline coalesces the events and queues the
+        # rows of a batch at once so they are sent together
+        rows: list[dict[str, Any]] = [await stream_queue.get()]
         while not stream_queue.empty():
-            events.append(stream_queue.get_nowait())
+            rows.append(stream_queue.get_nowait())
 
-        if logbook_events := event_processor.humanify(
-            async_event_to_row(e) for e in events
-        ):
+        # If the row is older than the last db
+        # event we already sent it so we skip it.
+        if logbook_events := [
+            row
+            for row in rows
+            if row[LOGBOOK_ENTRY_WHEN] > subscriptions_setup_complete_timestamp
+        ]:
             connection.send_message(
                 json_bytes(
                     messages.event_message(
@@ -296,18 +511,17 @@ async def ws_event_stream(
             _async_send_empty_response(connection, msg_id, start_time, end_time)
             return
 
-    event_types = async_determine_event_types(hass, entity_ids, device_ids)
-    event_processor = EventProcessor(
-        hass,
-        event_types,
-        entity_ids,
-        device_ids,
-        None,
-        timestamp=True,
-        include_entity_name=False,
-    )
-
     if end_time and end_time <= utc_now:
+        event_types = async_determine_event_types(hass, entity_ids, device_ids)
+        event_processor = EventProcessor(
+            hass,
+            event_types,
+            entity_ids,
+            device_ids,
+            None,
+            timestamp=True,
+            include_entity_name=False,
+        )
         # Not live stream but we it might be a big query
         connection.subscriptions[msg_id] = callback(lambda: None)
         connection.send_result(msg_id)
@@ -325,7 +539,9 @@ async def ws_event_stream(
         return
 
     subscriptions: list[CALLBACK_TYPE] = []
-    stream_queue: asyncio.Queue[Event] = asyncio.Queue(MAX_PENDING_LOGBOOK_EVENTS)
+    stream_queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(
+        MAX_PENDING_LOGBOOK_EVENTS
+    )
     live_stream = LogbookLiveStream(
         subscriptions=subscriptions, stream_queue=stream_queue
     )
@@ -350,10 +566,11 @@ async def ws_event_stream(
         )
 
     @callback
-    def _queue_or_cancel(event: Event) -> None:
-        """Queue an event to be processed or cancel."""
+    def _queue_or_cancel(rows: list[dict[str, Any]]) -> None:
+        """Queue rows to be sent or cancel."""
         try:
-            stream_queue.put_nowait(event)
+            for row in rows:
+                stream_queue.put_nowait(row)
         except asyncio.QueueFull:
             _LOGGER.debug(
                 "Client exceeded max pending messages of %s",
@@ -361,22 +578,42 @@ async def ws_event_stream(
             )
             _unsub()
 
-    entities_filter: Callable[[str], bool] | None = None
-    if not event_processor.limited_select:
-        logbook_config: LogbookConfig = hass.data[DOMAIN]
-        entities_filter = logbook_config.entity_filter
+    pipeline, pipeline_running = _async_get_live_pipeline(hass, entity_ids, device_ids)
+    subscriptions.append(pipeline.async_add_target(_queue_or_cancel, _unsub))
+    connection.subscriptions[msg_id] = _unsub
+
+    if (
+        pipeline_running
+        and (recent_rows := pipeline.async_get_recent_rows(start_time.timestamp()))
+        is not None
+    ):
+        # Another live stream with the same filters already has every
+        # row since the start time so there is no need to query the
+        # database or to wait for the recorder to catch up
+        connection.send_result(msg_id)
+        connection.send_message(
+            json_bytes(
+                messages.event_message(
+                    msg_id,
+                    _generate_stream_message(recent_rows, start_time, utc_now),
+                )
+            )
+        )
+        live_stream.task = create_eager_task(
+            _async_events_consumer(start_time, connection, msg_id, stream_queue)
+        )
+        return
 
-    async_subscribe_events(
+    event_processor = EventProcessor(
         hass,
-        subscriptions,
-        _queue_or_cancel,
-        event_types,
-        entities_filter,
+        pipeline.event_types,
         entity_ids,
         device_ids,
+        None,
+        timestamp=True,
+        include_entity_name=False,
     )
     subscriptions_setup_complete_time = dt_util.utcnow()
-    connection.subscriptions[msg_id] = _unsub
     connection.send_result(msg_id)
     # Fetch everything from history
     last_event_time = await _async_send_historical_events(
@@ -405,7 +642,6 @@ async def ws_event_stream(
             connection,
             msg_id,
             stream_queue,
-            event_processor,
         )
     )
 
@@ -435,7 +671,6 @@ async def ws_event_stream(
         event_processor,
         partial=False,
     )
-    event_processor.switch_to_live()
 
 
 def _ws_formatted_get_events(
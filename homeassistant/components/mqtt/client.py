@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
+from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable, Iterator
 import contextlib
 from dataclasses import dataclass
 from functools import lru_cache, partial
@@ -100,6 +100,10 @@ UNSUBSCRIBE_COOLDOWN = 0.1
 TIMEOUT_ACK = 10
 RECONNECT_INTERVAL_SECONDS = 10
 
+# Maximum number of topics to remember the matching subscriptions for.
+# Topics often contain unique ids, so the cache must be bounded.
+MATCHING_SUBSCRIPTIONS_CACHE_SIZE = 8192
+
 type SocketType = socket.socket | ssl.SSLSocket | mqtt.WebsocketWrapper | Any
 
 type SubscribePayloadType = str | bytes  # Only bytes if encoding is None
@@ -239,7 +243,6 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str
-    matcher: Any
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
@@ -313,6 +316,108 @@ def _is_simple_match(topic: str) -> bool:
     return not ("+" in topic or "#" in topic)
 
 
+class _SubscriptionTrieNode:
+    """A topic level in the wildcard subscription trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _SubscriptionTrieNode] = {}
+        self.subscriptions: list[Subscription] = []
+
+
+class SubscriptionTrie:
+    """Index of wildcard subscriptions keyed on topic levels.
+
+    Finding the subscriptions matching a topic costs O(topic levels)
+    instead of testing every wildcard subscription one by one.
+    """
+
+    __slots__ = ("_root", "_count")
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _SubscriptionTrieNode()
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of subscriptions in the trie."""
+        return self._count
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate over all subscriptions in the trie."""
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            yield from node.subscriptions
+            nodes.extend(node.children.values())
+
+    def __contains__(self, topic: str) -> bool:
+        """Return if there is a subscription for the topic filter."""
+        node = self._root
+        for level in topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription to the trie."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _SubscriptionTrieNode()
+            node = child
+        node.subscriptions.append(subscription)
+        self._count += 1
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription from the trie.
+
+        Raises ValueError if the subscription is not in the trie.
+        """
+        path: list[tuple[_SubscriptionTrieNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                raise ValueError(f"Subscription {subscription.topic} not tracked")
+            path.append((node, level))
+            node = child
+        node.subscriptions.remove(subscription)
+        self._count -= 1
+        # Prune the levels that no longer lead to any subscription
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.children or child.subscriptions:
+                break
+            del parent.children[level]
+
+    def matches(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions with a topic filter matching the topic."""
+        matches: list[Subscription] = []
+        levels = topic.split("/")
+        depth = len(levels)
+        # Wildcards on the first level must not match topics starting
+        # with "$" [MQTT-4.7.2-1]
+        first_level_wildcards = not topic.startswith("$")
+        nodes = [(self._root, 0)]
+        while nodes:
+            node, index = nodes.pop()
+            children = node.children
+            if index or first_level_wildcards:
+                # "#" also matches the parent level, "sport/#" matches "sport"
+                if (multi_level := children.get("#")) is not None:
+                    matches.extend(multi_level.subscriptions)
+                if index < depth and (single_level := children.get("+")) is not None:
+                    nodes.append((single_level, index + 1))
+            if index == depth:
+                matches.extend(node.subscriptions)
+            elif (child := children.get(levels[index])) is not None:
+                nodes.append((child, index + 1))
+        return matches
+
+
 class EnsureJobAfterCooldown:
     """Ensure a cool down period before executing a job.
 
@@ -427,7 +532,7 @@ class MQTT:
         self.conf = conf
 
         self._simple_subscriptions: dict[str, list[Subscription]] = {}
-        self._wildcard_subscriptions: list[Subscription] = []
+        self._wildcard_subscriptions = SubscriptionTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -662,8 +767,8 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return (
+            topic in self._simple_subscriptions or topic in self._wildcard_subscriptions
         )
 
     async def async_publish(
@@ -789,7 +894,7 @@ class MQTT:
                 subscription
             )
         else:
-            self._wildcard_subscriptions.append(subscription)
+            self._wildcard_subscriptions.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -842,9 +947,7 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -1036,16 +1139,13 @@ class MQTT:
             queue_only=True,
         )
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
+    @lru_cache(MATCHING_SUBSCRIPTIONS_CACHE_SIZE)
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            if subscription.matcher(topic)
-        )
+        if self._wildcard_subscriptions:
+            subscriptions.extend(self._wildcard_subscriptions.matches(topic))
         return subscriptions
 
     @callback
@@ -1230,13 +1330,3 @@ def _raise_on_error(result_code: int) -> None:
 
     if result_code and (message := mqtt.error_string(result_code)):
         raise HomeAssistantError(f"Error talking to MQTT: {message}")
-
-
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
@@ -8,9 +8,12 @@ import logging
 import string
 from typing import Any, cast
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import prometheus_client
-from prometheus_client.metrics import MetricWrapperBase
+from prometheus_client.exposition import choose_encoder, gzip_accepted
+from prometheus_client.openmetrics.exposition import (
+    CONTENT_TYPE_LATEST as CONTENT_TYPE_OPENMETRICS,
+)
 import voluptuous as vol
 
 from homeassistant import core as hacore
@@ -61,6 +64,8 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.dt import as_timestamp
 from homeassistant.util.unit_conversion import TemperatureConverter
 
+from .exposition import Counter, Gauge, MetricFamily, MetricsExposition
+
 _LOGGER = logging.getLogger(__name__)
 
 API_ENDPOINT = "/api/prometheus"
@@ -107,7 +112,10 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH]))
+    exposition = MetricsExposition()
+    hass.http.register_view(
+        PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH], exposition)
+    )
 
     conf: dict[str, Any] = config[DOMAIN]
     entity_filter: entityfilter.EntityFilter = conf[CONF_FILTER]
@@ -122,6 +130,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     )
 
     metrics = PrometheusMetrics(
+        exposition,
         entity_filter,
         namespace,
         climate_units,
@@ -148,6 +157,7 @@ class PrometheusMetrics:
 
     def __init__(
         self,
+        exposition: MetricsExposition,
         entity_filter: entityfilter.EntityFilter,
         namespace: str,
         climate_units: UnitOfTemperature,
@@ -156,6 +166,7 @@ class PrometheusMetrics:
         default_metric: str | None,
     ) -> None:
         """Initialize Prometheus Metrics."""
+        self._exposition = exposition
         self._component_config = component_config
         self._override_metric = override_metric
         self._default_metric = default_metric
@@ -175,7 +186,7 @@ class PrometheusMetrics:
             self.metrics_prefix = f"{namespace}_"
         else:
             self.metrics_prefix = ""
-        self._metrics: dict[str, MetricWrapperBase] = {}
+        self._metrics: dict[str, MetricFamily] = {}
         self._climate_units = climate_units
 
     def handle_state_changed_event(self, event: Event[EventStateChangedData]) -> None:
@@ -209,20 +220,20 @@ class PrometheusMetrics:
 
         labels = self._labels(state)
         state_change = self._metric(
-            "state_change", prometheus_client.Counter, "The number of state changes"
+            "state_change", Counter, "The number of state changes"
         )
         state_change.labels(**labels).inc()
 
         entity_available = self._metric(
             "entity_available",
-            prometheus_client.Gauge,
+            Gauge,
             "Entity is available (not in the unavailable or unknown state)",
         )
         entity_available.labels(**labels).set(float(state.state not in ignored_states))
 
         last_updated_time_seconds = self._metric(
             "last_updated_time_seconds",
-            prometheus_client.Gauge,
+            Gauge,
             "The last_updated timestamp",
         )
         last_updated_time_seconds.labels(**labels).set(state.last_updated.timestamp())
@@ -257,25 +268,24 @@ class PrometheusMetrics:
     ) -> None:
         """Remove labelsets matching the given entity id from all metrics."""
         for metric in list(self._metrics.values()):
-            for sample in cast(list[prometheus_client.Metric], metric.collect())[
-                0
-            ].samples:
-                if sample.labels["entity"] == entity_id and (
-                    not friendly_name or sample.labels["friendly_name"] == friendly_name
+            for labelvalues in list(metric.series):
+                labels = dict(zip(metric.labelnames, labelvalues, strict=True))
+                if labels["entity"] == entity_id and (
+                    not friendly_name or labels["friendly_name"] == friendly_name
                 ):
                     _LOGGER.debug(
                         "Removing labelset from %s for entity_id: %s",
-                        sample.name,
+                        metric.name,
                         entity_id,
                     )
                     with suppress(KeyError):
-                        metric.remove(*sample.labels.values())
+                        metric.remove(*labelvalues)
 
     def _handle_attributes(self, state: State) -> None:
         for key, value in state.attributes.items():
             metric = self._metric(
                 f"{state.domain}_attr_{key.lower()}",
-                prometheus_client.Gauge,
+                Gauge,
                 f"{key} attribute of {state.domain} entity",
             )
 
@@ -285,19 +295,19 @@ class PrometheusMetrics:
             except (ValueError, TypeError):
                 pass
 
-    def _metric[_MetricBaseT: MetricWrapperBase](
+    def _metric[_MetricFamilyT: MetricFamily](
         self,
         metric: str,
-        factory: type[_MetricBaseT],
+        factory: type[_MetricFamilyT],
         documentation: str,
         extra_labels: list[str] | None = None,
-    ) -> _MetricBaseT:
+    ) -> _MetricFamilyT:
         labels = ["entity", "friendly_name", "domain"]
         if extra_labels is not None:
             labels.extend(extra_labels)
 
         try:
-            return cast(_MetricBaseT, self._metrics[metric])
+            return cast(_MetricFamilyT, self._metrics[metric])
         except KeyError:
             full_metric_name = self._sanitize_metric_name(
                 f"{self.metrics_prefix}{metric}"
@@ -306,9 +316,9 @@ class PrometheusMetrics:
                 full_metric_name,
                 documentation,
                 labels,
-                registry=prometheus_client.REGISTRY,
+                registry=self._exposition,
             )
-            return cast(_MetricBaseT, self._metrics[metric])
+            return cast(_MetricFamilyT, self._metrics[metric])
 
     @staticmethod
     def _sanitize_metric_name(metric: str) -> str:
@@ -349,7 +359,7 @@ class PrometheusMetrics:
         if (battery_level := state.attributes.get(ATTR_BATTERY_LEVEL)) is not None:
             metric = self._metric(
                 "battery_level_percent",
-                prometheus_client.Gauge,
+                Gauge,
                 "Battery level as a percentage of its capacity",
             )
             try:
@@ -361,7 +371,7 @@ class PrometheusMetrics:
     def _handle_binary_sensor(self, state: State) -> None:
         metric = self._metric(
             "binary_sensor_state",
-            prometheus_client.Gauge,
+            Gauge,
             "State of the binary sensor (0/1)",
         )
         value = self.state_as_number(state)
@@ -370,7 +380,7 @@ class PrometheusMetrics:
     def _handle_input_boolean(self, state: State) -> None:
         metric = self._metric(
             "input_boolean_state",
-            prometheus_client.Gauge,
+            Gauge,
             "State of the input boolean (0/1)",
         )
         value = self.state_as_number(state)
@@ -380,13 +390,13 @@ class PrometheusMetrics:
         if unit := self._unit_string(state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)):
             metric = self._metric(
                 f"{domain}_state_{unit}",
-                prometheus_client.Gauge,
+                Gauge,
                 f"State of the {title} measured in {unit}",
             )
         else:
             metric = self._metric(
                 f"{domain}_state",
-                prometheus_client.Gauge,
+                Gauge,
                 f"State of the {title}",
             )
 
@@ -410,23 +420,21 @@ class PrometheusMetrics:
     def _handle_device_tracker(self, state: State) -> None:
         metric = self._metric(
             "device_tracker_state",
-            prometheus_client.Gauge,
+            Gauge,
             "State of the device tracker (0/1)",
         )
         value = self.state_as_number(state)
         metric.labels(**self._labels(state)).set(value)
 
     def _handle_person(self, state: State) -> None:
-        metric = self._metric(
-            "person_state", prometheus_client.Gauge, "State of the person (0/1)"
-        )
+        metric = self._metric("person_state", Gauge, "State of the person (0/1)")
         value = self.state_as_number(state)
         metric.labels(**self._labels(state)).set(value)
 
     def _handle_cover(self, state: State) -> None:
         metric = self._metric(
             "cover_state",
-            prometheus_client.Gauge,
+            Gauge,
             "State of the cover (0/1)",
             ["state"],
         )
@@ -441,7 +449,7 @@ class PrometheusMetrics:
         if position is not None:
             position_metric = self._metric(
                 "cover_position",
-                prometheus_client.Gauge,
+                Gauge,
                 "Position of the cover (0-100)",
             )
             position_metric.labels(**self._labels(state)).set(float(position))
@@ -450,7 +458,7 @@ class PrometheusMetrics:
         if tilt_position is not None:
             tilt_position_metric = self._metric(
                 "cover_tilt_position",
-                prometheus_client.Gauge,
+                Gauge,
                 "Tilt Position of the cover (0-100)",
             )
             tilt_position_metric.labels(**self._labels(state)).set(float(tilt_position))
@@ -458,7 +466,7 @@ class PrometheusMetrics:
     def _handle_light(self, state: State) -> None:
         metric = self._metric(
             "light_brightness_percent",
-            prometheus_client.Gauge,
+            Gauge,
             "Light brightness percentage (0..100)",
         )
 
@@ -474,9 +482,7 @@ class PrometheusMetrics:
             pass
 
     def _handle_lock(self, state: State) -> None:
-        metric = self._metric(
-            "lock_state", prometheus_client.Gauge, "State of the lock (0/1)"
-        )
+        metric = self._metric("lock_state", Gauge, "State of the lock (0/1)")
         value = self.state_as_number(state)
         metric.labels(**self._labels(state)).set(value)
 
@@ -490,7 +496,7 @@ class PrometheusMetrics:
                 )
             metric = self._metric(
                 metric_name,
-                prometheus_client.Gauge,
+                Gauge,
                 metric_description,
             )
             metric.labels(**self._labels(state)).set(temp)
@@ -524,7 +530,7 @@ class PrometheusMetrics:
         if current_action := state.attributes.get(ATTR_HVAC_ACTION):
             metric = self._metric(
                 "climate_action",
-                prometheus_client.Gauge,
+                Gauge,
                 "HVAC action",
                 ["action"],
             )
@@ -538,7 +544,7 @@ class PrometheusMetrics:
         if current_mode and available_modes:
             metric = self._metric(
                 "climate_mode",
-                prometheus_client.Gauge,
+                Gauge,
                 "HVAC mode",
                 ["mode"],
             )
@@ -552,14 +558,14 @@ class PrometheusMetrics:
         if humidifier_target_humidity_percent:
             metric = self._metric(
                 "humidifier_target_humidity_percent",
-                prometheus_client.Gauge,
+                Gauge,
                 "Target Relative Humidity",
             )
             metric.labels(**self._labels(state)).set(humidifier_target_humidity_percent)
 
         metric = self._metric(
             "humidifier_state",
-            prometheus_client.Gauge,
+            Gauge,
             "State of the humidifier (0/1)",
         )
         try:
@@ -573,7 +579,7 @@ class PrometheusMetrics:
         if current_mode and available_modes:
             metric = self._metric(
                 "humidifier_mode",
-                prometheus_client.Gauge,
+                Gauge,
                 "Humidifier Mode",
                 ["mode"],
             )
@@ -595,7 +601,7 @@ class PrometheusMetrics:
             if unit:
                 documentation = f"Sensor data measured in {unit}"
 
-            _metric = self._metric(metric, prometheus_client.Gauge, documentation)
+            _metric = self._metric(metric, Gauge, documentation)
 
             try:
                 value = self.state_as_number(state)
@@ -672,9 +678,7 @@ class PrometheusMetrics:
         return units.get(unit, default)
 
     def _handle_switch(self, state: State) -> None:
-        metric = self._metric(
-            "switch_state", prometheus_client.Gauge, "State of the switch (0/1)"
-        )
+        metric = self._metric("switch_state", Gauge, "State of the switch (0/1)")
 
         try:
             value = self.state_as_number(state)
@@ -690,7 +694,7 @@ class PrometheusMetrics:
     def _handle_automation(self, state: State) -> None:
         metric = self._metric(
             "automation_triggered_count",
-            prometheus_client.Counter,
+            Counter,
             "Count of times an automation has been triggered",
         )
 
@@ -699,7 +703,7 @@ class PrometheusMetrics:
     def _handle_counter(self, state: State) -> None:
         metric = self._metric(
             "counter_value",
-            prometheus_client.Gauge,
+            Gauge,
             "Value of counter entities",
         )
 
@@ -708,7 +712,7 @@ class PrometheusMetrics:
     def _handle_update(self, state: State) -> None:
         metric = self._metric(
             "update_state",
-            prometheus_client.Gauge,
+            Gauge,
             "Update state, indicating if an update is available (0/1)",
         )
         value = self.state_as_number(state)
@@ -721,15 +725,27 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, requires_auth: bool) -> None:
+    def __init__(self, requires_auth: bool, exposition: MetricsExposition) -> None:
         """Initialize Prometheus view."""
         self.requires_auth = requires_auth
+        self._exposition = exposition
 
     async def get(self, request: web.Request) -> web.Response:
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
-        return web.Response(
-            body=prometheus_client.generate_latest(prometheus_client.REGISTRY),
-            content_type=CONTENT_TYPE_TEXT_PLAIN,
+        _, content_type = choose_encoder(request.headers.get(hdrs.ACCEPT, ""))
+        openmetrics = content_type == CONTENT_TYPE_OPENMETRICS
+        compress = gzip_accepted(request.headers.get(hdrs.ACCEPT_ENCODING, ""))
+        body = self._exposition.render(
+            prometheus_client.REGISTRY, openmetrics, compress
         )
+
+        headers = {
+            hdrs.CONTENT_TYPE: CONTENT_TYPE_OPENMETRICS
+            if openmetrics
+            else CONTENT_TYPE_TEXT_PLAIN
+        }
+        if compress:
+            headers[hdrs.CONTENT_ENCODING] = "gzip"
+        return web.Response(body=body, headers=headers)
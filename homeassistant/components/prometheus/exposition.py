@@ -0,0 +1,302 @@
+"""Pre-rendered exposition of the Home Assistant Prometheus metrics."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+import struct
+import threading
+import time
+import zlib
+
+import prometheus_client
+from prometheus_client.openmetrics.exposition import (
+    generate_latest as generate_latest_openmetrics,
+)
+from prometheus_client.utils import floatToGoString
+
+OPENMETRICS_EOF = b"# EOF\n"
+
+# A gzip header without file name or modification time, and the final
+# empty deflate block that ends the blocks of the chunks
+GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+DEFLATE_END = b"\x03\x00"
+
+
+def _escape_help(documentation: str) -> str:
+    """Escape the documentation of a metric for the text format."""
+    return documentation.replace("\\", r"\\").replace("\n", r"\n")
+
+
+def _escape(value: str) -> str:
+    """Escape a label value, or a documentation for the OpenMetrics format."""
+    return _escape_help(value).replace('"', r"\"")
+
+
+def _deflate(data: bytes) -> bytes:
+    """Compress data to deflate blocks that can be joined with others.
+
+    The blocks end on a byte boundary, none of them is the final block
+    and they never refer back to data compressed before them.
+    """
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+def gzip_chunks(chunks: Iterable[tuple[bytes, bytes]]) -> bytes:
+    """Join chunks with their deflate blocks to a single gzip member."""
+    crc = size = 0
+    body = [GZIP_HEADER]
+    for data, deflated in chunks:
+        crc = zlib.crc32(data, crc)
+        size += len(data)
+        body.append(deflated)
+    body.append(DEFLATE_END)
+    body.append(struct.pack("<II", crc, size & 0xFFFFFFFF))
+    return b"".join(body)
+
+
+class Series:
+    """A series of a metric, which keeps its rendered sample line."""
+
+    __slots__ = ("_family", "_prefix", "value", "line", "created_line")
+
+    def __init__(self, family: MetricFamily, prefix: str, created_line: str) -> None:
+        """Initialize the series."""
+        self._family = family
+        self._prefix = prefix
+        self.value = 0.0
+        self.line = ""
+        self.created_line = created_line
+
+    def render(self) -> None:
+        """Render the sample line of the series."""
+        self.line = f"{self._prefix} {floatToGoString(self.value)}\n"
+
+    def set(self, value: float) -> None:
+        """Set the value of the series."""
+        family = self._family
+        with family.lock:
+            self.value = float(value)
+            family.mark_dirty(self)
+
+
+class CounterSeries(Series):
+    """A series of a counter."""
+
+    __slots__ = ()
+
+    def inc(self, amount: float = 1) -> None:
+        """Increment the counter."""
+        family = self._family
+        with family.lock:
+            self.value += amount
+            family.mark_dirty(self)
+
+
+class MetricFamily:
+    """A metric with a series for each set of label values.
+
+    The rendered chunk of the metric is kept until one of its series
+    changes, and then only the changed series are rendered again.
+    """
+
+    type = "gauge"
+    sample_suffix = ""
+    series_factory: type[Series] = Series
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str],
+        registry: MetricsExposition,
+    ) -> None:
+        """Initialize the metric and register it with the exposition."""
+        self.name = name
+        self.labelnames = tuple(labelnames)
+        self.lock = registry.lock
+        self.series: dict[tuple[str, ...], Series] = {}
+        self._dirty: list[Series] = []
+        self._chunks: dict[bool, bytes] = {}
+        self._deflated: dict[bool, bytes] = {}
+        sample_name = f"{name}{self.sample_suffix}"
+        self._text_header = (
+            f"# HELP {sample_name} {_escape_help(documentation)}\n"
+            f"# TYPE {sample_name} {self.type}\n"
+        )
+        self._openmetrics_header = (
+            f"# HELP {name} {_escape(documentation)}\n# TYPE {name} {self.type}\n"
+        )
+        registry.register(self)
+
+    def labels(self, **labels: object) -> Series:
+        """Return the series for the label values, creating it if needed."""
+        labelvalues = tuple(str(labels[labelname]) for labelname in self.labelnames)
+        if (series := self.series.get(labelvalues)) is not None:
+            return series
+        labelstr = ",".join(
+            f'{labelname}="{_escape(labelvalue)}"'
+            for labelname, labelvalue in sorted(
+                zip(self.labelnames, labelvalues, strict=True)
+            )
+        )
+        with self.lock:
+            if (series := self.series.get(labelvalues)) is None:
+                series = self.series[labelvalues] = self.series_factory(
+                    self,
+                    f"{self.name}{self.sample_suffix}{{{labelstr}}}",
+                    self._created_line(labelstr),
+                )
+                self._dirty.append(series)
+                self._chunks.clear()
+                self._deflated.clear()
+        return series
+
+    def remove(self, *labelvalues: str) -> None:
+        """Remove the series for the label values."""
+        with self.lock:
+            del self.series[labelvalues]
+            self._chunks.clear()
+            self._deflated.clear()
+
+    def mark_dirty(self, series: Series) -> None:
+        """Mark a series to be rendered again, the lock must be held."""
+        if series.line:
+            series.line = ""
+            self._dirty.append(series)
+            self._chunks.clear()
+            self._deflated.clear()
+
+    def _created_line(self, labelstr: str) -> str:
+        """Return the line with the creation time of a series."""
+        return ""
+
+    def _text_created(self, all_series: Iterable[Series]) -> str:
+        """Return the creation times of the series in the text format."""
+        return ""
+
+    def chunk(self, openmetrics: bool) -> bytes:
+        """Return the rendered metric, the lock must be held."""
+        if (chunk := self._chunks.get(openmetrics)) is not None:
+            return chunk
+        for series in self._dirty:
+            if not series.line:
+                series.render()
+        self._dirty.clear()
+        all_series = self.series.values()
+        if openmetrics:
+            text = self._openmetrics_header + "".join(
+                [f"{series.line}{series.created_line}" for series in all_series]
+            )
+        else:
+            text = (
+                self._text_header
+                + "".join([series.line for series in all_series])
+                + self._text_created(all_series)
+            )
+        chunk = self._chunks[openmetrics] = text.encode()
+        return chunk
+
+    def deflated_chunk(self, openmetrics: bool) -> tuple[bytes, bytes]:
+        """Return the rendered metric and its deflate blocks."""
+        chunk = self.chunk(openmetrics)
+        if (deflated := self._deflated.get(openmetrics)) is None:
+            deflated = self._deflated[openmetrics] = _deflate(chunk)
+        return chunk, deflated
+
+
+class Gauge(MetricFamily):
+    """A gauge metric."""
+
+
+class Counter(MetricFamily):
+    """A counter metric, exposed with the creation time of its series."""
+
+    type = "counter"
+    sample_suffix = "_total"
+    series_factory = CounterSeries
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str],
+        registry: MetricsExposition,
+    ) -> None:
+        """Initialize the counter."""
+        super().__init__(name, documentation, labelnames, registry)
+        # The text format has no creation times, they are exposed
+        # as a separate gauge the same way prometheus_client does
+        self._text_created_header = (
+            f"# HELP {name}_created {_escape_help(documentation)}\n"
+            f"# TYPE {name}_created gauge\n"
+        )
+
+    def labels(self, **labels: object) -> CounterSeries:
+        """Return the series for the label values, creating it if needed."""
+        return super().labels(**labels)  # type: ignore[return-value]
+
+    def _created_line(self, labelstr: str) -> str:
+        """Return the line with the creation time of a series."""
+        return f"{self.name}_created{{{labelstr}}} {floatToGoString(time.time())}\n"
+
+    def _text_created(self, all_series: Iterable[Series]) -> str:
+        """Return the creation times of the series in the text format."""
+        if not (created_lines := [series.created_line for series in all_series]):
+            return ""
+        return self._text_created_header + "".join(created_lines)
+
+
+class MetricsExposition:
+    """Keep the exposition of the Home Assistant metrics rendered.
+
+    Rendering every series of every metric on each scrape gets slow with
+    thousands of entities. Instead each series keeps its rendered line
+    until its value changes, and each metric keeps its rendered chunk,
+    and the compressed copy of it, until one of its series changes. A
+    scrape then mostly joins chunks rendered before.
+
+    Metrics are updated from the executor while scrapes happen in the
+    event loop, so changes hold a lock shared by all the metrics.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the exposition."""
+        self.lock = threading.Lock()
+        self._families: list[MetricFamily] = []
+
+    def register(self, family: MetricFamily) -> None:
+        """Register a metric."""
+        with self.lock:
+            self._families.append(family)
+
+    def render(
+        self,
+        registry: prometheus_client.CollectorRegistry,
+        openmetrics: bool,
+        compress: bool,
+    ) -> bytes:
+        """Render the metrics after the metrics of the registry.
+
+        The metrics of the registry, like the process and garbage
+        collection ones, are rendered on each scrape.
+        """
+        if openmetrics:
+            head = generate_latest_openmetrics(registry).removesuffix(OPENMETRICS_EOF)
+            tail = OPENMETRICS_EOF
+        else:
+            head = prometheus_client.generate_latest(registry)
+            tail = b""
+
+        with self.lock:
+            if not compress:
+                return b"".join(
+                    [
+                        head,
+                        *[family.chunk(openmetrics) for family in self._families],
+                        tail,
+                    ]
+                )
+            chunks = [family.deflated_chunk(openmetrics) for family in self._families]
+
+        return gzip_chunks([(head, _deflate(head)), *chunks, (tail, _deflate(tail))])
@@ -15,7 +15,14 @@ import time
 from typing import TYPE_CHECKING, Any, cast
 
 import psutil_home_assistant as ha_psutil
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select, update
+from sqlalchemy import (
+    create_engine,
+    event as sqlalchemy_event,
+    exc,
+    insert,
+    select,
+    update,
+)
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
@@ -90,6 +97,10 @@ from .migration import (
     StatesContextIDMigration,
 )
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
+from .models.state_attributes import (
+    DECODED_ATTRIBUTES_CACHE_MAX_BYTES,
+    DecodedAttributesCache,
+)
 from .pool import POOL_SIZE, MutexPool, RecorderPool
 from .queries import get_migration_changes
 from .table_managers.event_data import EventDataManager
@@ -151,6 +162,12 @@ KEEP_ALIVE_TASK = KeepAliveTask()
 WAIT_TASK = WaitTask()
 ADJUST_LRU_SIZE_TASK = AdjustLRUSizeTask()
 
+# Minimum number of queued items before the ids of the
+# queued events are resolved in batches
+PRE_PROCESS_BACKLOG_MIN_SIZE = 100
+# Maximum number of queued items to resolve the ids for at once
+PRE_PROCESS_BATCH_SIZE = 1000
+
 DB_LOCK_TIMEOUT = 30
 DB_LOCK_QUEUE_CHECK_TIMEOUT = 10  # check every 10 seconds
 
@@ -193,6 +210,8 @@ class Recorder(threading.Thread):
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
         self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
+        # Items taken off the queue in a batch that are not processed yet
+        self._batch_backlog = 0
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
@@ -218,6 +237,12 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # When the database supports returning the ids of the rows
+        # inserted with executemany, States and Events are kept out
+        # of the session and written with bulk INSERT statements
+        self._bulk_insert = False
+        self._bulk_pending_states: list[States] = []
+        self._bulk_pending_events: list[Events] = []
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -226,6 +251,9 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.decoded_attributes_cache = DecodedAttributesCache(
+            DECODED_ATTRIBUTES_CACHE_MAX_BYTES
+        )
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -256,7 +284,7 @@ class Recorder(threading.Thread):
     @property
     def backlog(self) -> int:
         """Return the number of items in the recorder backlog."""
-        return self._queue.qsize()
+        return self._queue.qsize() + self._batch_backlog
 
     @property
     def dialect_name(self) -> SupportedDialect | None:
@@ -715,6 +743,22 @@ class Recorder(threading.Thread):
         self._event_session_has_pending_writes = True
         session.add(obj)
 
+    def _add_state_to_session(self, session: Session, dbstate: States) -> None:
+        """Add a state to the session or the pending bulk insert."""
+        if self._bulk_insert:
+            self._event_session_has_pending_writes = True
+            self._bulk_pending_states.append(dbstate)
+        else:
+            self._add_to_session(session, dbstate)
+
+    def _add_event_to_session(self, session: Session, dbevent: Events) -> None:
+        """Add an event to the session or the pending bulk insert."""
+        if self._bulk_insert:
+            self._event_session_has_pending_writes = True
+            self._bulk_pending_events.append(dbevent)
+        else:
+            self._add_to_session(session, dbevent)
+
     def _run(self) -> None:
         """Start processing events to save."""
         thread_id = threading.get_ident()
@@ -868,7 +912,40 @@ class Recorder(threading.Thread):
 
         self.stop_requested = False
         while not self.stop_requested:
-            self._guarded_process_one_task_or_event_or_recover(queue_.get())
+            task_or_event = queue_.get()
+            if queue_.qsize() < PRE_PROCESS_BACKLOG_MIN_SIZE:
+                self._guarded_process_one_task_or_event_or_recover(task_or_event)
+                continue
+            # We are behind, resolve the ids of the queued events in
+            # batches instead of one round-trip per cache miss
+            task_or_events: list[RecorderTask | Event] = [task_or_event]
+            self._batch_backlog = 1
+            while len(task_or_events) < PRE_PROCESS_BATCH_SIZE and not queue_.empty():
+                task_or_events.append(queue_.get_nowait())
+                self._batch_backlog += 1
+            try:
+                self._guarded_pre_process_events(task_or_events)
+                for task_or_event in task_or_events:
+                    self._guarded_process_one_task_or_event_or_recover(task_or_event)
+                    self._batch_backlog -= 1
+                    if self.stop_requested:
+                        break
+            finally:
+                self._batch_backlog = 0
+
+    def _guarded_pre_process_events(
+        self, task_or_events: list[RecorderTask | Event[Any]]
+    ) -> None:
+        """Pre process queued events, guarding against database errors.
+
+        Priming the caches is only an optimization, if it fails the
+        ids are resolved when each event is processed.
+        """
+        try:
+            self._pre_process_startup_events(task_or_events)
+        except SQLAlchemyError:
+            _LOGGER.exception("Error while pre processing queued events")
+            self._reopen_event_session()
 
     def _pre_process_startup_events(
         self, startup_task_or_events: list[RecorderTask | Event[Any]]
@@ -1060,7 +1137,7 @@ class Recorder(threading.Thread):
             dbevent.event_type_rel = event_types
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_event_to_session(session, dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1085,7 +1162,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
-        self._add_to_session(session, dbevent)
+        self._add_event_to_session(session, dbevent)
 
     def _process_state_changed_event_into_session(
         self, event: Event[EventStateChangedData]
@@ -1168,7 +1245,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        self._add_state_to_session(session, dbstate)
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1208,6 +1285,9 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if self._bulk_pending_states or self._bulk_pending_events:
+            self._bulk_insert_pending(session)
+
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1226,6 +1306,8 @@ class Recorder(threading.Thread):
         session.commit()
 
         self._event_session_has_pending_writes = False
+        self._bulk_pending_states.clear()
+        self._bulk_pending_events.clear()
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1243,6 +1325,42 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             session.expire_all()
 
+    def _bulk_insert_pending(self, session: Session) -> None:
+        """Write the pending States and Events with bulk INSERT statements.
+
+        The rows they refer to in the StatesMeta, StateAttributes,
+        EventTypes and EventData tables are flushed first so their
+        ids are known.
+        """
+        session.flush()
+        # render_nulls keeps rows with NULL values in the same
+        # executemany batch instead of splitting them up by the
+        # columns that have values
+        if events := self._bulk_pending_events:
+            session.execute(
+                insert(Events).execution_options(render_nulls=True),
+                [_event_to_bulk_insert_row(event) for event in events],
+            )
+        if not (states := self._bulk_pending_states):
+            return
+        state_ids = session.scalars(
+            insert(States)
+            .returning(States.state_id, sort_by_parameter_order=True)
+            .execution_options(render_nulls=True),
+            [_state_to_bulk_insert_row(state) for state in states],
+        ).all()
+        for dbstate, state_id in zip(states, state_ids, strict=True):
+            dbstate.state_id = state_id
+        # States that replace a state from the same commit
+        # can only be linked once the old state has an id
+        if old_state_links := [
+            {"state_id": dbstate.state_id, "old_state_id": old_state.state_id}
+            for dbstate in states
+            if (old_state := dbstate.old_state) is not None
+        ]:
+            with session.no_autoflush:
+                session.execute(update(States), old_state_links)
+
     def _handle_sqlite_corruption(self) -> None:
         """Handle the sqlite3 database being corrupt."""
         try:
@@ -1256,6 +1374,8 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        self._bulk_pending_states.clear()
+        self._bulk_pending_events.clear()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
@@ -1318,7 +1438,11 @@ class Recorder(threading.Thread):
 
     async def async_block_till_done(self) -> None:
         """Async version of block_till_done."""
-        if self._queue.empty() and not self._event_session_has_pending_writes:
+        if (
+            self._queue.empty()
+            and not self._batch_backlog
+            and not self._event_session_has_pending_writes
+        ):
             return
         event = asyncio.Event()
         self.queue_task(SynchronizeTask(event))
@@ -1446,6 +1570,9 @@ class Recorder(threading.Thread):
 
         self.engine = create_engine(self.db_url, **kwargs, future=True)
         self._dialect_name = try_parse_enum(SupportedDialect, self.engine.dialect.name)
+        self._bulk_insert = (
+            self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        )
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
         Base.metadata.create_all(self.engine)
@@ -1506,3 +1633,51 @@ class Recorder(threading.Thread):
         finally:
             self._stop_executor()
             self._close_connection()
+            self.decoded_attributes_cache.clear()
+
+
+def _state_to_bulk_insert_row(dbstate: States) -> dict[str, Any]:
+    """Return the values to insert for a pending state."""
+    if (state_attributes := dbstate.state_attributes) is not None:
+        attributes_id = state_attributes.attributes_id
+    else:
+        attributes_id = dbstate.attributes_id
+    if (states_meta := dbstate.states_meta_rel) is not None:
+        metadata_id = states_meta.metadata_id
+    else:
+        metadata_id = dbstate.metadata_id
+    return {
+        "entity_id": dbstate.entity_id,
+        "state": dbstate.state,
+        "last_changed_ts": dbstate.last_changed_ts,
+        "last_reported_ts": dbstate.last_reported_ts,
+        "last_updated_ts": dbstate.last_updated_ts,
+        "old_state_id": dbstate.old_state_id,
+        "attributes_id": attributes_id,
+        "origin_idx": dbstate.origin_idx,
+        "context_id_bin": dbstate.context_id_bin,
+        "context_user_id_bin": dbstate.context_user_id_bin,
+        "context_parent_id_bin": dbstate.context_parent_id_bin,
+        "metadata_id": metadata_id,
+    }
+
+
+def _event_to_bulk_insert_row(dbevent: Events) -> dict[str, Any]:
+    """Return the values to insert for a pending event."""
+    if (event_type := dbevent.event_type_rel) is not None:
+        event_type_id = event_type.event_type_id
+    else:
+        event_type_id = dbevent.event_type_id
+    if (event_data := dbevent.event_data_rel) is not None:
+        data_id = event_data.data_id
+    else:
+        data_id = dbevent.data_id
+    return {
+        "origin_idx": dbevent.origin_idx,
+        "time_fired_ts": dbevent.time_fired_ts,
+        "data_id": data_id,
+        "context_id_bin": dbevent.context_id_bin,
+        "context_user_id_bin": dbevent.context_user_id_bin,
+        "context_parent_id_bin": dbevent.context_parent_id_bin,
+        "event_type_id": event_type_id,
+    }
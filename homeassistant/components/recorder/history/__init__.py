@@ -7,15 +7,26 @@ from typing import Any
 
 from sqlalchemy.orm.session import Session
 
-from homeassistant.core import HomeAssistant, State
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
+from homeassistant.core import HomeAssistant, State, split_entity_id
 
 from ... import recorder
 from ..filters import Filters
-from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
+from .const import (
+    COLUMNAR_FIRST_ATTRIBUTES_KEY,
+    NEED_ATTRIBUTE_DOMAINS,
+    SIGNIFICANT_DOMAINS,
+)
 from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_columnar as _modern_get_significant_states_columnar,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
@@ -27,6 +38,7 @@ __all__ = [
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_columnar",
     "get_significant_states_with_session",
     "state_changes_during_period",
 ]
@@ -115,6 +127,79 @@ def get_significant_states(
     )
 
 
+def get_significant_states_columnar(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> dict[str, dict[str, Any]]:
+    """Return a dict of significant states during a time period in columns."""
+    if recorder.get_instance(hass).states_meta_manager.active:
+        return _modern_get_significant_states_columnar(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_significant_states as _legacy_get_significant_states,
+    )
+
+    # The legacy schema is only used until the migration
+    # has finished so we convert the row format instead
+    # of maintaining a columnar query for it.
+    result = _legacy_get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+    )
+    columnar: dict[str, dict[str, Any]] = {}
+    for entity_id, states in result.items():
+        compressed_states: list[dict[str, Any]] = states  # type: ignore[assignment]
+        columns: dict[str, Any] = {
+            COMPRESSED_STATE_STATE: [
+                state[COMPRESSED_STATE_STATE] for state in compressed_states
+            ],
+            COMPRESSED_STATE_LAST_UPDATED: [
+                state[COMPRESSED_STATE_LAST_UPDATED] for state in compressed_states
+            ],
+        }
+        if not no_attributes:
+            if (
+                not minimal_response
+                or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
+            ):
+                columns[COMPRESSED_STATE_ATTRIBUTES] = [
+                    state.get(COMPRESSED_STATE_ATTRIBUTES, {})
+                    for state in compressed_states
+                ]
+            elif compressed_states:
+                columns[COLUMNAR_FIRST_ATTRIBUTES_KEY] = compressed_states[0].get(
+                    COMPRESSED_STATE_ATTRIBUTES, {}
+                )
+        if not significant_changes_only:
+            columns[COMPRESSED_STATE_LAST_CHANGED] = [
+                state.get(COMPRESSED_STATE_LAST_CHANGED) for state in compressed_states
+            ]
+        columnar[entity_id] = columns
+    return columnar
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
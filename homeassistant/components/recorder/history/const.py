@@ -2,6 +2,9 @@
 
 STATE_KEY = "state"
 LAST_CHANGED_KEY = "last_changed"
+# The attributes of the first state in columnar minimal responses
+# for the domains that do not have an attributes column
+COLUMNAR_FIRST_ATTRIBUTES_KEY = "a0"
 
 SIGNIFICANT_DOMAINS = {
     "climate",
@@ -35,6 +35,7 @@ from ..models.legacy import (
     legacy_row_to_compressed_state,
     legacy_row_to_compressed_state_pre_schema_31,
 )
+from ..models.state_attributes import AttributesCache
 from ..util import execute_stmt_lambda_element, session_scope
 from .common import _schema_version
 from .const import (
@@ -756,9 +757,10 @@ def _sorted_states_to_dict(
         key_func = attrgetter("entity_id")
         states_iter = groupby(states, key_func)
 
+    decoded_attributes_cache = recorder.get_instance(hass).decoded_attributes_cache
     # Append all changes to it
     for ent_id, group in states_iter:
-        attr_cache: dict[str, dict[str, Any]] = {}
+        attr_cache = AttributesCache(decoded_attributes_cache)
         prev_state: Column | str
         ent_results = result[ent_id]
         if row := initial_states.pop(ent_id, None):
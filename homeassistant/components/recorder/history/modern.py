@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from datetime import datetime
 from itertools import groupby
 from operator import itemgetter
@@ -19,10 +19,16 @@ from sqlalchemy import (
     select,
     union_all,
 )
+from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
 
-from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
 from homeassistant.core import HomeAssistant, State, split_entity_id
 import homeassistant.util.dt as dt_util
 
@@ -37,8 +43,14 @@ from ..models import (
     process_timestamp,
     row_to_compressed_state,
 )
+from ..models.state_attributes import (
+    AttributesCache,
+    DecodedAttributesCache,
+    decode_attributes_from_source,
+)
 from ..util import execute_stmt_lambda_element, session_scope
 from .const import (
+    COLUMNAR_FIRST_ATTRIBUTES_KEY,
     LAST_CHANGED_KEY,
     NEED_ATTRIBUTE_DOMAINS,
     SIGNIFICANT_DOMAINS,
@@ -229,6 +241,91 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        query_result := _significant_states_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    rows, start_time_ts, entity_id_to_metadata_id = query_result
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+        decoded_attributes_cache=recorder.get_instance(hass).decoded_attributes_cache,
+    )
+
+
+def get_significant_states_columnar(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> dict[str, dict[str, Any]]:
+    """Return significant states with the values of each entity in arrays.
+
+    This is the columnar variant of get_significant_states that avoids
+    building a dict for every state which matters for large periods.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            query_result := _significant_states_rows(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+            )
+        ):
+            return {}
+        rows, start_time_ts, entity_id_to_metadata_id = query_result
+        return _sorted_states_to_columnar_dict(
+            rows,
+            start_time_ts,
+            entity_ids,
+            entity_id_to_metadata_id,
+            minimal_response,
+            not significant_changes_only,
+            no_attributes,
+            recorder.get_instance(hass).decoded_attributes_cache,
+        )
+
+
+def _significant_states_rows(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[Sequence[Row] | Result, float | None, dict[str, int | None]] | None:
+    """Query the significant states rows sorted by metadata_id and last_updated.
+
+    Returns the rows, the start time timestamp if the rows include the
+    state at the start time, and the entity_id to metadata_id mapping.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
@@ -237,7 +334,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -275,14 +372,10 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
+    return (
         execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
         start_time_ts if include_start_time_state else None,
-        entity_ids,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
     )
 
 
@@ -448,6 +541,7 @@ def state_changes_during_period(
                 entity_id_to_metadata_id,
                 descending=descending,
                 no_attributes=no_attributes,
+                decoded_attributes_cache=instance.decoded_attributes_cache,
             ),
         )
 
@@ -546,6 +640,7 @@ def get_last_state_changes(
                 entity_ids,
                 entity_id_to_metadata_id,
                 no_attributes=False,
+                decoded_attributes_cache=instance.decoded_attributes_cache,
             ),
         )
 
@@ -680,6 +775,7 @@ def _sorted_states_to_dict(
     compressed_state_format: bool = False,
     descending: bool = False,
     no_attributes: bool = False,
+    decoded_attributes_cache: DecodedAttributesCache | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Convert SQL results into JSON friendly data structure.
 
@@ -731,7 +827,7 @@ def _sorted_states_to_dict(
     # Append all changes to it
     for metadata_id, group in states_iter:
         entity_id = metadata_id_to_entity_id[metadata_id]
-        attr_cache: dict[str, dict[str, Any]] = {}
+        attr_cache = AttributesCache(decoded_attributes_cache)
         ent_results = result[entity_id]
         if (
             not minimal_response
@@ -808,3 +904,92 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_columnar_dict(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    include_last_changed: bool,
+    no_attributes: bool,
+    decoded_attributes_cache: DecodedAttributesCache | None,
+) -> dict[str, dict[str, Any]]:
+    """Convert SQL results into a columnar JSON friendly data structure.
+
+    This takes our state list and turns it into
+    {'entity_id': {'s': [states], 'lu': [last_updated timestamps]}}
+
+    When attributes are requested they are added as an 'a' list, with
+    minimal_response only for the domains in NEED_ATTRIBUTE_DOMAINS.
+    The other domains get the attributes of the first state as 'a0'
+    instead, like the first state of the row format.
+    When last_changed is requested it is added as an 'lc' list with
+    None for the states where it matches last_updated.
+
+    States must be sorted by entity_id and last_updated
+    """
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    # last_changed_ts follows the fixed columns and the
+    # attributes are always the last column
+    last_changed_ts_idx = len(_FIELD_MAP)
+    result: dict[str, dict[str, Any]] = {}
+
+    for metadata_id, group in groupby(states, itemgetter(_FIELD_MAP["metadata_id"])):
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        need_attributes = split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
+        dedupe_states = minimal_response and not need_attributes
+        state_column: list[str | None] = []
+        last_updated_column: list[float | None] = []
+        columns: dict[str, Any] = {
+            COMPRESSED_STATE_STATE: state_column,
+            COMPRESSED_STATE_LAST_UPDATED: last_updated_column,
+        }
+        attributes_column: list[dict[str, Any]] | None = None
+        if not no_attributes and (not minimal_response or need_attributes):
+            attributes_column = columns[COMPRESSED_STATE_ATTRIBUTES] = []
+        # Like the row format, minimal responses keep the
+        # attributes of the first state for the unit and name
+        first_attributes = not no_attributes and attributes_column is None
+        last_changed_column: list[float | None] | None = None
+        if include_last_changed:
+            last_changed_column = columns[COMPRESSED_STATE_LAST_CHANGED] = []
+        attr_cache = AttributesCache(decoded_attributes_cache)
+        prev_state: str | None = None
+
+        for row in group:
+            state = row[state_idx]
+            if dedupe_states and state_column and state == prev_state:
+                continue
+            if first_attributes and not state_column:
+                columns[COLUMNAR_FIRST_ATTRIBUTES_KEY] = decode_attributes_from_source(
+                    row[-1], attr_cache
+                )
+            prev_state = state
+            state_column.append(state)
+            last_updated_ts = row[last_updated_ts_idx] or start_time_ts
+            last_updated_column.append(last_updated_ts)
+            if last_changed_column is not None:
+                last_changed_ts = row[last_changed_ts_idx]
+                last_changed_column.append(
+                    last_changed_ts
+                    if last_changed_ts and last_changed_ts != last_updated_ts
+                    else None
+                )
+            if attributes_column is not None:
+                attributes_column.append(
+                    decode_attributes_from_source(row[-1], attr_cache)
+                )
+
+        if state_column:
+            result[entity_id] = columns
+
+    # Maintain the order of the requested entity_ids
+    return {
+        entity_id: result[entity_id] for entity_id in entity_ids if entity_id in result
+    }
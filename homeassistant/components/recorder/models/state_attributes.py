@@ -2,26 +2,221 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 import logging
+import sys
+import threading
 from typing import Any
 
 from homeassistant.util.json import json_loads_object
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 EMPTY_JSON_OBJECT = "{}"
 _LOGGER = logging.getLogger(__name__)
 
+# The maximum combined resident size of the decoded attributes
+# and their sources that are kept in memory between reads
+#
+# Based on:
+# - The decoded size of shared_attrs for typical entities
+#   which is about 5-10x the length of the source
+# - How much memory our low end hardware has
+DECODED_ATTRIBUTES_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+
+def _readonly(*args: Any, **kwargs: Any) -> Any:
+    """Raise an exception when a read only list is modified."""
+    raise RuntimeError("Cannot modify ReadOnlyList")
+
+
+class _ReadOnlyList(list[Any]):
+    """Read only version of list that is compatible with list types."""
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __iadd__ = _readonly
+    __imul__ = _readonly
+    append = _readonly
+    extend = _readonly
+    insert = _readonly
+    pop = _readonly
+    remove = _readonly
+    clear = _readonly
+    sort = _readonly
+    reverse = _readonly
+
+    def __reduce__(self) -> tuple[type[list[Any]], tuple[list[Any]]]:
+        """Copy and pickle as a plain list."""
+        return (list, (list(self),))
+
+
+class _ReadOnlyDict(ReadOnlyDict[str, Any]):
+    """ReadOnlyDict that copies and pickles as a plain dict."""
+
+    def __reduce__(self) -> tuple[type[dict[str, Any]], tuple[dict[str, Any]]]:
+        """Copy and pickle as a plain dict."""
+        return (dict, (dict(self),))
+
+
+def _freeze(value: Any) -> tuple[Any, int]:
+    """Return a read-only copy of a decoded JSON value and its size in memory.
+
+    Nested dicts and lists are frozen as well since the decoded
+    attributes are shared between all callers.
+    """
+    if isinstance(value, dict):
+        size = sys.getsizeof(value)
+        frozen_dict: dict[str, Any] = {}
+        for key, item in value.items():
+            frozen_dict[key], item_size = _freeze(item)
+            size += sys.getsizeof(key) + item_size
+        return _ReadOnlyDict(frozen_dict), size
+    if isinstance(value, list):
+        size = sys.getsizeof(value)
+        frozen_list: list[Any] = []
+        for item in value:
+            frozen_item, item_size = _freeze(item)
+            frozen_list.append(frozen_item)
+            size += item_size
+        return _ReadOnlyList(frozen_list), size
+    return value, sys.getsizeof(value)
+
+
+class DecodedAttributesCache:
+    """A byte bounded LRU cache of decoded attributes shared by all reads.
+
+    History requests over the same window decode the same
+    shared_attrs again and again. The cache is keyed by the source JSON
+    since identical attributes are deduplicated to the same source, and
+    unlike the attributes_id a source can never be reused for different
+    attributes after a purge.
+
+    The decoded attributes are read-only, including any nested dicts
+    and lists, since they are shared between all callers. The size of
+    an entry is the resident size of the decoded attributes and the
+    source. This class is thread-safe as reads happen in the recorder
+    executor.
+    """
+
+    __slots__ = (
+        "_cache",
+        "_lock",
+        "max_bytes",
+        "size_bytes",
+        "hits",
+        "misses",
+        "evictions",
+    )
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initialize the cache."""
+        self._cache: OrderedDict[str, tuple[ReadOnlyDict[str, Any], int]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached attributes."""
+        return len(self._cache)
+
+    def get(self, source: str) -> ReadOnlyDict[str, Any] | None:
+        """Return the decoded attributes for a source if cached."""
+        with self._lock:
+            if (entry := self._cache.get(source)) is None:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(source)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, source: str, attributes: ReadOnlyDict[str, Any], size: int) -> None:
+        """Cache the decoded attributes for a source.
+
+        The size must include the decoded attributes and the source.
+        """
+        if size > self.max_bytes:
+            return
+        cache = self._cache
+        with self._lock:
+            if source in cache:
+                cache.move_to_end(source)
+                return
+            cache[source] = (attributes, size)
+            self.size_bytes += size
+            while self.size_bytes > self.max_bytes:
+                _, (_, evicted_size) = cache.popitem(last=False)
+                self.size_bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Clear the cache and reset the metrics."""
+        with self._lock:
+            self._cache.clear()
+            self.size_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the cache metrics."""
+        with self._lock:
+            return {
+                "entries": len(self._cache),
+                "size_bytes": self.size_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+class AttributesCache(dict[str, dict[str, Any]]):
+    """The decoded attributes of the current query.
+
+    Falls back to the DecodedAttributesCache of the recorder
+    instance, if any, which is shared between queries.
+    """
+
+    __slots__ = ("shared",)
+
+    def __init__(self, shared: DecodedAttributesCache | None) -> None:
+        """Initialize the cache."""
+        super().__init__()
+        self.shared = shared
+
 
 def decode_attributes_from_source(
     source: Any, attr_cache: dict[str, dict[str, Any]]
 ) -> dict[str, Any]:
-    """Decode attributes from a row source."""
+    """Decode attributes from a row source.
+
+    The attr_cache is local to the current query and avoids the
+    lock of the shared cache for repeated sources. The shared cache
+    is only used when the attr_cache is an AttributesCache.
+    """
     if not source or source == EMPTY_JSON_OBJECT:
         return {}
     if (attributes := attr_cache.get(source)) is not None:
         return attributes
+    shared = attr_cache.shared if isinstance(attr_cache, AttributesCache) else None
+    if shared is not None and (attributes := shared.get(source)) is not None:
+        attr_cache[source] = attributes
+        return attributes
     try:
-        attr_cache[source] = attributes = json_loads_object(source)
+        decoded = json_loads_object(source)
     except ValueError:
         _LOGGER.exception("Error converting row to state attributes: %s", source)
         attr_cache[source] = attributes = {}
-    return attributes
+        return attributes
+    if shared is None:
+        attr_cache[source] = decoded
+        return decoded
+    frozen, size = _freeze(decoded)
+    attr_cache[source] = frozen
+    shared.set(source, frozen, size + sys.getsizeof(source))
+    return frozen
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Sequence
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
-from itertools import chain, groupby
+from itertools import groupby
 import logging
 from operator import itemgetter
 import re
@@ -147,6 +148,7 @@ STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
 }
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
+DATA_HOURLY_STATISTICS_ACCUMULATOR = "recorder_hourly_statistics_accumulator"
 
 
 def mean(values: list[float]) -> float | None:
@@ -190,6 +192,115 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+@dataclasses.dataclass(slots=True)
+class _RunningStatistic:
+    """Running summary of the 5-minute statistics of a metadata_id."""
+
+    mean_sum: float = 0.0
+    mean_count: int = 0
+    min: float | None = None
+    max: float | None = None
+    last_reset_ts: float | None = None
+    state: float | None = None
+    sum: float | None = None
+
+
+@dataclasses.dataclass(slots=True)
+class HourlyStatisticsAccumulator:
+    """Running summary of the 5-minute statistics compiled during the current hour.
+
+    The 5-minute statistics are added as they are compiled, which allows the
+    hourly statistics to be compiled from memory instead of summarizing the
+    5-minute statistics in the database. If a period was missed, for example
+    after a restart, the hourly statistics are compiled from the database.
+    """
+
+    _hour_start_ts: float | None = None
+    _next_period_start_ts: float | None = None
+    _row_count: int = 0
+    _statistics: dict[int, _RunningStatistic] = dataclasses.field(default_factory=dict)
+
+    def invalidate(self) -> None:
+        """Forget the statistics of the current hour.
+
+        Must be called when the 5-minute statistics of the current
+        hour are modified outside of the periodic compile.
+        """
+        self._hour_start_ts = None
+        self._next_period_start_ts = None
+        self._row_count = 0
+        self._statistics.clear()
+
+    def add_period(
+        self, start: datetime, stats: Iterable[tuple[int, StatisticData]]
+    ) -> None:
+        """Add the 5-minute statistics compiled for the period starting at start."""
+        start_ts = start.timestamp()
+        if start.minute == 0:
+            self.invalidate()
+            self._hour_start_ts = start_ts
+        elif start_ts != self._next_period_start_ts:
+            # A period was missed or compiled again
+            self.invalidate()
+            return
+        self._next_period_start_ts = (
+            start_ts + StatisticsShortTerm.duration.total_seconds()
+        )
+        running_statistics = self._statistics
+        for metadata_id, stat in stats:
+            self._row_count += 1
+            if (running := running_statistics.get(metadata_id)) is None:
+                running = running_statistics[metadata_id] = _RunningStatistic()
+            if (mean_ := stat.get("mean")) is not None:
+                running.mean_sum += mean_
+                running.mean_count += 1
+            if (min_ := stat.get("min")) is not None and (
+                running.min is None or min_ < running.min
+            ):
+                running.min = min_
+            if (max_ := stat.get("max")) is not None and (
+                running.max is None or max_ > running.max
+            ):
+                running.max = max_
+            running.last_reset_ts = datetime_to_timestamp_or_none(
+                stat.get("last_reset")
+            )
+            running.state = stat.get("state")
+            running.sum = stat.get("sum")
+
+    @property
+    def row_count(self) -> int:
+        """Return the number of 5-minute statistics added for the current hour."""
+        return self._row_count
+
+    def summary(self, start_time: datetime) -> dict[int, StatisticDataTimestamp] | None:
+        """Return the hourly statistics for the hour starting at start_time.
+
+        Returns None if not all 5-minute periods of the hour were added.
+        """
+        start_time_ts = start_time.timestamp()
+        if (
+            self._hour_start_ts != start_time_ts
+            or self._next_period_start_ts
+            != start_time_ts + Statistics.duration.total_seconds()
+        ):
+            return None
+        return {
+            metadata_id: {
+                "start_ts": start_time_ts,
+                "mean": running.mean_sum / running.mean_count
+                if running.mean_count
+                else None,
+                "min": running.min,
+                "max": running.max,
+                "last_reset_ts": running.last_reset_ts,
+                "state": running.state,
+                "sum": running.sum,
+            }
+            for metadata_id, running in self._statistics.items()
+        }
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -383,18 +494,65 @@ def _compile_hourly_statistics_last_sum_stmt(
     )
 
 
-def _compile_hourly_statistics(session: Session, start: datetime) -> None:
+def _compile_hourly_statistics_count_stmt(
+    start_time_ts: float, end_time_ts: float
+) -> StatementLambdaElement:
+    """Generate the statement to count the 5-minute statistics of an hour."""
+    return lambda_stmt(
+        lambda: select(func.count())
+        .select_from(StatisticsShortTerm)
+        .filter(StatisticsShortTerm.start_ts >= start_time_ts)
+        .filter(StatisticsShortTerm.start_ts < end_time_ts)
+    )
+
+
+def _compile_hourly_statistics(
+    session: Session,
+    start: datetime,
+    accumulator: HourlyStatisticsAccumulator | None = None,
+) -> None:
     """Compile hourly statistics.
 
     This will summarize 5-minute statistics for one hour:
     - average, min max is computed by a database query
     - sum is taken from the last 5-minute entry during the hour
+
+    If the accumulator has seen all 5-minute statistics of the hour, and
+    the database has the same number of 5-minute statistics, the summary
+    is taken from the accumulator instead.
     """
     start_time = start.replace(minute=0)
     start_time_ts = start_time.timestamp()
     end_time = start_time + timedelta(hours=1)
     end_time_ts = end_time.timestamp()
 
+    if (
+        accumulator is not None
+        and (summary_from_memory := accumulator.summary(start_time)) is not None
+        and execute_stmt_lambda_element(
+            session,
+            _compile_hourly_statistics_count_stmt(start_time_ts, end_time_ts),
+            orm_rows=False,
+        )[0][0]
+        == accumulator.row_count
+    ):
+        summary = summary_from_memory
+    else:
+        summary = _compile_hourly_statistics_summary(
+            session, start_time_ts, end_time_ts
+        )
+
+    # Insert compiled hourly statistics in the database
+    session.add_all(
+        Statistics.from_stats_ts(metadata_id, summary_item)
+        for metadata_id, summary_item in summary.items()
+    )
+
+
+def _compile_hourly_statistics_summary(
+    session: Session, start_time_ts: float, end_time_ts: float
+) -> dict[int, StatisticDataTimestamp]:
+    """Summarize the 5-minute statistics of an hour in the database."""
     # Compute last hour's average, min, max
     summary: dict[int, StatisticDataTimestamp] = {}
     stmt = _compile_hourly_statistics_summary_mean_stmt(start_time_ts, end_time_ts)
@@ -433,11 +591,7 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
                     "sum": _sum,
                 }
 
-    # Insert compiled hourly statistics in the database
-    session.add_all(
-        Statistics.from_stats_ts(metadata_id, summary_item)
-        for metadata_id, summary_item in summary.items()
-    )
+    return summary
 
 
 @retryable_database_job("compile missing statistics")
@@ -563,6 +717,7 @@ def _compile_statistics(
         current_metadata.update(compiled.current_metadata)
 
     new_short_term_stats: list[StatisticsBase] = []
+    inserted_stats: list[tuple[int, StatisticData]] = []
     updated_metadata_ids: set[int] = set()
     # Insert collected statistics in the database
     for stats in platform_stats:
@@ -579,10 +734,14 @@ def _compile_statistics(
             stats["stat"],
         ):
             new_short_term_stats.append(new_stat)
+            inserted_stats.append((metadata_id, stats["stat"]))
+
+    accumulator = get_hourly_statistics_accumulator(instance.hass)
+    accumulator.add_period(start, inserted_stats)
 
     if start.minute == 55:
         # A full hour is ready, summarize it
-        _compile_hourly_statistics(session, start)
+        _compile_hourly_statistics(session, start, accumulator)
 
     session.add(StatisticsRuns(start=start))
 
@@ -727,6 +886,7 @@ def get_metadata(
 
 def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
+    get_hourly_statistics_accumulator(instance.hass).invalidate()
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
 
@@ -882,16 +1042,39 @@ def list_statistic_ids(
     return _flatten_list_statistic_ids_metadata_result(result)
 
 
+def _reduce_statistics_column(
+    reduce: Callable[[list[float]], float | None],
+    values: list[float | None],
+    start: int,
+    end: int,
+) -> float | None:
+    """Reduce a slice of a column, skipping missing values."""
+    period_values = values[start:end]
+    try:
+        return reduce(period_values)  # type: ignore[arg-type]
+    except TypeError:
+        # Reducing fails on missing values, they are rare enough that
+        # filtering them out is cheaper than looking for them up front
+        if filtered := [value for value in period_values if value is not None]:
+            return reduce(filtered)
+        return None
+
+
 def _reduce_statistics(
     stats: dict[str, list[StatisticsRow]],
-    same_period: Callable[[float, float], bool],
     period_start_end: Callable[[float], tuple[float, float]],
-    period: timedelta,
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to daily or monthly statistics."""
-    result: dict[str, list[StatisticsRow]] = defaultdict(list)
-    period_seconds = period.total_seconds()
+    """Reduce hourly statistics to daily, weekly or monthly statistics.
+
+    The hourly statistics are sorted by start, so the statistics of a
+    period are a slice found by bisecting the starts for the end of the
+    period. The boundaries are computed once per period for all the
+    statistics instead of once per row, and the mean, min and max of a
+    period are reduced over slices of the columns in bulk.
+    """
+    result: dict[str, list[StatisticsRow]] = {}
+    boundaries: dict[float, tuple[float, float]] = {}
     _want_mean = "mean" in types
     _want_min = "min" in types
     _want_max = "max" in types
@@ -899,44 +1082,41 @@ def _reduce_statistics(
     _want_state = "state" in types
     _want_sum = "sum" in types
     for statistic_id, stat_list in stats.items():
-        max_values: list[float] = []
-        mean_values: list[float] = []
-        min_values: list[float] = []
-        prev_stat: StatisticsRow = stat_list[0]
-        fake_entry: StatisticsRow = {"start": stat_list[-1]["start"] + period_seconds}
-
-        # Loop over the hourly statistics + a fake entry to end the period
-        for statistic in chain(stat_list, (fake_entry,)):
-            if not same_period(prev_stat["start"], statistic["start"]):
-                start, end = period_start_end(prev_stat["start"])
-                # The previous statistic was the last entry of the period
-                row: StatisticsRow = {
-                    "start": start,
-                    "end": end,
-                }
-                if _want_mean:
-                    row["mean"] = mean(mean_values) if mean_values else None
-                    mean_values.clear()
-                if _want_min:
-                    row["min"] = min(min_values) if min_values else None
-                    min_values.clear()
-                if _want_max:
-                    row["max"] = max(max_values) if max_values else None
-                    max_values.clear()
-                if _want_last_reset:
-                    row["last_reset"] = prev_stat.get("last_reset")
-                if _want_state:
-                    row["state"] = prev_stat.get("state")
-                if _want_sum:
-                    row["sum"] = prev_stat["sum"]
-                result[statistic_id].append(row)
-            if _want_max and (_max := statistic.get("max")) is not None:
-                max_values.append(_max)
-            if _want_mean and (_mean := statistic.get("mean")) is not None:
-                mean_values.append(_mean)
-            if _want_min and (_min := statistic.get("min")) is not None:
-                min_values.append(_min)
-            prev_stat = statistic
+        starts = list(map(itemgetter("start"), stat_list))
+        mean_column = list(map(itemgetter("mean"), stat_list)) if _want_mean else []
+        min_column = list(map(itemgetter("min"), stat_list)) if _want_min else []
+        max_column = list(map(itemgetter("max"), stat_list)) if _want_max else []
+        rows: list[StatisticsRow] = []
+        idx = 0
+        count = len(starts)
+        while idx < count:
+            if (period := boundaries.get(first_start := starts[idx])) is None:
+                period = boundaries[first_start] = period_start_end(first_start)
+            start, end = period
+            next_idx = bisect_left(starts, end, idx + 1)
+            # The last statistic of the period
+            last_stat = stat_list[next_idx - 1]
+            row: StatisticsRow = {
+                "start": start,
+                "end": end,
+            }
+            if _want_mean:
+                row["mean"] = _reduce_statistics_column(
+                    mean, mean_column, idx, next_idx
+                )
+            if _want_min:
+                row["min"] = _reduce_statistics_column(min, min_column, idx, next_idx)
+            if _want_max:
+                row["max"] = _reduce_statistics_column(max, max_column, idx, next_idx)
+            if _want_last_reset:
+                row["last_reset"] = last_stat.get("last_reset")
+            if _want_state:
+                row["state"] = last_stat.get("state")
+            if _want_sum:
+                row["sum"] = last_stat["sum"]
+            rows.append(row)
+            idx = next_idx
+        result[statistic_id] = rows
 
     return result
 
@@ -983,10 +1163,8 @@ def _reduce_statistics_per_day(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to daily statistics."""
-    _same_day_ts, _day_start_end_ts = reduce_day_ts_factory()
-    return _reduce_statistics(
-        stats, _same_day_ts, _day_start_end_ts, timedelta(days=1), types
-    )
+    _, _day_start_end_ts = reduce_day_ts_factory()
+    return _reduce_statistics(stats, _day_start_end_ts, types)
 
 
 def reduce_week_ts_factory() -> (
@@ -1033,10 +1211,8 @@ def _reduce_statistics_per_week(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to weekly statistics."""
-    _same_week_ts, _week_start_end_ts = reduce_week_ts_factory()
-    return _reduce_statistics(
-        stats, _same_week_ts, _week_start_end_ts, timedelta(days=7), types
-    )
+    _, _week_start_end_ts = reduce_week_ts_factory()
+    return _reduce_statistics(stats, _week_start_end_ts, types)
 
 
 def _find_month_end_time(timestamp: datetime) -> datetime:
@@ -1090,10 +1266,8 @@ def _reduce_statistics_per_month(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to monthly statistics."""
-    _same_month_ts, _month_start_end_ts = reduce_month_ts_factory()
-    return _reduce_statistics(
-        stats, _same_month_ts, _month_start_end_ts, timedelta(days=31), types
-    )
+    _, _month_start_end_ts = reduce_month_ts_factory()
+    return _reduce_statistics(stats, _month_start_end_ts, types)
 
 
 def _generate_statistics_during_period_stmt(
@@ -2305,6 +2479,14 @@ def get_short_term_statistics_run_cache(
     return ShortTermStatisticsRunCache()
 
 
+@singleton(DATA_HOURLY_STATISTICS_ACCUMULATOR)
+def get_hourly_statistics_accumulator(
+    hass: HomeAssistant,
+) -> HourlyStatisticsAccumulator:
+    """Get the accumulator of the 5-minute statistics of the current hour."""
+    return HourlyStatisticsAccumulator()
+
+
 def cache_latest_short_term_statistic_id_for_metadata_id(
     run_cache: ShortTermStatisticsRunCache,
     session: Session,
@@ -2363,6 +2545,8 @@ def import_statistics(
     table: type[StatisticsBase],
 ) -> bool:
     """Process an import_statistics job."""
+    if table is StatisticsShortTerm:
+        get_hourly_statistics_accumulator(instance.hass).invalidate()
 
     with session_scope(
         session=instance.get_session(),
@@ -2384,6 +2568,7 @@ def adjust_statistics(
     adjustment_unit: str,
 ) -> bool:
     """Process an add_statistics job."""
+    get_hourly_statistics_accumulator(instance.hass).invalidate()
 
     with session_scope(session=instance.get_session()) as session:
         metadata = instance.statistics_meta_manager.get_many(
@@ -2475,6 +2660,7 @@ def change_statistics_unit(
             Statistics,
             StatisticsShortTerm,
         )
+        get_hourly_statistics_accumulator(instance.hass).invalidate()
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
 
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
-from collections.abc import Mapping
+from collections import OrderedDict
+from collections.abc import Coroutine, Mapping
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from functools import partial
 import hashlib
@@ -16,6 +18,7 @@ import os
 import re
 import subprocess
 import tempfile
+import time
 from typing import Any, Final, TypedDict, final
 
 from aiohttp import web
@@ -40,13 +43,20 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import HassJob, HomeAssistant, ServiceCall, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    HassJob,
+    HomeAssistant,
+    ServiceCall,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.network import get_url
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, ConfigType
 from homeassistant.util import dt as dt_util, language as language_util
 
@@ -57,10 +67,14 @@ from .const import (
     ATTR_OPTIONS,
     CONF_CACHE,
     CONF_CACHE_DIR,
+    CONF_CACHE_MAX_SIZE,
+    CONF_MEMORY_MAX_SIZE,
     CONF_TIME_MEMORY,
     DATA_TTS_MANAGER,
     DEFAULT_CACHE,
     DEFAULT_CACHE_DIR,
+    DEFAULT_CACHE_MAX_SIZE,
+    DEFAULT_MEMORY_MAX_SIZE,
     DEFAULT_TIME_MEMORY,
     DOMAIN,
     TtsAudioType,
@@ -120,13 +134,38 @@ KEY_PATTERN = "{0}_{1}_{2}_{3}"
 
 SCHEMA_SERVICE_CLEAR_CACHE = vol.Schema({})
 
+CACHE_INDEX_STORAGE_KEY = f"{DOMAIN}.cache_index"
+CACHE_INDEX_STORAGE_VERSION = 1
+CACHE_INDEX_SAVE_DELAY = 10
+
 
 class TTSCache(TypedDict):
     """Cached TTS file."""
 
     filename: str
     voice: bytes
-    pending: asyncio.Task | None
+    pending: asyncio.Task[bytes] | None
+    last_used: float
+
+
+@dataclass(slots=True)
+class TTSCacheStats:
+    """Counters of the TTS cache."""
+
+    memory_hits: int = 0
+    """Requests served from memory."""
+    shared: int = 0
+    """Requests that waited for a generation or load already in progress."""
+    disk_hits: int = 0
+    """Requests served from the file cache."""
+    misses: int = 0
+    """Requests that generated the audio."""
+    memory_evictions: int = 0
+    disk_evictions: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters as a dict."""
+        return asdict(self)
 
 
 @callback
@@ -299,14 +338,19 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     websocket_api.async_register_command(hass, websocket_list_engines)
     websocket_api.async_register_command(hass, websocket_get_engine)
     websocket_api.async_register_command(hass, websocket_list_engine_voices)
+    websocket_api.async_register_command(hass, websocket_cache_info)
 
     # Legacy config options
     conf = config[DOMAIN][0] if config.get(DOMAIN) else {}
     use_cache: bool = conf.get(CONF_CACHE, DEFAULT_CACHE)
     cache_dir: str = conf.get(CONF_CACHE_DIR, DEFAULT_CACHE_DIR)
     time_memory: int = conf.get(CONF_TIME_MEMORY, DEFAULT_TIME_MEMORY)
+    memory_max_size: int = conf.get(CONF_MEMORY_MAX_SIZE, DEFAULT_MEMORY_MAX_SIZE)
+    cache_max_size: int = conf.get(CONF_CACHE_MAX_SIZE, DEFAULT_CACHE_MAX_SIZE)
 
-    tts = SpeechManager(hass, use_cache, cache_dir, time_memory)
+    tts = SpeechManager(
+        hass, use_cache, cache_dir, time_memory, memory_max_size, cache_max_size
+    )
 
     try:
         await tts.async_init_cache()
@@ -503,47 +547,147 @@ class SpeechManager:
         use_cache: bool,
         cache_dir: str,
         time_memory: int,
+        memory_max_size: int = DEFAULT_MEMORY_MAX_SIZE,
+        cache_max_size: int = DEFAULT_CACHE_MAX_SIZE,
     ) -> None:
-        """Initialize a speech store."""
+        """Initialize a speech store.
+
+        The maximum sizes of the caches are in MB, a cache_max_size
+        of 0 is no maximum for the file cache.
+        """
         self.hass = hass
         self.providers: dict[str, Provider] = {}
 
         self.use_cache = use_cache
         self.cache_dir = cache_dir
         self.time_memory = time_memory
-        self.file_cache: dict[str, str] = {}
-        self.mem_cache: dict[str, TTSCache] = {}
+        self.memory_cache_max_bytes = memory_max_size * 1024 * 1024
+        self.disk_cache_max_bytes = cache_max_size * 1024 * 1024
+        self._memcache_expiry_unsub: CALLBACK_TYPE | None = None
+        self._memcache_expiry_job = HassJob(
+            self._async_expire_memcache,
+            "tts_memcache_expiry",
+            cancel_on_shutdown=True,
+        )
+        # Both caches are ordered from the least to the most recently used
+        self.file_cache: OrderedDict[str, str] = OrderedDict()
+        self.file_cache_sizes: dict[str, int] = {}
+        self.file_cache_bytes = 0
+        self.mem_cache: OrderedDict[str, TTSCache] = OrderedDict()
+        self.mem_cache_bytes = 0
+        self.stats = TTSCacheStats()
+        self._cache_dir_mtime: int | None = None
+        self._index_store = Store[dict[str, Any]](
+            hass, CACHE_INDEX_STORAGE_VERSION, CACHE_INDEX_STORAGE_KEY, private=True
+        )
+
+    def _init_cache(
+        self, index: dict[str, Any] | None
+    ) -> tuple[list[list[Any]], int | None]:
+        """Init cache folder and fetch files with their size.
 
-    def _init_cache(self) -> dict[str, str]:
-        """Init cache folder and fetch files."""
+        The files are taken from the index when nothing was added to
+        or removed from the cache folder since the index was saved.
+        """
         try:
             self.cache_dir = _init_tts_cache_dir(self.hass, self.cache_dir)
         except OSError as err:
             raise HomeAssistantError(f"Can't init cache dir {err}") from err
 
+        if (
+            index is not None
+            and index["cache_dir"] == self.cache_dir
+            and (mtime := _get_cache_dir_mtime(self.cache_dir)) is not None
+            and index["mtime"] == mtime
+        ):
+            return index["files"], mtime
+
         try:
-            return _get_cache_files(self.cache_dir)
+            cache_files = _get_cache_files(self.cache_dir)
         except OSError as err:
             raise HomeAssistantError(f"Can't read cache dir {err}") from err
 
+        files: list[list[Any]] = []
+        for cache_key, filename in cache_files.items():
+            try:
+                size = os.path.getsize(os.path.join(self.cache_dir, filename))
+            except OSError:
+                size = 0
+            files.append([cache_key, filename, size])
+        return files, _get_cache_dir_mtime(self.cache_dir) if files else None
+
     async def async_init_cache(self) -> None:
         """Init config folder and load file cache."""
-        self.file_cache.update(await self.hass.async_add_executor_job(self._init_cache))
+        index = await self._index_store.async_load()
+        files, mtime = await self.hass.async_add_executor_job(self._init_cache, index)
+        for cache_key, filename, size in files:
+            self._async_add_to_file_cache(cache_key, filename, size)
+        if mtime is not None:
+            self._cache_dir_mtime = mtime
+            self._async_schedule_index_save()
 
     async def async_clear_cache(self) -> None:
         """Read file cache and delete files."""
-        self.mem_cache = {}
-
-        def remove_files() -> None:
+        self.mem_cache = OrderedDict()
+        self.mem_cache_bytes = 0
+        filenames = list(self.file_cache.values())
+        self.file_cache = OrderedDict()
+        self.file_cache_sizes = {}
+        self.file_cache_bytes = 0
+        if filenames:
+            await self._async_remove_files(filenames)
+
+    async def _async_remove_files(self, filenames: list[str]) -> None:
+        """Remove files from the cache folder."""
+
+        def remove_files() -> int | None:
             """Remove files from filesystem."""
-            for filename in self.file_cache.values():
+            for filename in filenames:
                 try:
                     os.remove(os.path.join(self.cache_dir, filename))
                 except OSError as err:
                     _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
+            return _get_cache_dir_mtime(self.cache_dir)
+
+        self._cache_dir_mtime = await self.hass.async_add_executor_job(remove_files)
+        self._async_schedule_index_save()
+
+    @callback
+    def _async_schedule_index_save(self) -> None:
+        """Schedule saving the index of the file cache."""
+        self._index_store.async_delay_save(
+            self._async_index_data, CACHE_INDEX_SAVE_DELAY
+        )
+
+    @callback
+    def _async_index_data(self) -> dict[str, Any]:
+        """Return the index of the file cache to store."""
+        sizes = self.file_cache_sizes
+        return {
+            "cache_dir": self.cache_dir,
+            "mtime": self._cache_dir_mtime,
+            "files": [
+                [cache_key, filename, sizes[cache_key]]
+                for cache_key, filename in self.file_cache.items()
+            ],
+        }
 
-        await self.hass.async_add_executor_job(remove_files)
-        self.file_cache = {}
+    @callback
+    def async_cache_info(self) -> dict[str, Any]:
+        """Return the sizes and counters of the caches."""
+        return {
+            "memory": {
+                "entries": len(self.mem_cache),
+                "bytes": self.mem_cache_bytes,
+                "max_bytes": self.memory_cache_max_bytes,
+            },
+            "disk": {
+                "entries": len(self.file_cache),
+                "bytes": self.file_cache_bytes,
+                "max_bytes": self.disk_cache_max_bytes,
+            },
+            "stats": self.stats.as_dict(),
+        }
 
     @callback
     def async_register_legacy_engine(
@@ -618,12 +762,11 @@ class SpeechManager:
         use_cache = cache if cache is not None else self.use_cache
 
         # Is speech already in memory
-        if cache_key in self.mem_cache:
-            filename = self.mem_cache[cache_key]["filename"]
+        if (cached := self._async_get_from_memcache(cache_key)) is not None:
+            filename = cached["filename"]
         # Is file store in file cache
         elif use_cache and cache_key in self.file_cache:
-            filename = self.file_cache[cache_key]
-            self.hass.async_create_task(self._async_file_to_mem(cache_key))
+            filename = self._async_file_to_mem(cache_key)["filename"]
         # Load speech from engine into memory
         else:
             filename = await self._async_get_tts_audio(
@@ -649,19 +792,18 @@ class SpeechManager:
         use_cache = cache if cache is not None else self.use_cache
 
         # If we have the file, load it into memory if necessary
-        if cache_key not in self.mem_cache:
+        if (cached := self._async_get_from_memcache(cache_key)) is None:
             if use_cache and cache_key in self.file_cache:
-                await self._async_file_to_mem(cache_key)
+                cached = self._async_file_to_mem(cache_key)
             else:
                 await self._async_get_tts_audio(
                     engine_instance, cache_key, message, use_cache, language, options
                 )
+                cached = self.mem_cache[cache_key]
 
-        extension = os.path.splitext(self.mem_cache[cache_key]["filename"])[1][1:]
-        cached = self.mem_cache[cache_key]
-        if pending := cached.get("pending"):
-            await pending
-            cached = self.mem_cache[cache_key]
+        extension = os.path.splitext(cached["filename"])[1][1:]
+        if pending := cached["pending"]:
+            return extension, await pending
         return extension, cached["voice"]
 
     @callback
@@ -692,6 +834,7 @@ class SpeechManager:
 
         This method is a coroutine.
         """
+        self.stats.misses += 1
         options = dict(options or {})
         supported_options = engine_instance.supported_options or []
 
@@ -718,7 +861,7 @@ class SpeechManager:
         else:
             sample_channels = options.pop(ATTR_PREFERRED_SAMPLE_CHANNELS, None)
 
-        async def get_tts_data() -> str:
+        async def get_tts_data() -> bytes:
             """Handle data available."""
             if engine_instance.name is None or engine_instance.name is UNDEFINED:
                 raise HomeAssistantError("TTS engine name is not set.")
@@ -780,23 +923,10 @@ class SpeechManager:
                     self._async_save_tts_audio(cache_key, filename, data)
                 )
 
-            return filename
-
-        audio_task = self.hass.async_create_task(get_tts_data(), eager_start=False)
-
-        def handle_error(_future: asyncio.Future) -> None:
-            """Handle error."""
-            if audio_task.exception():
-                self.mem_cache.pop(cache_key, None)
-
-        audio_task.add_done_callback(handle_error)
+            return data
 
         filename = f"{cache_key}.{final_extension}".lower()
-        self.mem_cache[cache_key] = {
-            "filename": filename,
-            "voice": b"",
-            "pending": audio_task,
-        }
+        self._async_store_pending_to_memcache(cache_key, filename, get_tts_data())
         return filename
 
     async def _async_save_tts_audio(
@@ -808,25 +938,76 @@ class SpeechManager:
         """
         voice_file = os.path.join(self.cache_dir, filename)
 
-        def save_speech() -> None:
+        def save_speech() -> int | None:
             """Store speech to filesystem."""
             with open(voice_file, "wb") as speech:
                 speech.write(data)
+            return _get_cache_dir_mtime(self.cache_dir)
 
         try:
-            await self.hass.async_add_executor_job(save_speech)
-            self.file_cache[cache_key] = filename
+            self._cache_dir_mtime = await self.hass.async_add_executor_job(save_speech)
         except OSError as err:
             _LOGGER.error("Can't write %s: %s", filename, err)
+            return
+
+        self._async_add_to_file_cache(cache_key, filename, len(data))
+        self._async_schedule_index_save()
+        await self._async_evict_file_cache(cache_key)
+
+    @callback
+    def _async_add_to_file_cache(
+        self, cache_key: str, filename: str, size: int
+    ) -> None:
+        """Add a file to the file cache as the most recently used."""
+        self._async_remove_from_file_cache(cache_key)
+        self.file_cache[cache_key] = filename
+        self.file_cache_sizes[cache_key] = size
+        self.file_cache_bytes += size
+
+    @callback
+    def _async_remove_from_file_cache(self, cache_key: str) -> str | None:
+        """Remove a file from the file cache and return its filename."""
+        if (filename := self.file_cache.pop(cache_key, None)) is not None:
+            self.file_cache_bytes -= self.file_cache_sizes.pop(cache_key)
+        return filename
+
+    async def _async_evict_file_cache(self, keep: str) -> None:
+        """Remove the least recently used files above the size of the file cache."""
+        size = self.file_cache_bytes
+        if not self.disk_cache_max_bytes or size <= self.disk_cache_max_bytes:
+            return
+        evicted: list[str] = []
+        for cache_key in self.file_cache:
+            if size <= self.disk_cache_max_bytes:
+                break
+            if cache_key != keep:
+                evicted.append(cache_key)
+                size -= self.file_cache_sizes[cache_key]
+        filenames = [
+            filename
+            for cache_key in evicted
+            if (filename := self._async_remove_from_file_cache(cache_key))
+        ]
+        self.stats.disk_evictions += len(filenames)
+        _LOGGER.info(
+            "Removing %s least recently used files from the TTS cache to keep it"
+            " below %s MB, this maximum can be changed with %s",
+            len(filenames),
+            self.disk_cache_max_bytes // (1024 * 1024),
+            CONF_CACHE_MAX_SIZE,
+        )
+        await self._async_remove_files(filenames)
 
-    async def _async_file_to_mem(self, cache_key: str) -> None:
+    @callback
+    def _async_file_to_mem(self, cache_key: str) -> TTSCache:
         """Load voice from file cache into memory.
 
-        This method is a coroutine.
+        The voice is pending in memory until it is loaded.
         """
-        if not (filename := self.file_cache.get(cache_key)):
-            raise HomeAssistantError(f"Key {cache_key} not in file cache!")
-
+        filename = self.file_cache[cache_key]
+        self.file_cache.move_to_end(cache_key)
+        self.stats.disk_hits += 1
+        self._async_schedule_index_save()
         voice_file = os.path.join(self.cache_dir, filename)
 
         def load_speech() -> bytes:
@@ -834,39 +1015,125 @@ class SpeechManager:
             with open(voice_file, "rb") as speech:
                 return speech.read()
 
-        try:
-            data = await self.hass.async_add_executor_job(load_speech)
-        except OSError as err:
-            del self.file_cache[cache_key]
-            raise HomeAssistantError(f"Can't read {voice_file}") from err
+        async def async_load_speech() -> bytes:
+            """Load a speech from filesystem into memory."""
+            try:
+                data = await self.hass.async_add_executor_job(load_speech)
+            except OSError as err:
+                self._async_remove_from_file_cache(cache_key)
+                raise HomeAssistantError(f"Can't read {voice_file}") from err
+
+            self._async_store_to_memcache(cache_key, filename, data)
+            return data
+
+        return self._async_store_pending_to_memcache(
+            cache_key, filename, async_load_speech()
+        )
 
-        self._async_store_to_memcache(cache_key, filename, data)
+    @callback
+    def _async_get_from_memcache(self, cache_key: str) -> TTSCache | None:
+        """Return the voice from memcache and mark it as the most recently used."""
+        if (cached := self.mem_cache.get(cache_key)) is None:
+            return None
+        self.mem_cache.move_to_end(cache_key)
+        cached["last_used"] = time.monotonic()
+        if cached["pending"]:
+            self.stats.shared += 1
+        else:
+            self.stats.memory_hits += 1
+        return cached
+
+    @callback
+    def _async_store_pending_to_memcache(
+        self, cache_key: str, filename: str, coro: Coroutine[Any, Any, bytes]
+    ) -> TTSCache:
+        """Store a pending voice to memcache.
+
+        Requests for the voice wait for the task instead
+        of generating or loading the voice again.
+        """
+        task = self.hass.async_create_task(coro, eager_start=False)
+
+        def handle_error(_future: asyncio.Future) -> None:
+            """Handle error."""
+            if (
+                task.exception()
+                and (cached := self.mem_cache.get(cache_key)) is not None
+                and cached["pending"] is task
+            ):
+                del self.mem_cache[cache_key]
+
+        task.add_done_callback(handle_error)
+
+        cached: TTSCache = {
+            "filename": filename,
+            "voice": b"",
+            "pending": task,
+            "last_used": time.monotonic(),
+        }
+        self.mem_cache[cache_key] = cached
+        self.mem_cache.move_to_end(cache_key)
+        return cached
 
     @callback
     def _async_store_to_memcache(
         self, cache_key: str, filename: str, data: bytes
     ) -> None:
-        """Store data to memcache and set timer to remove it."""
+        """Store data to memcache and evict the least recently used data."""
+        if (previous := self.mem_cache.pop(cache_key, None)) is not None:
+            self.mem_cache_bytes -= len(previous["voice"])
         self.mem_cache[cache_key] = {
             "filename": filename,
             "voice": data,
             "pending": None,
+            "last_used": time.monotonic(),
         }
+        self.mem_cache_bytes += len(data)
+        self._async_evict_memcache(cache_key)
 
-        @callback
-        def async_remove_from_mem(_: datetime) -> None:
-            """Cleanup memcache."""
-            self.mem_cache.pop(cache_key, None)
-
-        async_call_later(
-            self.hass,
-            self.time_memory,
-            HassJob(
-                async_remove_from_mem,
-                name="tts remove_from_mem",
-                cancel_on_shutdown=True,
-            ),
-        )
+    @callback
+    def _async_evict_memcache(self, keep: str | None = None) -> None:
+        """Evict the least recently used data from memcache.
+
+        Data is evicted while memcache is over its size or when
+        it was not used for longer than time_memory.
+        """
+        expired = time.monotonic() - self.time_memory
+        size = self.mem_cache_bytes
+        evicted: list[str] = []
+        for key, cached in self.mem_cache.items():
+            if size <= self.memory_cache_max_bytes and cached["last_used"] > expired:
+                break
+            if key != keep and not cached["pending"]:
+                evicted.append(key)
+                size -= len(cached["voice"])
+        for key in evicted:
+            del self.mem_cache[key]
+        self.mem_cache_bytes = size
+        self.stats.memory_evictions += len(evicted)
+        self._async_schedule_memcache_expiry()
+
+    @callback
+    def _async_schedule_memcache_expiry(self) -> None:
+        """Schedule evicting the least recently used data when it expires.
+
+        Pending voices are stored again once they are available.
+        """
+        if self._memcache_expiry_unsub is not None:
+            return
+        for cached in self.mem_cache.values():
+            if not cached["pending"]:
+                delay = cached["last_used"] + self.time_memory - time.monotonic()
+                self._memcache_expiry_unsub = async_call_later(
+                    self.hass, max(delay, 0), self._memcache_expiry_job
+                )
+                return
+
+    @callback
+    def _async_expire_memcache(self, _now: datetime) -> None:
+        """Evict the data from memcache that was not used for time_memory."""
+        self._memcache_expiry_unsub = None
+        self._async_evict_memcache()
 
     async def async_read_tts(self, filename: str) -> tuple[str | None, bytes]:
         """Read a voice file and return binary.
@@ -882,17 +1149,14 @@ class SpeechManager:
             record.group(1), record.group(2), record.group(3), record.group(4)
         )
 
-        if cache_key not in self.mem_cache:
+        if (cached := self._async_get_from_memcache(cache_key)) is None:
             if cache_key not in self.file_cache:
                 raise HomeAssistantError(f"{cache_key} not in cache!")
-            await self._async_file_to_mem(cache_key)
-
-        cached = self.mem_cache[cache_key]
-        if pending := cached.get("pending"):
-            await pending
-            cached = self.mem_cache[cache_key]
+            cached = self._async_file_to_mem(cache_key)
 
         content, _ = mimetypes.guess_type(filename)
+        if pending := cached["pending"]:
+            return content, await pending
         return content, cached["voice"]
 
     @staticmethod
@@ -958,6 +1222,14 @@ def _init_tts_cache_dir(hass: HomeAssistant, cache_dir: str) -> str:
     return cache_dir
 
 
+def _get_cache_dir_mtime(cache_dir: str) -> int | None:
+    """Return the mtime of the cache folder."""
+    try:
+        return os.stat(cache_dir).st_mtime_ns
+    except OSError:
+        return None
+
+
 def _get_cache_files(cache_dir: str) -> dict[str, str]:
     """Return a dict of given engine files."""
     cache = {}
@@ -1157,3 +1429,13 @@ def websocket_list_engine_voices(
     voices = {"voices": engine_instance.async_get_supported_voices(language)}
 
     connection.send_message(websocket_api.result_message(msg["id"], voices))
+
+
+@websocket_api.websocket_command({"type": "tts/cache/info"})
+@callback
+def websocket_cache_info(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Return the sizes and counters of the TTS cache."""
+    manager: SpeechManager = hass.data[DATA_TTS_MANAGER]
+    connection.send_result(msg["id"], manager.async_cache_info())
@@ -7,12 +7,17 @@ ATTR_OPTIONS = "options"
 
 CONF_CACHE = "cache"
 CONF_CACHE_DIR = "cache_dir"
+CONF_CACHE_MAX_SIZE = "cache_max_size"
 CONF_FIELDS = "fields"
+CONF_MEMORY_MAX_SIZE = "memory_max_size"
 CONF_TIME_MEMORY = "time_memory"
 
 DEFAULT_CACHE = True
 DEFAULT_CACHE_DIR = "tts"
 DEFAULT_TIME_MEMORY = 300
+# Maximum sizes of the caches in MB, 0 is no maximum for the file cache
+DEFAULT_MEMORY_MAX_SIZE = 32
+DEFAULT_CACHE_MAX_SIZE = 1024
 
 DOMAIN = "tts"
 
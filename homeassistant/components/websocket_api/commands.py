@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from functools import lru_cache, partial
 import json
@@ -51,11 +52,16 @@ from homeassistant.helpers.json import (
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import (
     IntegrationNotFound,
+    async_get_import_times,
     async_get_integration,
     async_get_integration_descriptions,
     async_get_integrations,
 )
-from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
+from homeassistant.setup import (
+    async_get_loaded_integrations,
+    async_get_setup_timeline,
+    async_get_setup_timings,
+)
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -64,6 +70,10 @@ from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
 
+# Bounds of the interval subscribers can ask entity changes to be merged over
+MIN_COALESCE_INTERVAL = 0.1
+MAX_COALESCE_INTERVAL = 60
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -81,7 +91,9 @@ def async_register_commands(
     async_reg(hass, handle_get_services)
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
+    async_reg(hass, handle_integration_import_info)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_setup_timeline)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
@@ -356,6 +368,11 @@ def _send_handle_get_states_response(
     connection: ActiveConnection, msg_id: int, serialized_states: list[bytes]
 ) -> None:
     """Send handle get states response."""
+    if connection.can_send_partial_results:
+        connection.send_message(
+            messages.partial_result_messages(msg_id, serialized_states)
+        )
+        return
     connection.send_message(
         construct_result_message(
             msg_id, b"".join((b"[", b",".join(serialized_states), b"]"))
@@ -363,6 +380,24 @@ def _send_handle_get_states_response(
     )
 
 
+@callback
+def _entity_change_allowed(
+    entity_ids: set[str], user: User, event: Event[EventStateChangedData]
+) -> bool:
+    """Return if an entity state changed event is subscribed and allowed."""
+    entity_id = event.data["entity_id"]
+    if entity_ids and entity_id not in entity_ids:
+        return False
+    # We have to lookup the permissions again because the user might have
+    # changed since the subscription was created.
+    permissions = user.permissions
+    return bool(
+        user.is_admin
+        or permissions.access_all_entities(POLICY_READ)
+        or permissions.check_entity(entity_id, POLICY_READ)
+    )
+
+
 @callback
 def _forward_entity_changes(
     send_message: Callable[[str | bytes | dict[str, Any] | Callable[[], str]], None],
@@ -372,19 +407,103 @@ def _forward_entity_changes(
     event: Event[EventStateChangedData],
 ) -> None:
     """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(event.data["entity_id"], POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+    if _entity_change_allowed(entity_ids, user, event):
+        send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+
+
+class _CoalescedEntityChanges:
+    """Merge the entity changes of a subscription over an interval.
+
+    A change is sent right away when nothing was sent during the last
+    interval, otherwise the changes are merged into one diff per entity
+    and sent when the interval is over. Clients then get at most one
+    message per interval however often the entities change.
+    """
+
+    __slots__ = (
+        "_loop",
+        "_send_message",
+        "_msg_id",
+        "_message_id_as_bytes",
+        "_interval",
+        "_pending",
+        "_next_send",
+        "_timer",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send_message: Callable[
+            [str | bytes | dict[str, Any] | Callable[[], str]], None
+        ],
+        msg_id: int,
+        interval: float,
+    ) -> None:
+        """Initialize the coalesced changes."""
+        self._loop = hass.loop
+        self._send_message = send_message
+        self._msg_id = msg_id
+        self._message_id_as_bytes = str(msg_id).encode()
+        self._interval = interval
+        # The first and the last pending event of each entity
+        self._pending: dict[
+            str,
+            tuple[Event[EventStateChangedData], Event[EventStateChangedData]],
+        ] = {}
+        self._next_send = 0.0
+        self._timer: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_add(
+        self, entity_ids: set[str], user: User, event: Event[EventStateChangedData]
+    ) -> None:
+        """Add an entity state changed event."""
+        if not _entity_change_allowed(entity_ids, user, event):
+            return
+        entity_id = event.data["entity_id"]
+        if (pending := self._pending.get(entity_id)) is not None:
+            self._pending[entity_id] = (pending[0], event)
+        else:
+            self._pending[entity_id] = (event, event)
+        if self._timer is not None:
+            return
+        if self._loop.time() >= self._next_send:
+            self._async_send()
+        else:
+            self._timer = self._loop.call_at(self._next_send, self._async_send)
+
+    @callback
+    def _async_send(self) -> None:
+        """Send the pending changes."""
+        self._timer = None
+        pending = self._pending
+        self._pending = {}
+        self._next_send = self._loop.time() + self._interval
+        if len(pending) == 1:
+            first, last = next(iter(pending.values()))
+            if first is last:
+                # The message of a single event is shared by all subscribers
+                self._send_message(
+                    messages.cached_state_diff_message(self._message_id_as_bytes, last)
+                )
+                return
+        if message := messages.coalesced_state_diff_message(
+            self._msg_id,
+            (
+                (first.data["old_state"], last.data["new_state"])
+                for first, last in pending.values()
+            ),
+        ):
+            self._send_message(message)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel sending the pending changes."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending.clear()
 
 
 @callback
@@ -392,6 +511,10 @@ def _forward_entity_changes(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("coalesce_interval"): vol.All(
+            vol.Coerce(float),
+            vol.Range(min=MIN_COALESCE_INTERVAL, max=MAX_COALESCE_INTERVAL),
+        ),
     }
 )
 def handle_subscribe_entities(
@@ -403,17 +526,34 @@ def handle_subscribe_entities(
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    message_id_as_bytes = str(msg["id"]).encode()
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            connection.user,
-            message_id_as_bytes,
-        ),
-    )
+    if (coalesce_interval := msg.get("coalesce_interval")) is None:
+        message_id_as_bytes = str(msg["id"]).encode()
+        connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            partial(
+                _forward_entity_changes,
+                connection.send_message,
+                entity_ids,
+                connection.user,
+                message_id_as_bytes,
+            ),
+        )
+    else:
+        coalesced = _CoalescedEntityChanges(
+            hass, connection.send_message, msg["id"], coalesce_interval
+        )
+        unsub = hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            partial(coalesced.async_add, entity_ids, connection.user),
+        )
+
+        @callback
+        def _unsub_coalesced() -> None:
+            """Unsubscribe and drop the pending changes."""
+            unsub()
+            coalesced.async_cancel()
+
+        connection.subscriptions[msg["id"]] = _unsub_coalesced
     connection.send_result(msg["id"])
 
     # JSON serialize here so we can recover if it blows up due to the
@@ -450,6 +590,11 @@ def _send_handle_entities_init_response(
     connection: ActiveConnection, msg_id: int, serialized_states: list[bytes]
 ) -> None:
     """Send handle entities init response."""
+    if connection.can_send_partial_results:
+        connection.send_message(
+            messages.entities_init_messages(msg_id, serialized_states)
+        )
+        return
     connection.send_message(
         b"".join(
             (
@@ -532,6 +677,21 @@ async def handle_manifest_get(
         connection.send_result(msg["id"], integration.manifest_json_fragment)
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/import_info"})
+def handle_integration_import_info(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle integration import times command."""
+    connection.send_result(
+        msg["id"],
+        [
+            {"module": module, "seconds": seconds}
+            for module, seconds in async_get_import_times(hass).items()
+        ],
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "integration/setup_info"})
 def handle_integration_setup_info(
@@ -547,6 +707,15 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/setup_timeline"})
+def handle_integration_setup_timeline(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle integration setup timeline command."""
+    connection.send_result(msg["id"], async_get_setup_timeline(hass))
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
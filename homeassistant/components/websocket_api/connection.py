@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Hashable
+from collections.abc import Callable, Hashable, Iterator
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -42,6 +42,7 @@ class ActiveConnection:
         "subscriptions",
         "last_id",
         "can_coalesce",
+        "can_send_partial_results",
         "supported_features",
         "handlers",
         "binary_handlers",
@@ -51,7 +52,7 @@ class ActiveConnection:
         self,
         logger: WebSocketAdapter,
         hass: HomeAssistant,
-        send_message: Callable[[bytes | str | dict[str, Any]], None],
+        send_message: Callable[[bytes | str | dict[str, Any] | Iterator[bytes]], None],
         user: User,
         refresh_token: RefreshToken,
     ) -> None:
@@ -64,6 +65,7 @@ class ActiveConnection:
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        self.can_send_partial_results = False
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema | Literal[False]]] = (
             self.hass.data[const.DOMAIN]
@@ -79,6 +81,7 @@ class ActiveConnection:
         """Set supported features."""
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
+        self.can_send_partial_results = const.FEATURE_PARTIAL_RESULTS in features
 
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
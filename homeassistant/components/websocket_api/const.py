@@ -51,3 +51,8 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+FEATURE_PARTIAL_RESULTS = "partial_results"
+
+# Approximate size of each message when a large result
+# is sent to the client in multiple partial messages.
+PARTIAL_RESULT_CHUNK_SIZE: Final = 256 * 1024
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import deque
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Iterator
 import datetime as dt
 from functools import partial
 import logging
@@ -97,7 +97,7 @@ class WebSocketHandler:
         # to where messages are queued. This allows the implementation
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
-        self._message_queue: deque[bytes | None] = deque()
+        self._message_queue: deque[bytes | Iterator[bytes] | None] = deque()
         self._ready_future: asyncio.Future[None] | None = None
 
     def __repr__(self) -> str:
@@ -145,6 +145,15 @@ class WebSocketHandler:
                 debug_enabled = is_enabled_for(logging_debug)
                 messages_remaining -= 1
 
+                if not isinstance(message, bytes):
+                    # Partial messages are generated as they are sent
+                    # so only one of them is held in memory at a time
+                    for partial_message in message:
+                        if debug_enabled:
+                            debug("%s: Sending %s", self.description, partial_message)
+                        await send_bytes_text(partial_message)
+                    continue
+
                 if (
                     not messages_remaining
                     or not (connection := self._connection)
@@ -157,8 +166,14 @@ class WebSocketHandler:
 
                 messages: list[bytes] = [message]
                 while messages_remaining:
+                    # Partial messages are sent on their own
+                    if (message := message_queue[0]) is not None and not isinstance(
+                        message, bytes
+                    ):
+                        break
+                    message_queue.popleft()
                     # A None message is used to signal the end of the connection
-                    if (message := message_queue.popleft()) is None:
+                    if message is None:
                         return
                     messages.append(message)
                     messages_remaining -= 1
@@ -185,9 +200,14 @@ class WebSocketHandler:
             self._peak_checker_unsub = None
 
     @callback
-    def _send_message(self, message: str | bytes | dict[str, Any]) -> None:
+    def _send_message(
+        self, message: str | bytes | dict[str, Any] | Iterator[bytes]
+    ) -> None:
         """Queue sending a message to the client.
 
+        An iterator of messages is queued as a single message and
+        the messages are generated when the writer sends them.
+
         Closes connection if the client is not reading the messages.
 
         Async friendly.
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from functools import lru_cache
 import logging
 from typing import Any, Final
@@ -78,6 +79,156 @@ def construct_result_message(iden: int, payload: bytes) -> bytes:
     )
 
 
+def partial_result_messages(
+    iden: int, fragments: Iterable[bytes], is_object: bool = False
+) -> Iterator[bytes]:
+    """Yield a success result split into messages of about the chunk size.
+
+    The fragments are the JSON of the items of a list result, or the
+    JSON of the "key":value pairs of an object result if is_object is set.
+
+    All messages except the last one are marked as partial. Clients
+    concatenate the partial list results or merge the partial object
+    results. When a key of an object result is in more than one message,
+    its value was split by dict_of_lists_fragments: clients concatenate
+    the lists of the key, or each list column of a dict of columns, in
+    the order of the messages. A result smaller than the chunk size is a
+    single message.
+    """
+    start, end = (b"{", b"}") if is_object else (b"[", b"]")
+    partial_prefix = b"".join(
+        (
+            b'{"id":',
+            str(iden).encode(),
+            b',"type":"result","success":true,"partial":true,"result":',
+            start,
+        )
+    )
+    partial_suffix = end + b"}"
+    for chunk, is_last in _chunk_fragments(fragments):
+        if is_last:
+            yield construct_result_message(iden, b"".join((start, chunk, end)))
+        else:
+            yield b"".join((partial_prefix, chunk, partial_suffix))
+
+
+def dict_of_lists_fragments(
+    result: dict[str, list[Any] | dict[str, list[Any]]],
+) -> Iterator[bytes]:
+    """Yield the "key":value fragments of a dict of lists for an object result.
+
+    The values are lists, or dicts of columns where every list column
+    has one item per row. Each key is removed from the dict once its
+    value is serialized, so what has been serialized can be released.
+
+    A value larger than the chunk size is split into fragments for the
+    same key which are each just over the chunk size, so they always
+    end up in different messages. Lists are split into consecutive
+    items; dicts of columns are split into the same consecutive rows of
+    every list column, and the other columns are only in the first
+    fragment.
+    """
+    for key in list(result):
+        value = result.pop(key)
+        encoded_key = json_bytes(key)
+        if isinstance(value, dict):
+            yield from _columns_fragments(encoded_key, value)
+        else:
+            yield from _list_fragments(encoded_key, value)
+
+
+def _list_fragments(encoded_key: bytes, items: list[Any]) -> Iterator[bytes]:
+    """Yield the "key":[items] fragments of a list split at the chunk size."""
+    piece: list[bytes] = []
+    piece_size = 0
+    split = False
+    for item in items:
+        piece.append(encoded_item := json_bytes(item))
+        piece_size += len(encoded_item) + 1
+        if piece_size > const.PARTIAL_RESULT_CHUNK_SIZE:
+            yield b"".join((encoded_key, b":[", b",".join(piece), b"]"))
+            piece = []
+            piece_size = 0
+            split = True
+    if piece or not split:
+        yield b"".join((encoded_key, b":[", b",".join(piece), b"]"))
+
+
+def _columns_fragments(
+    encoded_key: bytes, columns: dict[str, list[Any]]
+) -> Iterator[bytes]:
+    """Yield the "key":{columns} fragments of a dict of columns split by rows."""
+    rows = max(
+        (len(column) for column in columns.values() if isinstance(column, list)),
+        default=0,
+    )
+    row_columns = [
+        (json_bytes(name), column)
+        for name, column in columns.items()
+        if isinstance(column, list) and len(column) == rows
+    ]
+    other_columns: list[bytes] | None = [
+        b"".join((json_bytes(name), b":", json_bytes(value)))
+        for name, value in columns.items()
+        if not isinstance(value, list) or len(value) != rows
+    ]
+    pieces: list[list[bytes]] = [[] for _ in row_columns]
+    piece_size = 0
+
+    def _fragment() -> bytes:
+        """Return the fragment of the current rows of the columns."""
+        encoded_columns = [
+            b"".join((encoded_name, b":[", b",".join(piece), b"]"))
+            for (encoded_name, _), piece in zip(row_columns, pieces, strict=True)
+        ]
+        if other_columns:
+            encoded_columns[:0] = other_columns
+        return b"".join((encoded_key, b":{", b",".join(encoded_columns), b"}"))
+
+    for row in range(rows):
+        for (_, column), piece in zip(row_columns, pieces, strict=True):
+            piece.append(encoded_item := json_bytes(column[row]))
+            piece_size += len(encoded_item) + 1
+        if piece_size > const.PARTIAL_RESULT_CHUNK_SIZE:
+            yield _fragment()
+            for piece in pieces:
+                piece.clear()
+            piece_size = 0
+            other_columns = None
+    if piece_size or other_columns is not None:
+        yield _fragment()
+
+
+def entities_init_messages(iden: int, fragments: Iterable[bytes]) -> Iterator[bytes]:
+    """Yield the initial subscribe_entities states in messages of about the chunk size.
+
+    The fragments are the compressed "entity_id":state pairs. Each
+    message is an entity additions event like a state added event.
+    """
+    prefix = b"".join(
+        (b'{"id":', str(iden).encode(), b',"type":"event","event":{"a":{')
+    )
+    for chunk, _ in _chunk_fragments(fragments):
+        yield b"".join((prefix, chunk, b"}}}"))
+
+
+def _chunk_fragments(fragments: Iterable[bytes]) -> Iterator[tuple[bytes, bool]]:
+    """Join JSON fragments into chunks of about the partial result chunk size.
+
+    Yields the joined fragments and if it is the last chunk.
+    """
+    chunk: list[bytes] = []
+    chunk_size = 0
+    for fragment in fragments:
+        if chunk and chunk_size + len(fragment) > const.PARTIAL_RESULT_CHUNK_SIZE:
+            yield b",".join(chunk), False
+            chunk = []
+            chunk_size = 0
+        chunk.append(fragment)
+        chunk_size += len(fragment) + 1
+    yield b",".join(chunk), True
+
+
 def error_message(
     iden: int | None,
     code: str,
@@ -239,6 +390,41 @@ def _state_diff(
     return {ENTITY_EVENT_CHANGE: {new_state.entity_id: diff}}
 
 
+def coalesced_state_diff_message(
+    iden: int, changes: Iterable[tuple[State | None, State | None]]
+) -> bytes | None:
+    """Return an event message merging the changes of many entities.
+
+    Each change is the state of an entity the subscriber knows, and
+    the current state of the entity. Returns None if nothing changed.
+    """
+    added: dict[str, dict[str, Any]] = {}
+    changed: dict[str, Any] = {}
+    removed: list[str] = []
+    for old_state, new_state in changes:
+        if new_state is None:
+            if old_state is not None:
+                removed.append(old_state.entity_id)
+        elif old_state is None:
+            added[new_state.entity_id] = new_state.as_compressed_state
+        else:
+            entity_id = new_state.entity_id
+            diff = _state_diff(old_state, new_state)[ENTITY_EVENT_CHANGE][entity_id]
+            # Entities that ended up unchanged within the interval are dropped
+            if diff[STATE_DIFF_ADDITIONS] or STATE_DIFF_REMOVALS in diff:
+                changed[entity_id] = diff
+    event: dict[str, Any] = {}
+    if added:
+        event[ENTITY_EVENT_ADD] = added
+    if changed:
+        event[ENTITY_EVENT_CHANGE] = changed
+    if removed:
+        event[ENTITY_EVENT_REMOVE] = removed
+    if not event:
+        return None
+    return message_to_json_bytes(event_message(iden, event))
+
+
 def _message_to_json_bytes_or_none(message: dict[str, Any]) -> bytes | None:
     """Serialize a websocket message to json or return None."""
     try:
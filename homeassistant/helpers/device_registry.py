@@ -7,6 +7,7 @@ from collections.abc import Mapping
 from enum import StrEnum
 from functools import cached_property, lru_cache, partial
 import logging
+from operator import itemgetter
 import time
 from typing import TYPE_CHECKING, Any, Literal, TypedDict
 
@@ -578,6 +579,7 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_item_key=itemgetter("id"),
         )
 
     @callback
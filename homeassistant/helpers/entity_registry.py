@@ -16,6 +16,7 @@ from datetime import datetime, timedelta
 from enum import StrEnum
 from functools import cached_property
 import logging
+from operator import itemgetter
 import time
 from typing import TYPE_CHECKING, Any, Literal, NotRequired, TypedDict
 
@@ -679,6 +680,7 @@ class EntityRegistry(BaseRegistry):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal_item_key=itemgetter("id"),
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED,
@@ -4,12 +4,13 @@ from __future__ import annotations
 
 from collections.abc import Callable
 import fnmatch
+from functools import lru_cache
 import re
 
 import voluptuous as vol
 
 from homeassistant.const import CONF_DOMAINS, CONF_ENTITIES, CONF_EXCLUDE, CONF_INCLUDE
-from homeassistant.core import split_entity_id
+from homeassistant.core import MAX_EXPECTED_ENTITY_IDS, split_entity_id
 
 from . import config_validation as cv
 
@@ -22,6 +23,10 @@ CONF_EXCLUDE_ENTITIES = "exclude_entities"
 
 CONF_ENTITY_GLOBS = "entity_globs"
 
+# Filters that match domains or globs remember their results since
+# the same entity ids are filtered over and over again
+_cache_filter_results = lru_cache(maxsize=MAX_EXPECTED_ENTITY_IDS)
+
 
 class EntityFilter:
     """A entity filter."""
@@ -206,7 +211,7 @@ def _generate_filter_from_sets_and_pattern_lists(
             )
 
         # Return filter function for case 2
-        return entity_included
+        return _cache_filter_results(entity_included)
 
     # Case 3 - Only excludes
     # - Entity listed in exclude: exclude
@@ -223,7 +228,7 @@ def _generate_filter_from_sets_and_pattern_lists(
                 or (exclude_eg and exclude_eg.match(entity_id))
             )
 
-        return entity_not_excluded
+        return _cache_filter_results(entity_not_excluded)
 
     # Case 4 - Domain and/or glob includes (may also have excludes)
     # - Entity listed in entities include: include
@@ -247,7 +252,7 @@ def _generate_filter_from_sets_and_pattern_lists(
                 )
             )
 
-        return entity_filter_4a
+        return _cache_filter_results(entity_filter_4a)
 
     # Case 5 - Domain and/or glob excludes (no domain and/or glob includes)
     # - Entity listed in entities include: include
@@ -264,7 +269,7 @@ def _generate_filter_from_sets_and_pattern_lists(
                 return entity_id in include_e
             return entity_id not in exclude_e
 
-        return entity_filter_4b
+        return _cache_filter_results(entity_filter_4b)
 
     # Case 6 - No Domain and/or glob includes or excludes
     # - Entity listed in entities include: include
@@ -50,6 +50,7 @@ from .entity_registry import (
     EventEntityRegistryUpdatedData,
 )
 from .ratelimit import KeyedRateLimit
+from .singleton import singleton
 from .sun import get_astral_event_next
 from .template import RenderInfo, Template, result_as_boolean
 from .typing import TemplateVarsType
@@ -64,6 +65,11 @@ TRACK_STATE_ADDED_DOMAIN_LISTENER: HassKey[Callable[[], None]] = HassKey(
     "track_state_added_domain_listener"
 )
 
+TRACK_STATE_CHANGE_DOMAIN_CALLBACKS = "track_state_change_domain_callbacks"
+TRACK_STATE_CHANGE_DOMAIN_LISTENER: HassKey[Callable[[], None]] = HassKey(
+    "track_state_change_domain_listener"
+)
+
 TRACK_STATE_REMOVED_DOMAIN_CALLBACKS = "track_state_removed_domain_callbacks"
 TRACK_STATE_REMOVED_DOMAIN_LISTENER: HassKey[Callable[[], None]] = HassKey(
     "track_state_removed_domain_listener"
@@ -79,6 +85,10 @@ TRACK_DEVICE_REGISTRY_UPDATED_LISTENER: HassKey[Callable[[], None]] = HassKey(
     "track_device_registry_updated_listener"
 )
 
+TRACK_STATE_CHANGE_LISTENER_STATS: HassKey[StateChangeListenerStats] = HassKey(
+    "track_state_change_listener_stats"
+)
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -118,6 +128,42 @@ class _KeyedEventTracker(Generic[_TypedDictT]):
         ],
         bool,
     ]
+    record_fan_out: bool = False
+
+
+@dataclass(slots=True)
+class StateChangeListenerStats:
+    """Class for keeping counters of state change listeners.
+
+    subscribed: Entity and domain listeners added by filtered trackers
+    unsubscribed: Entity and domain listeners removed by filtered trackers
+    events: State change events dispatched to entity or domain listeners
+    jobs: Listener jobs run for the dispatched events
+    max_fan_out: Largest number of listener jobs run for a single event
+    """
+
+    subscribed: int = 0
+    unsubscribed: int = 0
+    events: int = 0
+    jobs: int = 0
+    max_fan_out: int = 0
+
+    @callback
+    def async_record_fan_out(self, jobs: int) -> None:
+        """Record the number of listener jobs run for an event."""
+        self.events += 1
+        self.jobs += jobs
+        if jobs > self.max_fan_out:
+            self.max_fan_out = jobs
+
+
+@callback
+@singleton(TRACK_STATE_CHANGE_LISTENER_STATS)
+def async_get_state_change_listener_stats(
+    hass: HomeAssistant,
+) -> StateChangeListenerStats:
+    """Return the state change listener counters."""
+    return StateChangeListenerStats()
 
 
 @dataclass(slots=True)
@@ -328,10 +374,13 @@ def _async_dispatch_entity_id_event(
     hass: HomeAssistant,
     callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
     event: Event[EventStateChangedData],
+    stats: StateChangeListenerStats | None = None,
 ) -> None:
     """Dispatch to listeners."""
     if not (callbacks_list := callbacks.get(event.data["entity_id"])):
         return
+    if stats is not None:
+        stats.async_record_fan_out(len(callbacks_list))
     for job in callbacks_list.copy():
         try:
             hass.async_run_hass_job(job, event)
@@ -359,6 +408,7 @@ _KEYED_TRACK_STATE_CHANGE = _KeyedEventTracker(
     event_type=EVENT_STATE_CHANGED,
     dispatcher_callable=_async_dispatch_entity_id_event,
     filter_callable=_async_state_change_filter,
+    record_fan_out=True,
 )
 
 
@@ -426,9 +476,19 @@ def _async_track_event(
 
     listeners_key = tracker.listeners_key
     if tracker.listeners_key not in hass_data:
+        dispatcher = (
+            partial(
+                tracker.dispatcher_callable,
+                hass,
+                callbacks,
+                stats=async_get_state_change_listener_stats(hass),
+            )
+            if tracker.record_fan_out
+            else partial(tracker.dispatcher_callable, hass, callbacks)
+        )
         hass_data[tracker.listeners_key] = hass.bus.async_listen(
             tracker.event_type,
-            partial(tracker.dispatcher_callable, hass, callbacks),
+            dispatcher,
             event_filter=partial(tracker.filter_callable, hass, callbacks),
         )
 
@@ -571,10 +631,14 @@ def _async_dispatch_domain_event(
     hass: HomeAssistant,
     callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
     event: Event[EventStateChangedData],
+    stats: StateChangeListenerStats | None = None,
 ) -> None:
     """Dispatch domain event listeners."""
     domain = split_entity_id(event.data["entity_id"])[0]
-    for job in callbacks.get(domain, []) + callbacks.get(MATCH_ALL, []):
+    jobs = callbacks.get(domain, []) + callbacks.get(MATCH_ALL, [])
+    if stats is not None and jobs:
+        stats.async_record_fan_out(len(jobs))
+    for job in jobs:
         try:
             hass.async_run_hass_job(job, event)
         except Exception:
@@ -631,6 +695,62 @@ def _async_track_state_added_domain(
     )
 
 
+@callback
+def _async_domain_changed_filter(
+    hass: HomeAssistant,
+    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
+    event_data: EventStateChangedData,
+) -> bool:
+    """Filter state changes by domain."""
+    return (
+        MATCH_ALL in callbacks
+        or split_entity_id(event_data["entity_id"])[0] in callbacks
+    )
+
+
+_KEYED_TRACK_STATE_CHANGE_DOMAIN = _KeyedEventTracker(
+    listeners_key=TRACK_STATE_CHANGE_DOMAIN_LISTENER,
+    callbacks_key=TRACK_STATE_CHANGE_DOMAIN_CALLBACKS,
+    event_type=EVENT_STATE_CHANGED,
+    dispatcher_callable=_async_dispatch_domain_event,
+    filter_callable=_async_domain_changed_filter,
+    record_fan_out=True,
+)
+
+
+@bind_hass
+def async_track_state_change_domain(
+    hass: HomeAssistant,
+    domains: str | Iterable[str],
+    action: Callable[[Event[EventStateChangedData]], Any],
+    job_type: HassJobType | None = None,
+) -> CALLBACK_TYPE:
+    """Track all state change events of the entities in domains.
+
+    This includes entities being added to or removed from the domains.
+
+    Unlike tracking every entity_id of the domains with
+    async_track_state_change_event, the listener does not
+    have to be updated when entities are added to the domains.
+    """
+    if not (domains := _async_string_to_lower_list(domains)):
+        return _remove_empty_listener
+    return _async_track_state_change_domain(hass, domains, action, job_type)
+
+
+@bind_hass
+def _async_track_state_change_domain(
+    hass: HomeAssistant,
+    domains: str | Iterable[str],
+    action: Callable[[Event[EventStateChangedData]], Any],
+    job_type: HassJobType | None,
+) -> CALLBACK_TYPE:
+    """async_track_state_change_domain without lowercasing."""
+    return _async_track_event(
+        _KEYED_TRACK_STATE_CHANGE_DOMAIN, hass, domains, action, job_type
+    )
+
+
 @callback
 def _async_domain_removed_filter(
     hass: HomeAssistant,
@@ -690,7 +810,9 @@ class _TrackStateChangeFiltered:
             action, f"track state change filtered {track_states}"
         )
         self._listeners: dict[str, Callable[[], None]] = {}
+        self._entity_listeners: dict[str, Callable[[], None]] = {}
         self._last_track_states: TrackStates = track_states
+        self._stats = async_get_state_change_listener_stats(hass)
 
     @callback
     def async_setup(self) -> None:
@@ -709,7 +831,7 @@ class _TrackStateChangeFiltered:
             return
 
         self._setup_domains_listener(track_states.domains)
-        self._setup_entities_listener(track_states.domains, track_states.entities)
+        self._update_entities_listeners(track_states.domains, track_states.entities)
 
     @property
     def listeners(self) -> dict[str, bool | set[str]]:
@@ -733,7 +855,7 @@ class _TrackStateChangeFiltered:
             if had_all_listener:
                 return
             self._cancel_listener(_DOMAINS_LISTENER)
-            self._cancel_listener(_ENTITIES_LISTENER)
+            self._cancel_entities_listeners()
             self._setup_all_listener()
             return
 
@@ -752,8 +874,7 @@ class _TrackStateChangeFiltered:
             or domains_changed
             or new_track_states.entities != last_track_states.entities
         ):
-            self._cancel_listener(_ENTITIES_LISTENER)
-            self._setup_entities_listener(
+            self._update_entities_listeners(
                 new_track_states.domains, new_track_states.entities
             )
 
@@ -762,6 +883,7 @@ class _TrackStateChangeFiltered:
         """Cancel the listeners."""
         for key in list(self._listeners):
             self._listeners.pop(key)()
+        self._cancel_entities_listeners()
 
     @callback
     def _cancel_listener(self, listener_name: str) -> None:
@@ -769,43 +891,58 @@ class _TrackStateChangeFiltered:
             return
 
         self._listeners.pop(listener_name)()
+        self._stats.unsubscribed += 1
 
     @callback
-    def _setup_entities_listener(self, domains: set[str], entities: set[str]) -> None:
-        if domains:
-            entities = entities.copy()
-            entities.update(self.hass.states.async_entity_ids(domains))
-
-        # Entities has changed to none
-        if not entities:
-            return
-
-        self._listeners[_ENTITIES_LISTENER] = _async_track_state_change_event(
-            self.hass, entities, self._action, self._action_as_hassjob.job_type
-        )
+    def _cancel_entities_listeners(self) -> None:
+        entity_listeners = self._entity_listeners
+        self._stats.unsubscribed += len(entity_listeners)
+        for remove in entity_listeners.values():
+            remove()
+        entity_listeners.clear()
 
     @callback
-    def _state_added(self, event: Event[EventStateChangedData]) -> None:
-        self._cancel_listener(_ENTITIES_LISTENER)
-        self._setup_entities_listener(
-            self._last_track_states.domains, self._last_track_states.entities
-        )
-        self.hass.async_run_hass_job(self._action_as_hassjob, event)
+    def _update_entities_listeners(self, domains: set[str], entities: set[str]) -> None:
+        """Update the entity listeners to the entities outside the domains.
+
+        Entities of the tracked domains are covered by the domains
+        listener, so only the difference to the current entity
+        listeners is subscribed or unsubscribed.
+        """
+        if not entities:
+            entities = set()
+        elif domains:
+            entities = {
+                entity_id
+                for entity_id in entities
+                if split_entity_id(entity_id)[0] not in domains
+            }
+        entity_listeners = self._entity_listeners
+        for entity_id in entity_listeners.keys() - entities:
+            entity_listeners.pop(entity_id)()
+            self._stats.unsubscribed += 1
+        for entity_id in entities.difference(entity_listeners):
+            entity_listeners[entity_id] = _async_track_state_change_event(
+                self.hass, entity_id, self._action, self._action_as_hassjob.job_type
+            )
+            self._stats.subscribed += 1
 
     @callback
     def _setup_domains_listener(self, domains: set[str]) -> None:
         if not domains:
             return
 
-        self._listeners[_DOMAINS_LISTENER] = _async_track_state_added_domain(
-            self.hass, domains, self._state_added, HassJobType.Callback
+        self._listeners[_DOMAINS_LISTENER] = _async_track_state_change_domain(
+            self.hass, domains, self._action, self._action_as_hassjob.job_type
         )
+        self._stats.subscribed += 1
 
     @callback
     def _setup_all_listener(self) -> None:
         self._listeners[_ALL_LISTENER] = self.hass.bus.async_listen(
             EVENT_STATE_CHANGED, self._action
         )
+        self._stats.subscribed += 1
 
 
 @callback
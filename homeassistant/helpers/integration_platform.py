@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
 from functools import partial
 import logging
 from types import ModuleType
@@ -36,6 +36,9 @@ class IntegrationPlatform:
     platform_name: str
     process_job: HassJob[[HomeAssistant, str, Any], Awaitable[None] | None]
     seen_components: set[str]
+    lazy: bool = False
+    # Components whose lazy platform has not been imported yet
+    pending_components: set[str] = field(default_factory=set)
 
 
 @callback
@@ -67,6 +70,17 @@ def _async_integration_platform_component_loaded(
     if not platforms_that_exist:
         return
 
+    # Lazy platforms are imported when they are first used
+    platforms_to_load: list[str] = []
+    for platform_name in platforms_that_exist:
+        integration_platform = integration_platforms_by_name[platform_name]
+        if integration_platform.lazy:
+            integration_platform.pending_components.add(component_name)
+        else:
+            platforms_to_load.append(platform_name)
+    if not (platforms_that_exist := platforms_to_load):
+        return
+
     # If everything is already loaded, we can avoid creating a task.
     can_use_cache = True
     platforms: dict[str, ModuleType] = {}
@@ -160,8 +174,14 @@ async def async_process_integration_platforms(
     # Any = platform.
     process_platform: Callable[[HomeAssistant, str, Any], Awaitable[None] | None],
     wait_for_platforms: bool = False,
+    lazy: bool = False,
 ) -> None:
-    """Process a specific platform for all current and future loaded integrations."""
+    """Process a specific platform for all current and future loaded integrations.
+
+    Lazy platforms are not imported when integrations are loaded, they
+    are imported and processed by async_load_integration_platforms
+    when they are first used.
+    """
     if DATA_INTEGRATION_PLATFORMS not in hass.data:
         integration_platforms = hass.data[DATA_INTEGRATION_PLATFORMS] = []
         hass.bus.async_listen(
@@ -175,7 +195,6 @@ async def async_process_integration_platforms(
     else:
         integration_platforms = hass.data[DATA_INTEGRATION_PLATFORMS]
 
-    async_register_preload_platform(hass, platform_name)
     top_level_components = hass.config.top_level_components.copy()
     process_job = HassJob(
         catch_log_exception(
@@ -185,13 +204,16 @@ async def async_process_integration_platforms(
         f"process_platform {platform_name}",
     )
     integration_platform = IntegrationPlatform(
-        platform_name, process_job, top_level_components
+        platform_name, process_job, top_level_components, lazy
     )
+    integration_platforms.append(integration_platform)
+    if lazy:
+        integration_platform.pending_components.update(top_level_components)
+        return
     # Tell the loader that it should try to pre-load the integration
     # for any future components that are loaded so we can reduce the
     # amount of import executor usage.
     async_register_preload_platform(hass, platform_name)
-    integration_platforms.append(integration_platform)
     if not top_level_components:
         return
 
@@ -256,3 +278,27 @@ async def _async_process_integration_platforms(
 
     if futures:
         await asyncio.gather(*futures)
+
+
+async def async_load_integration_platforms(
+    hass: HomeAssistant, platform_name: str, domains: Iterable[str] | None = None
+) -> None:
+    """Import and process lazy platforms that have not been used yet.
+
+    Only the platforms of the given domains are loaded, or all of them
+    if no domains are given.
+    """
+    for integration_platform in hass.data.get(DATA_INTEGRATION_PLATFORMS, ()):
+        if integration_platform.platform_name != platform_name or not (
+            pending := integration_platform.pending_components
+        ):
+            continue
+        components = (
+            pending.copy() if domains is None else pending.intersection(domains)
+        )
+        if not components:
+            continue
+        await _async_process_integration_platforms(
+            hass, platform_name, components, integration_platform.process_job
+        )
+        pending.difference_update(components)
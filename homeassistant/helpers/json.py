@@ -169,8 +169,14 @@ def save_json(
     *,
     encoder: type[json.JSONEncoder] | None = None,
     atomic_writes: bool = False,
+    sync_directory: bool = True,
 ) -> None:
-    """Save JSON data to a file."""
+    """Save JSON data to a file.
+
+    Atomic writes are flushed to disk. Without sync_directory the
+    caller has to fsync the directory of the file, which allows
+    syncing it once for many files.
+    """
     dump: Callable[[Any], Any]
     try:
         # For backwards compatibility, if they pass in the
@@ -194,8 +200,10 @@ def save_json(
         _LOGGER.error(msg)
         raise SerializationError(msg) from error
 
-    method = write_utf8_file_atomic if atomic_writes else write_utf8_file
-    method(filename, json_data, private, mode=mode)
+    if atomic_writes and sync_directory:
+        write_utf8_file_atomic(filename, json_data, private, mode=mode)
+    else:
+        write_utf8_file(filename, json_data, private, mode=mode, fsync=atomic_writes)
 
 
 def find_paths_unserializable_data(
@@ -35,6 +35,10 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long the last seen time of a current entity is kept between dumps,
+# unchanged states are then not written again to the storage journal
+LAST_SEEN_REFRESH_INTERVAL = timedelta(hours=1)
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -96,6 +100,11 @@ class StoredState:
         )
 
 
+def _stored_state_key(item: dict[str, Any]) -> str:
+    """Return the key of a stored state in the storage journal."""
+    return item["state"]["entity_id"]  # type: ignore[no-any-return]
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     await async_get(hass).async_setup()
@@ -135,10 +144,15 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store = Store[list[dict[str, Any]]](
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass,
+            STORAGE_VERSION,
+            STORAGE_KEY,
+            encoder=JSONEncoder,
+            journal_item_key=_stored_state_key,
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        self._last_seen: dict[str, datetime] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -188,15 +202,21 @@ class RestoreStateData:
         }
 
         # Start with the currently registered states
-        stored_states = [
-            StoredState(
-                current_states_by_entity_id[entity_id],
-                entity.extra_restore_state_data,
-                now,
+        stored_states: list[StoredState] = []
+        previous_last_seen = self._last_seen
+        last_seen: dict[str, datetime] = {}
+        refresh_time = now - LAST_SEEN_REFRESH_INTERVAL
+        for entity_id, entity in self.entities.items():
+            if (state := current_states_by_entity_id.get(entity_id)) is None:
+                continue
+            seen = previous_last_seen.get(entity_id)
+            if seen is None or seen < refresh_time:
+                seen = now
+            last_seen[entity_id] = seen
+            stored_states.append(
+                StoredState(state, entity.extra_restore_state_data, seen)
             )
-            for entity_id, entity in self.entities.items()
-            if entity_id in current_states_by_entity_id
-        ]
+        self._last_seen = last_seen
         expiration_time = now - STATE_EXPIRATION
 
         for entity_id, stored_state in self.last_states.items():
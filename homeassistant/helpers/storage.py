@@ -6,12 +6,14 @@ import asyncio
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+from dataclasses import asdict, dataclass
 from functools import cached_property
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
 from pathlib import Path
+import time
 from typing import Any
 
 from homeassistant.const import (
@@ -31,8 +33,9 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import WriteError, fsync_directory
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.ulid import ulid_now
 
 from . import json as json_helper
 
@@ -48,6 +51,11 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+# The file is written again instead of appending to the journal
+# once the journal is larger than this ratio of the file size
+JOURNAL_COMPACT_RATIO = 0.5
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -89,6 +97,30 @@ async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
     return config
 
 
+@dataclass(slots=True)
+class StoreWriteStats:
+    """Write statistics of a store."""
+
+    writes: int = 0
+    """Writes of the file or its journal."""
+    bytes_written: int = 0
+    """Bytes written to the file or its journal."""
+    seconds: float = 0
+    """Time spent serializing and writing."""
+    max_seconds: float = 0
+    """Longest time spent on a single write."""
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the statistics as a dict."""
+        return asdict(self)
+
+
+@callback
+def async_get_write_stats(hass: HomeAssistant) -> dict[str, StoreWriteStats]:
+    """Return the write statistics of the stores by key."""
+    return get_internal_store_manager(hass).write_stats
+
+
 def get_internal_store_manager(hass: HomeAssistant) -> _StoreManager:
     """Get the store manager.
 
@@ -106,6 +138,12 @@ class _StoreManager:
     """Class to help storing data.
 
     The store manager is used to cache and manage storage files.
+
+    It also writes the stores. The stores that are due for a write
+    in the same iteration of the event loop, or while a previous
+    batch is being written, are written by a single executor job, and
+    the atomic writes in a batch share a single fsync of the storage
+    directory.
     """
 
     def __init__(self, hass: HomeAssistant) -> None:
@@ -116,6 +154,12 @@ class _StoreManager:
         self._data_preload: dict[str, json_util.JsonValueType] = {}
         self._storage_path: Path = Path(hass.config.config_dir).joinpath(STORAGE_DIR)
         self._cancel_cleanup: asyncio.TimerHandle | None = None
+        self._pending_writes: list[
+            tuple[Store, str, dict[str, Any], asyncio.Future[None]]
+        ] = []
+        self._write_task: asyncio.Task[None] | None = None
+        self.write_stats: dict[str, StoreWriteStats] = {}
+        self.write_batches = 0
 
     async def async_initialize(self) -> None:
         """Initialize the storage manager."""
@@ -159,6 +203,11 @@ class _StoreManager:
             _LOGGER.debug("%s: Cache miss", key)
             return None
 
+        # The preloaded data misses the changes in the journal
+        if f"{key}{JOURNAL_SUFFIX}" in self._files:
+            _LOGGER.debug("%s: Cache miss, journal exists", key)
+            return None
+
         # If async_initialize has been called and the key is not in self._files
         # then the file does not exist
         if key not in self._files:
@@ -225,6 +274,311 @@ class _StoreManager:
         if self._storage_path.exists():
             self._files = set(os.listdir(self._storage_path))
 
+    async def async_write(self, store: Store, path: str, data: dict[str, Any]) -> None:
+        """Write the data of a store with the next batch of writes."""
+        future: asyncio.Future[None] = self._hass.loop.create_future()
+        self._pending_writes.append((store, path, data, future))
+        if self._write_task is None:
+            # The task starts in the next iteration of the event loop
+            # so the stores that are due in this iteration join the batch
+            self._write_task = self._hass.async_create_task_internal(
+                self._async_write_batches(), "storage write", eager_start=False
+            )
+        await future
+
+    async def _async_write_batches(self) -> None:
+        """Write the pending writes until there are none left."""
+        writes: list[tuple[Store, str, dict[str, Any], asyncio.Future[None]]] = []
+        try:
+            while writes := self._pending_writes:
+                self._pending_writes = []
+                self.write_batches += 1
+                results = await self._hass.async_add_executor_job(
+                    self._write_batch, writes
+                )
+                for (store, _, _, future), (result, size, seconds) in zip(
+                    writes, results, strict=True
+                ):
+                    if size:
+                        stats = self.write_stats.get(store.key)
+                        if stats is None:
+                            stats = self.write_stats[store.key] = StoreWriteStats()
+                        stats.writes += 1
+                        stats.bytes_written += size
+                        stats.seconds += seconds
+                        stats.max_seconds = max(stats.max_seconds, seconds)
+                    if future.done():
+                        continue
+                    if result is None:
+                        future.set_result(None)
+                    else:
+                        future.set_exception(result)
+        finally:
+            self._write_task = None
+            # Do not leave the stores waiting if the task was cancelled
+            for _, _, _, future in (*writes, *self._pending_writes):
+                future.cancel()
+            self._pending_writes = []
+
+    def _write_batch(
+        self, writes: list[tuple[Store, str, dict[str, Any], asyncio.Future[None]]]
+    ) -> list[tuple[Exception | None, int, float]]:
+        """Write a batch of stores.
+
+        Returns the error, the number of bytes written and the
+        time it took for each write.
+        """
+        results: list[tuple[Exception | None, int, float]] = []
+        sync_directories: set[str] = set()
+        for store, path, data, _ in writes:
+            start = time.monotonic()
+            try:
+                size = store._write_data(path, data, sync_directory=False)  # noqa: SLF001
+            except Exception as err:  # noqa: BLE001
+                results.append((err, 0, 0))
+                continue
+            results.append((None, size, time.monotonic() - start))
+            if size and store._atomic_writes:  # noqa: SLF001
+                sync_directories.add(os.path.dirname(path))
+        for directory in sync_directories:
+            try:
+                fsync_directory(directory)
+            except OSError as err:
+                _LOGGER.error("Error syncing directory %s: %s", directory, err)
+        return results
+
+
+class _StoreJournal:
+    """Append the changes to the data of a store to a journal next to its file.
+
+    The stored data must be a list of dicts or a dict of such lists,
+    item_key returns the key identifying a dict in its list. The file is
+    only written again when the journal grows too large, when the
+    version changes and at the final write, leaving a plain JSON file
+    behind when Home Assistant stops.
+
+    The journal is only trusted on load when it was started from the
+    file, the file keeps the id of the journal base to check it.
+    """
+
+    __slots__ = (
+        "path",
+        "item_key",
+        "base",
+        "version",
+        "minor_version",
+        "items",
+        "values",
+        "file_size",
+        "size",
+    )
+
+    def __init__(self, path: str, item_key: Callable[[Any], str]) -> None:
+        """Initialize the journal."""
+        self.path = path
+        self.item_key = item_key
+        # The id of the file the journal appends to, None until the
+        # file is written by this journal and the journal can be used
+        self.base: str | None = None
+        self.version: int | None = None
+        self.minor_version: int | None = None
+        # The JSON of the stored items and values mapped to their keys
+        self.items: dict[str, dict[bytes, str]] = {}
+        self.values: dict[str, bytes] = {}
+        self.file_size = 0
+        self.size = 0
+
+    def load(self, path: str) -> json_util.JsonValueType:
+        """Load the file and apply the changes in the journal."""
+        data = json_util.load_json(path)
+        if data and isinstance(data, dict):
+            self._replay(data)
+        return data
+
+    def _replay(self, data: dict[str, Any]) -> None:
+        """Apply the changes in the journal to the data loaded from the file."""
+        try:
+            with open(self.path, "rb") as fdesc:
+                lines = fdesc.read().splitlines()
+        except FileNotFoundError:
+            return
+
+        base = data.get("journal")
+        stored = data["data"]
+        item_key = self.item_key
+        collections: dict[str, dict[str, Any]] = {}
+
+        def get_collection(name: str) -> dict[str, Any]:
+            """Return the items of a list by key."""
+            if (items := collections.get(name)) is None:
+                stored_items = stored if name == "" else stored.get(name, [])
+                items = collections[name] = {
+                    item_key(item): item for item in stored_items
+                }
+            return items
+
+        for line in lines:
+            try:
+                record = json_util.json_loads_object(line)
+            except ValueError:
+                # The last change was not completely written
+                _LOGGER.warning("Ignoring incomplete change in %s", self.path)
+                break
+            if record["base"] != base:
+                continue
+            data["version"] = record["version"]
+            data["minor_version"] = record["minor_version"]
+            for name, keys in record["remove"].items():
+                items = get_collection(name)
+                for key in keys:
+                    items.pop(key, None)
+            for name, changed in record["set"].items():
+                items = get_collection(name)
+                for item in changed:
+                    items[item_key(item)] = item
+            for name, value in record["values"].items():
+                stored[name] = value
+
+        for name, items in collections.items():
+            if name == "":
+                data["data"] = list(items.values())
+            else:
+                stored[name] = list(items.values())
+
+    def _state(
+        self, stored: Any
+    ) -> tuple[dict[str, dict[bytes, str]], dict[str, bytes]] | None:
+        """Return the JSON of the items and values mapped to their keys.
+
+        Returns None if the data can't be journaled.
+        """
+        collections: dict[str, list[Any]] = {}
+        values: dict[str, bytes] = {}
+        items: dict[str, dict[bytes, str]] = {}
+        try:
+            if isinstance(stored, list):
+                collections[""] = stored
+            elif isinstance(stored, dict):
+                for name, value in stored.items():
+                    if isinstance(value, list):
+                        collections[name] = value
+                    else:
+                        values[name] = json_helper.json_bytes(value)
+            else:
+                return None
+
+            for name, collection in collections.items():
+                previous = self.items.get(name, {})
+                state: dict[bytes, str] = {}
+                for item in collection:
+                    contents = json_helper.json_bytes(item)
+                    # Only the items that changed are decoded to get their key
+                    if (key := previous.get(contents)) is None:
+                        key = self.item_key(json_util.json_loads(contents))
+                    state[contents] = key
+                if len(set(state.values())) != len(collection):
+                    # Duplicate items or keys can't be told apart in the journal
+                    return None
+                items[name] = state
+        except (KeyError, TypeError, ValueError):
+            return None
+        return items, values
+
+    def prepare_write(self, data: dict[str, Any]) -> None:
+        """Prepare writing the file from the data."""
+        self.base = None
+        data["journal"] = ulid_now()
+
+    def written(self, path: str, data: dict[str, Any]) -> None:
+        """Start a new journal after the file was written."""
+        with suppress(FileNotFoundError):
+            os.unlink(self.path)
+        self.size = 0
+        if (state := self._state(data["data"])) is None:
+            self.items = {}
+            self.values = {}
+            return
+        self.items, self.values = state
+        self.file_size = os.path.getsize(path)
+        self.version = data["version"]
+        self.minor_version = data["minor_version"]
+        self.base = data["journal"]
+
+    def append(self, data: dict[str, Any], private: bool, fsync: bool) -> bool:
+        """Append the changes to the journal.
+
+        Returns False if the file must be written instead.
+        """
+        if (
+            self.base is None
+            or self.size > self.file_size * JOURNAL_COMPACT_RATIO
+            or data["version"] != self.version
+            or data["minor_version"] != self.minor_version
+        ):
+            return False
+        if (state := self._state(data["data"])) is None:
+            return False
+        items, values = state
+        if items.keys() != self.items.keys() or values.keys() != self.values.keys():
+            return False
+
+        record_set: dict[str, list[json_helper.json_fragment]] = {}
+        record_remove: dict[str, list[str]] = {}
+        for name, state_items in items.items():
+            previous = self.items[name]
+            if changed := [
+                json_helper.json_fragment(contents)
+                for contents in state_items
+                if contents not in previous
+            ]:
+                record_set[name] = changed
+            keys = set(state_items.values())
+            if removed := [key for key in previous.values() if key not in keys]:
+                record_remove[name] = removed
+        record_values = {
+            name: json_helper.json_fragment(contents)
+            for name, contents in values.items()
+            if contents != self.values[name]
+        }
+
+        if record_set or record_remove or record_values:
+            line = (
+                json_helper.json_bytes(
+                    {
+                        "base": self.base,
+                        "version": self.version,
+                        "minor_version": self.minor_version,
+                        "set": record_set,
+                        "remove": record_remove,
+                        "values": record_values,
+                    }
+                )
+                + b"\n"
+            )
+            try:
+                fd = os.open(
+                    self.path,
+                    os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                    0o600 if private else 0o644,
+                )
+                try:
+                    os.write(fd, line)
+                    if fsync:
+                        os.fsync(fd)
+                finally:
+                    os.close(fd)
+            except OSError as error:
+                # A partial change is ignored when loading, but the
+                # changes after it would be too
+                self.base = None
+                _LOGGER.exception("Saving file failed: %s", self.path)
+                raise WriteError(error) from error
+            self.size += len(line)
+
+        self.items = items
+        self.values = values
+        return True
+
 
 @bind_hass
 class Store[_T: Mapping[str, Any] | Sequence[Any]]:
@@ -241,8 +595,13 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal_item_key: Callable[[Any], str] | None = None,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        When journal_item_key is passed, saves append the changed items to
+        a journal instead of writing the whole file, see _StoreJournal.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -258,6 +617,13 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal: _StoreJournal | None = None
+        if journal_item_key is not None and (
+            encoder is None or encoder is json_helper.JSONEncoder
+        ):
+            self._journal = _StoreJournal(
+                f"{self.path}{JOURNAL_SUFFIX}", journal_item_key
+            )
 
     @cached_property
     def path(self):
@@ -326,10 +692,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if not exists:
                 return None
         else:
+            load_func = (
+                json_util.load_json if self._journal is None else self._journal.load
+            )
             try:
-                data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
-                )
+                data = await self.hass.async_add_executor_job(load_func, self.path)
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
                     # If we have a JSONDecodeError, it means the file is corrupt.
@@ -517,6 +884,15 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
+        if (journal := self._journal) is not None and journal.base is not None:
+            # Write the whole file to leave no journal behind
+            async with self._write_lock:
+                if self._data is None and journal.size and not self._read_only:
+                    if data := await self.hass.async_add_executor_job(
+                        journal.load, self.path
+                    ):
+                        self._data = data
+                journal.base = None
         await self._async_handle_write_data()
 
     async def _async_handle_write_data(self, *_args):
@@ -541,16 +917,29 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if self._journal is not None and self._journal.size:
+                self._async_ensure_final_write_listener()
+
     async def _async_write_data(self, path: str, data: dict) -> None:
-        await self.hass.async_add_executor_job(self._write_data, self.path, data)
+        await self._manager.async_write(self, self.path, data)
+
+    def _write_data(self, path: str, data: dict, sync_directory: bool = True) -> int:
+        """Write the data.
 
-    def _write_data(self, path: str, data: dict) -> None:
-        """Write the data."""
+        Returns the number of bytes written.
+        """
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if (journal := self._journal) is not None:
+            journal_size = journal.size
+            if journal.append(data, self._private, self._atomic_writes):
+                _LOGGER.debug("Appended changes for %s to %s", self.key, journal.path)
+                return journal.size - journal_size
+            journal.prepare_write(data)
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -558,8 +947,13 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             self._private,
             encoder=self._encoder,
             atomic_writes=self._atomic_writes,
+            sync_directory=sync_directory,
         )
 
+        if journal is not None:
+            journal.written(path, data)
+        return os.path.getsize(path)
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -572,3 +966,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+        if (journal := self._journal) is not None:
+            journal.base = None
+            journal.size = 0
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, journal.path)
@@ -17,6 +17,7 @@ import logging
 import os
 import pathlib
 import sys
+import threading
 import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, cast
@@ -29,7 +30,7 @@ from awesomeversion import (
 import voluptuous as vol
 
 from . import generated
-from .const import Platform
+from .const import Platform, __version__
 from .core import HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
@@ -48,6 +49,7 @@ if TYPE_CHECKING:
     # because they would cause a circular import otherwise.
     from .config_entries import ConfigEntry
     from .helpers import device_registry as dr
+    from .helpers.storage import Store
     from .helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
@@ -63,10 +65,12 @@ _LOGGER = logging.getLogger(__name__)
 #
 # This list can be extended by calling async_register_preload_platform
 #
+# Platforms that are rarely used, like diagnostics, are not preloaded
+# and are imported when they are first used instead.
+#
 BASE_PRELOAD_PLATFORMS = [
     "config",
     "config_flow",
-    "diagnostics",
     "energy",
     "group",
     "logbook",
@@ -114,6 +118,10 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_IMPORT_TIMES: HassKey[dict[str, float]] = HassKey("import_times")
+DATA_MANIFEST_CACHE: HassKey[ManifestCache] = HassKey("manifest_cache")
+MANIFEST_CACHE_STORAGE_KEY = "core.manifest_cache"
+MANIFEST_CACHE_STORAGE_VERSION = 1
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -247,6 +255,128 @@ class Manifest(TypedDict, total=False):
     single_config_entry: bool
 
 
+class ManifestCache:
+    """Cache of the resolved manifests persisted between restarts.
+
+    An integration is resolved from the cache as long as the mtime of its
+    directory and the mtime and size of its manifest are unchanged, which
+    avoids reading and parsing the manifest and listing the directory.
+    The sub directories of the custom components are cached with the
+    mtime of the custom components directory. The whole cache is
+    discarded when the version of Home Assistant changes.
+
+    The cache is accessed from the executor so it is thread-safe.
+    """
+
+    __slots__ = ("_lock", "_integrations", "_directories", "dirty")
+
+    def __init__(self, data: dict[str, Any] | None = None) -> None:
+        """Initialize the cache."""
+        self._lock = threading.Lock()
+        self._integrations: dict[str, dict[str, Any]] = {}
+        self._directories: dict[str, dict[str, Any]] = {}
+        self.dirty = False
+        if data and data.get("ha_version") == __version__:
+            self._integrations = data["integrations"]
+            self._directories = data["directories"]
+
+    @staticmethod
+    def stat_integration(file_path: pathlib.Path) -> list[int] | None:
+        """Return the stat of an integration or None if it has no manifest."""
+        try:
+            dir_stat = file_path.stat()
+            manifest_stat = (file_path / "manifest.json").stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        return [
+            dir_stat.st_mtime_ns,
+            manifest_stat.st_mtime_ns,
+            manifest_stat.st_size,
+        ]
+
+    def get_integration(
+        self, file_path: pathlib.Path, stat: list[int]
+    ) -> tuple[Manifest, set[str] | None] | None:
+        """Return the manifest and top level files of an integration."""
+        with self._lock:
+            entry = self._integrations.get(str(file_path))
+        if entry is None or entry["stat"] != stat:
+            return None
+        files: list[str] | None = entry["files"]
+        return (
+            cast(Manifest, dict(entry["manifest"])),
+            None if files is None else set(files),
+        )
+
+    def set_integration(
+        self,
+        file_path: pathlib.Path,
+        stat: list[int],
+        manifest: Manifest,
+        top_level_files: set[str] | None,
+    ) -> None:
+        """Cache the manifest and top level files of an integration."""
+        entry = {
+            "stat": stat,
+            "manifest": dict(manifest),
+            "files": None if top_level_files is None else sorted(top_level_files),
+        }
+        with self._lock:
+            self._integrations[str(file_path)] = entry
+            self.dirty = True
+
+    def get_sub_directories(self, path: pathlib.Path) -> list[str]:
+        """Return the names of the sub directories of a path."""
+        mtime = path.stat().st_mtime_ns
+        key = str(path)
+        with self._lock:
+            entry = self._directories.get(key)
+        if entry is not None and entry["mtime"] == mtime:
+            return entry["dirs"]
+        dirs = [entry.name for entry in path.iterdir() if entry.is_dir()]
+        with self._lock:
+            self._directories[key] = {"mtime": mtime, "dirs": dirs}
+            self.dirty = True
+        return dirs
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cache as a dict to be stored."""
+        with self._lock:
+            self.dirty = False
+            return {
+                "ha_version": __version__,
+                "integrations": self._integrations.copy(),
+                "directories": self._directories.copy(),
+            }
+
+
+def _manifest_cache_store(hass: HomeAssistant) -> Store[dict[str, Any]]:
+    """Return the store of the manifest cache."""
+    # pylint: disable-next=import-outside-toplevel
+    from .helpers.storage import Store
+
+    return Store(
+        hass,
+        MANIFEST_CACHE_STORAGE_VERSION,
+        MANIFEST_CACHE_STORAGE_KEY,
+        private=True,
+        atomic_writes=True,
+    )
+
+
+async def async_load_manifest_cache(hass: HomeAssistant) -> None:
+    """Load the manifest cache."""
+    data = await _manifest_cache_store(hass).async_load()
+    hass.data[DATA_MANIFEST_CACHE] = ManifestCache(data)
+
+
+async def async_save_manifest_cache(hass: HomeAssistant) -> None:
+    """Save the manifest cache if it changed."""
+    if (cache := hass.data.get(DATA_MANIFEST_CACHE)) is None or not cache.dirty:
+        return
+    await _manifest_cache_store(hass).async_save(cache.as_dict())
+
+
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the necessary data structures."""
     _async_mount_config_dir(hass)
@@ -254,6 +384,13 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    hass.data[DATA_IMPORT_TIMES] = {}
+
+
+@callback
+def async_get_import_times(hass: HomeAssistant) -> dict[str, float]:
+    """Return the seconds it took to import each component and platform."""
+    return hass.data[DATA_IMPORT_TIMES]
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -279,10 +416,18 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
+    manifest_cache = hass.data.get(DATA_MANIFEST_CACHE)
+
+    def get_sub_directories(paths: list[str]) -> list[str]:
+        """Return the names of all sub directories in a set of paths."""
+        if manifest_cache is not None:
+            return [
+                name
+                for path in paths
+                for name in manifest_cache.get_sub_directories(pathlib.Path(path))
+            ]
         return [
-            entry
+            entry.name
             for path in paths
             for entry in pathlib.Path(path).iterdir()
             if entry.is_dir()
@@ -293,10 +438,7 @@ async def _async_get_custom_components(
     )
 
     integrations = await hass.async_add_executor_job(
-        _resolve_integrations_from_root,
-        hass,
-        custom_components,
-        [comp.name for comp in dirs],
+        _resolve_integrations_from_root, hass, custom_components, dirs
     )
     return {
         integration.domain: integration
@@ -644,30 +786,48 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        manifest_cache = hass.data.get(DATA_MANIFEST_CACHE)
         for base in root_module.__path__:
-            manifest_path = pathlib.Path(base) / domain / "manifest.json"
-
-            if not manifest_path.is_file():
+            file_path = pathlib.Path(base) / domain
+            manifest_path = file_path / "manifest.json"
+
+            cached: tuple[Manifest, set[str] | None] | None = None
+            stat: list[int] | None = None
+            if manifest_cache is not None:
+                if (stat := manifest_cache.stat_integration(file_path)) is None:
+                    continue
+                cached = manifest_cache.get_integration(file_path, stat)
+            elif not manifest_path.is_file():
                 continue
 
-            try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
-                continue
+            if cached is not None:
+                manifest, top_level_files = cached
+            else:
+                try:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s",
+                        manifest_path,
+                        err,
+                    )
+                    continue
+
+                # Avoid the listdir for virtual integrations
+                # as they cannot have any platforms
+                is_virtual = manifest.get("integration_type") == "virtual"
+                top_level_files = None if is_virtual else set(os.listdir(file_path))
+                if manifest_cache is not None and stat is not None:
+                    manifest_cache.set_integration(
+                        file_path, stat, manifest, top_level_files
+                    )
 
-            file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
                 file_path,
                 manifest,
-                None if is_virtual else set(os.listdir(file_path)),
+                top_level_files,
             )
 
             if not integration.import_executor:
@@ -760,6 +920,7 @@ class Integration:
         self._import_futures: dict[str, asyncio.Future[ModuleType]] = {}
         self._cache = hass.data[DATA_COMPONENTS]
         self._missing_platforms_cache = hass.data[DATA_MISSING_PLATFORMS]
+        self._import_times = hass.data[DATA_IMPORT_TIMES]
         self._top_level_files = top_level_files or set()
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
@@ -1047,6 +1208,7 @@ class Integration:
         """Return the component."""
         cache = self._cache
         domain = self.domain
+        start = time.perf_counter()
         try:
             cache[domain] = cast(
                 ComponentProtocol, importlib.import_module(self.pkg_path)
@@ -1061,6 +1223,7 @@ class Integration:
                 "Unexpected exception importing component %s", self.pkg_path
             )
             raise ImportError(f"Exception importing {self.pkg_path}") from err
+        self._import_times[domain] = time.perf_counter() - start
 
         if preload_platforms:
             for platform_name in self.platforms_exists(self._platforms_to_preload):
@@ -1245,6 +1408,7 @@ class Integration:
         """
         full_name = f"{self.domain}.{platform_name}"
         cache = self.hass.data[DATA_COMPONENTS]
+        start = time.perf_counter()
         try:
             cache[full_name] = self._import_platform(platform_name)
         except ModuleNotFoundError:
@@ -1269,6 +1433,7 @@ class Integration:
             raise ImportError(
                 f"Exception importing {self.pkg_path}.{platform_name}"
             ) from err
+        self._import_times[full_name] = time.perf_counter() - start
 
         return cast(ModuleType, cache[full_name])
 
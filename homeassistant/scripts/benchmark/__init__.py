@@ -19,6 +19,7 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -312,6 +313,37 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def reduce_statistics(hass):
+    """Reduce a year of hourly statistics of 150 sensors to days, weeks and months."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import statistics
+
+    types = {"last_reset", "max", "mean", "min", "state", "sum"}
+    period_start = dt_util.parse_datetime("2023-01-01T00:00:00+00:00").timestamp()
+    stats = {
+        f"sensor.energy_{sensor}": [
+            {
+                "start": period_start + hour * 3600,
+                "last_reset": None,
+                "max": hour + 1.0,
+                "mean": hour + 0.5,
+                "min": float(hour),
+                "state": float(hour),
+                "sum": float(hour),
+            }
+            for hour in range(365 * 24)
+        ]
+        for sensor in range(150)
+    }
+
+    start = timer()
+    statistics._reduce_statistics_per_day(stats, types)  # noqa: SLF001
+    statistics._reduce_statistics_per_week(stats, types)  # noqa: SLF001
+    statistics._reduce_statistics_per_month(stats, types)  # noqa: SLF001
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -7,6 +7,7 @@ from collections import defaultdict
 from collections.abc import Awaitable, Callable, Generator, Mapping
 import contextlib
 import contextvars
+from dataclasses import dataclass, field
 from enum import StrEnum
 from functools import partial
 import logging.handlers
@@ -72,6 +73,10 @@ DATA_SETUP_TIME: HassKey[
     defaultdict[str, defaultdict[str | None, defaultdict[SetupPhases, float]]]
 ] = HassKey("setup_time")
 
+# DATA_SETUP_TIMELINE is the timeline of the setup events
+# recorded while Home Assistant is starting.
+DATA_SETUP_TIMELINE: HassKey[SetupTimeline] = HassKey("setup_timeline")
+
 DATA_DEPS_REQS: HassKey[set[str]] = HassKey("deps_reqs_processed")
 
 DATA_PERSISTENT_ERRORS: HassKey[dict[str, str | None]] = HassKey(
@@ -233,10 +238,16 @@ async def _async_process_dependencies(
             after_dependencies_tasks.keys(),
         )
 
-    async with hass.timeout.async_freeze(integration.domain):
-        results = await asyncio.gather(
-            *dependencies_tasks.values(), *after_dependencies_tasks.values()
-        )
+    with _async_record_timeline(
+        hass,
+        integration.domain,
+        SetupPhases.WAIT_DEPENDENCIES,
+        waits_for={*dependencies_tasks, *after_dependencies_tasks},
+    ):
+        async with hass.timeout.async_freeze(integration.domain):
+            results = await asyncio.gather(
+                *dependencies_tasks.values(), *after_dependencies_tasks.values()
+            )
 
     failed = [
         domain for idx, domain in enumerate(dependencies_tasks) if not results[idx]
@@ -317,7 +328,8 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = await integration.async_get_component()
+        with _async_record_timeline(hass, domain, SetupPhases.IMPORT):
+            component = await integration.async_get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", err)
         return False
@@ -557,10 +569,11 @@ async def async_process_deps_reqs(
     if failed_deps := await _async_process_dependencies(hass, config, integration):
         raise DependencyError(failed_deps)
 
-    async with hass.timeout.async_freeze(integration.domain):
-        await requirements.async_get_integration_with_requirements(
-            hass, integration.domain
-        )
+    with _async_record_timeline(hass, integration.domain, SetupPhases.REQUIREMENTS):
+        async with hass.timeout.async_freeze(integration.domain):
+            await requirements.async_get_integration_with_requirements(
+                hass, integration.domain
+            )
 
     processed.add(integration.domain)
 
@@ -663,6 +676,78 @@ class SetupPhases(StrEnum):
     """Wait time for the platforms to import."""
     WAIT_IMPORT_PACKAGES = "wait_import_packages"
     """Wait time for the packages to import."""
+    WAIT_DEPENDENCIES = "wait_dependencies"
+    """Wait time for the dependencies to be setup.
+
+    This is only recorded in the setup timeline.
+    """
+    REQUIREMENTS = "requirements"
+    """Processing of the requirements of an integration.
+
+    This is only recorded in the setup timeline.
+    """
+    IMPORT = "import"
+    """Import of the component of an integration.
+
+    This is only recorded in the setup timeline.
+    """
+
+
+@dataclass(slots=True)
+class SetupTimelineEvent:
+    """A setup event in the startup timeline."""
+
+    domain: str
+    group: str | None
+    phase: SetupPhases
+    start: float
+    end: float | None = None
+
+
+@dataclass(slots=True)
+class SetupTimeline:
+    """The timeline of the setup events recorded during startup.
+
+    The dependencies are the edges of the setup DAG, they map a domain
+    to the domains its setup had to wait for.
+    """
+
+    started: float = field(default_factory=time.monotonic)
+    events: list[SetupTimelineEvent] = field(default_factory=list)
+    dependencies: defaultdict[str, set[str]] = field(
+        default_factory=lambda: defaultdict(set)
+    )
+
+
+@singleton.singleton(DATA_SETUP_TIMELINE)
+def _setup_timeline(hass: core.HomeAssistant) -> SetupTimeline:
+    """Return the setup timeline."""
+    return SetupTimeline()
+
+
+@contextlib.contextmanager
+def _async_record_timeline(
+    hass: core.HomeAssistant,
+    domain: str,
+    phase: SetupPhases,
+    group: str | None = None,
+    waits_for: set[str] | None = None,
+) -> Generator[None, None, None]:
+    """Record a setup event in the startup timeline."""
+    if hass.is_stopping or hass.state is core.CoreState.running:
+        # The timeline only covers startup
+        yield
+        return
+
+    timeline = _setup_timeline(hass)
+    if waits_for:
+        timeline.dependencies[domain].update(waits_for)
+    event = SetupTimelineEvent(domain, group, phase, time.monotonic())
+    timeline.events.append(event)
+    try:
+        yield
+    finally:
+        event.end = time.monotonic()
 
 
 @singleton.singleton(DATA_SETUP_STARTED)
@@ -693,12 +778,13 @@ def async_pause_setup(
         yield
         return
 
+    integration, group = running
     started = time.monotonic()
     try:
-        yield
+        with _async_record_timeline(hass, integration, phase, group):
+            yield
     finally:
         time_taken = time.monotonic() - started
-        integration, group = running
         # Add negative time for the time we waited
         _setup_times(hass)[integration][group][phase] = -time_taken
         _LOGGER.debug(
@@ -756,7 +842,8 @@ def async_start_setup(
     setup_started[current] = started
 
     try:
-        yield
+        with _async_record_timeline(hass, integration, phase, group):
+            yield
     finally:
         time_taken = time.monotonic() - started
         del setup_started[current]
@@ -810,3 +897,48 @@ def async_get_domain_setup_times(
 ) -> Mapping[str | None, dict[SetupPhases, float]]:
     """Return timing data for each integration."""
     return _setup_times(hass).get(domain, {})
+
+
+@callback
+def async_get_setup_timeline(hass: core.HomeAssistant) -> dict[str, Any]:
+    """Return the startup timeline.
+
+    The times are in seconds relative to the start of the timeline. The
+    critical path is the chain of domains, following the dependencies
+    that finished last, which ends with the last domain to finish setup.
+    """
+    timeline = _setup_timeline(hass)
+    started = timeline.started
+    finished: dict[str, float] = {}
+    events: list[dict[str, Any]] = []
+    for event in timeline.events:
+        end = None if event.end is None else event.end - started
+        events.append(
+            {
+                "domain": event.domain,
+                "group": event.group,
+                "phase": event.phase,
+                "start": event.start - started,
+                "end": end,
+            }
+        )
+        if end is not None:
+            finished[event.domain] = max(finished.get(event.domain, 0), end)
+
+    dependencies = timeline.dependencies
+    critical_path: list[str] = []
+    domain = max(finished, key=finished.__getitem__, default=None)
+    while domain is not None and domain not in critical_path:
+        critical_path.append(domain)
+        domain = max(
+            (dep for dep in dependencies.get(domain, ()) if dep in finished),
+            key=finished.__getitem__,
+            default=None,
+        )
+    critical_path.reverse()
+
+    return {
+        "events": events,
+        "dependencies": {domain: sorted(deps) for domain, deps in dependencies.items()},
+        "critical_path": critical_path,
+    }
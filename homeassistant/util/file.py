@@ -43,11 +43,20 @@ def write_utf8_file_atomic(
 
 
 def write_utf8_file(
-    filename: str, utf8_data: bytes | str, private: bool = False, mode: str = "w"
+    filename: str,
+    utf8_data: bytes | str,
+    private: bool = False,
+    mode: str = "w",
+    *,
+    fsync: bool = False,
 ) -> None:
     """Write a file and rename it into place.
 
     Writes all or nothing.
+
+    With fsync the data is on disk before the file is renamed into
+    place, the caller has to fsync the directory with fsync_directory
+    for the rename to be on disk as well.
     """
     tmp_filename = ""
     encoding = "utf-8" if "b" not in mode else None
@@ -60,6 +69,9 @@ def write_utf8_file(
             tmp_filename = fdesc.name
             if not private:
                 os.fchmod(fdesc.fileno(), 0o644)
+            if fsync:
+                fdesc.flush()
+                os.fsync(fdesc.fileno())
         os.replace(tmp_filename, filename)
     except OSError as error:
         _LOGGER.exception("Saving file failed: %s", filename)
@@ -77,3 +89,12 @@ def write_utf8_file(
                     filename,
                     err,
                 )
+
+
+def fsync_directory(path: str) -> None:
+    """Flush the entries of a directory to disk."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -2,7 +2,15 @@
 
 from __future__ import annotations
 
-from ipaddress import IPv4Address, IPv6Address, ip_address, ip_network
+from collections.abc import Iterable
+from ipaddress import (
+    IPv4Address,
+    IPv4Network,
+    IPv6Address,
+    IPv6Network,
+    ip_address,
+    ip_network,
+)
 import re
 
 import yarl
@@ -35,6 +43,58 @@ LINK_LOCAL_NETWORKS = (
 )
 
 
+class IPNetworkSet:
+    """A set of IP addresses and networks with fast membership checks.
+
+    Checking an address against a list of networks one by one gets slow
+    with many networks. The networks are instead stored by prefix length
+    as the integer value of their prefix, so checking an address costs one
+    set lookup per distinct prefix length no matter how many networks
+    there are. Addresses are stored as networks with a full length prefix.
+
+    Like the ipaddress module an IPv4 address never matches an IPv6
+    network and the other way around.
+    """
+
+    __slots__ = ("_prefixes", "_networks")
+
+    def __init__(
+        self,
+        networks: Iterable[
+            str | IPv4Address | IPv6Address | IPv4Network | IPv6Network
+        ] = (),
+    ) -> None:
+        """Initialize the set."""
+        # IP version -> prefix length -> prefix values
+        self._prefixes: dict[int, dict[int, set[int]]] = {4: {}, 6: {}}
+        self._networks: set[IPv4Network | IPv6Network] = set()
+        for network in networks:
+            self.add(network)
+
+    def __len__(self) -> int:
+        """Return the number of addresses and networks in the set."""
+        return len(self._networks)
+
+    def __contains__(self, address: IPv4Address | IPv6Address) -> bool:
+        """Return if an address is in the set or in a network of the set."""
+        value = int(address)
+        max_prefixlen = address.max_prefixlen
+        for prefixlen, prefixes in self._prefixes[address.version].items():
+            if value >> (max_prefixlen - prefixlen) in prefixes:
+                return True
+        return False
+
+    def add(
+        self, network: str | IPv4Address | IPv6Address | IPv4Network | IPv6Network
+    ) -> None:
+        """Add an address or a network to the set."""
+        network = ip_network(network)
+        self._networks.add(network)
+        self._prefixes[network.version].setdefault(network.prefixlen, set()).add(
+            int(network.network_address) >> (network.max_prefixlen - network.prefixlen)
+        )
+
+
 def is_loopback(address: IPv4Address | IPv6Address) -> bool:
     """Check if an address is a loopback address."""
     return address.is_loopback or address in IPV6_IPV4_LOOPBACK
@@ -8,8 +8,11 @@ from io import StringIO, TextIOWrapper
 import logging
 import os
 from pathlib import Path
+import threading
+import time
 from typing import Any, TextIO, overload
 
+from lru import LRU
 import yaml
 
 try:
@@ -36,6 +39,108 @@ JSON_TYPE = list | dict | str
 
 _LOGGER = logging.getLogger(__name__)
 
+# Number of parsed YAML files that are kept
+YAML_CACHE_SIZE = 2048
+
+# Files changed less than this long ago are not kept parsed, a file changed
+# again within the resolution of the file system timestamps could keep both
+# its modification time and its size
+RACY_INTERVAL_NS = 2_000_000_000
+
+type _Stamp = tuple[int, int]
+
+
+def _stamp(stat: os.stat_result) -> _Stamp:
+    """Return what tells if a file changed."""
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _is_racy(stamp: _Stamp) -> bool:
+    """Return if a file changed too recently to tell if it changes again."""
+    return time.time_ns() - stamp[0] < RACY_INTERVAL_NS
+
+
+class _Dependencies:
+    """What parsing a YAML file depended on, besides the file itself.
+
+    That is the files it included, also through other files, the secrets
+    files, the files found in included directories and the environment
+    variables.
+    """
+
+    __slots__ = ("files", "directories", "environment", "cacheable")
+
+    def __init__(self) -> None:
+        """Initialize the dependencies."""
+        self.files: dict[str, _Stamp | None] = {}
+        self.directories: dict[str, list[str]] = {}
+        self.environment: dict[str, str | None] = {}
+        self.cacheable = True
+
+    def add_file(self, path: str) -> None:
+        """Add a file, which might not exist."""
+        try:
+            stamp = _stamp(os.stat(path))
+        except OSError:
+            self.files[path] = None
+            return
+        self.add_loaded_file(path, stamp)
+
+    def add_loaded_file(self, path: str, stamp: _Stamp | None) -> None:
+        """Add a loaded file, with no stamp if it can't be told if it changed."""
+        self.files[path] = stamp
+        if stamp is None or _is_racy(stamp):
+            self.cacheable = False
+
+    def update(self, other: _Dependencies) -> None:
+        """Add the dependencies of a loaded file."""
+        self.files.update(other.files)
+        self.directories.update(other.directories)
+        self.environment.update(other.environment)
+        self.cacheable = self.cacheable and other.cacheable
+
+    def is_current(self) -> bool:
+        """Return if none of the dependencies changed."""
+        for path, stamp in self.files.items():
+            try:
+                if _stamp(os.stat(path)) != stamp:
+                    return False
+            except OSError:
+                if stamp is not None:
+                    return False
+        return all(
+            list(_find_files(directory, "*.yaml")) == files
+            for directory, files in self.directories.items()
+        ) and all(
+            os.environ.get(name) == value for name, value in self.environment.items()
+        )
+
+
+class _CachedYaml:
+    """A parsed YAML file."""
+
+    __slots__ = ("stamp", "data", "dependencies")
+
+    def __init__(
+        self, stamp: _Stamp, data: JSON_TYPE | None, dependencies: _Dependencies
+    ) -> None:
+        """Initialize the parsed file."""
+        self.stamp = stamp
+        self.data = data
+        self.dependencies = dependencies
+
+
+# Parsed files by their path and the config dir of their secrets
+_CACHE: LRU[tuple[str, Path | None], _CachedYaml] = LRU(YAML_CACHE_SIZE)
+
+# The dependencies of the file being loaded by the thread
+_LOADING = threading.local()
+
+
+def _current_dependencies() -> _Dependencies | None:
+    """Return the dependencies of the file being loaded."""
+    return getattr(_LOADING, "dependencies", None)
+
 
 class YamlTypeError(HomeAssistantError):
     """Raised by load_yaml_dict if top level data is not a dict."""
@@ -77,7 +182,10 @@ class Secrets:
 
     def _load_secret_yaml(self, secret_dir: Path) -> dict[str, str]:
         """Load the secrets yaml from path."""
-        if (secret_path := secret_dir / SECRET_YAML) in self._cache:
+        secret_path = secret_dir / SECRET_YAML
+        if (dependencies := _current_dependencies()) is not None:
+            dependencies.add_file(str(secret_path))
+        if secret_path in self._cache:
             return self._cache[secret_path]
 
         _LOGGER.debug("Loading %s", secret_path)
@@ -221,14 +329,85 @@ type LoaderType = FastSafeLoader | PythonSafeLoader
 def load_yaml(
     fname: str | os.PathLike[str], secrets: Secrets | None = None
 ) -> JSON_TYPE | None:
-    """Load a YAML file."""
+    """Load a YAML file.
+
+    Parsed files are kept, together with the files they include, until
+    they or one of the files they depend on changes. Loading the
+    configuration again then only parses the files which changed.
+    """
+    path = os.fspath(fname)
+    key = (path, None if secrets is None else secrets.config_dir)
+    parent = _current_dependencies()
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+            stamp: _Stamp | None = None
+            if isinstance(conf_file, TextIOWrapper):
+                stamp = _stamp(os.fstat(conf_file.fileno()))
+            if (
+                stamp is not None
+                and (cached := _CACHE.get(key)) is not None
+                and cached.stamp == stamp
+                and cached.dependencies.is_current()
+            ):
+                dependencies = cached.dependencies
+                data = _copy_nodes(cached.data)
+            else:
+                dependencies = _LOADING.dependencies = _Dependencies()
+                try:
+                    data = parse_yaml(conf_file, secrets)
+                finally:
+                    _LOADING.dependencies = parent
+                if stamp is not None and not _is_racy(stamp):
+                    if dependencies.cacheable:
+                        _CACHE[key] = _CachedYaml(stamp, data, dependencies)
+                        data = _copy_nodes(data)
+                    else:
+                        _CACHE.pop(key, None)
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
 
+    if parent is not None:
+        parent.add_loaded_file(path, stamp)
+        parent.update(dependencies)
+    return data
+
+
+def _copy_nodes(data: Any) -> Any:
+    """Copy parsed YAML, keeping the file references.
+
+    A parsed file that is kept is copied each time it is loaded, as the
+    loaded configuration is changed by its users.
+    """
+    if isinstance(data, NodeDictClass):
+        return _copy_reference(
+            NodeDictClass({key: _copy_nodes(value) for key, value in data.items()}),
+            data,
+        )
+    if isinstance(data, NodeListClass):
+        return _copy_reference(
+            NodeListClass([_copy_nodes(value) for value in data]), data
+        )
+    if isinstance(data, NodeStrClass):
+        return _copy_reference(NodeStrClass(data), data)
+    if isinstance(data, dict):
+        return {key: _copy_nodes(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_copy_nodes(value) for value in data]
+    return data
+
+
+def _copy_reference[_T: (NodeDictClass, NodeListClass, NodeStrClass)](
+    obj: _T, original: _T
+) -> _T:
+    """Copy file reference information from a node class object."""
+    try:  # suppress is much slower
+        obj.__config_file__ = original.__config_file__
+        obj.__line__ = original.__line__
+    except AttributeError:
+        pass
+    return obj
+
 
 def load_yaml_dict(
     fname: str | os.PathLike[str], secrets: Secrets | None = None
@@ -382,11 +561,19 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
+def _find_yaml_files(directory: str) -> list[str]:
+    """Find the YAML files in a directory for a directory include."""
+    files = list(_find_files(directory, "*.yaml"))
+    if (dependencies := _current_dependencies()) is not None:
+        dependencies.directories[directory] = files
+    return files
+
+
 def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> NodeDictClass:
     """Load multiple files from directory as a dictionary."""
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loc):
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
@@ -405,7 +592,7 @@ def _include_dir_merge_named_yaml(
     """Load multiple files from directory as a merged dictionary."""
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loc):
         if os.path.basename(fname) == SECRET_YAML:
             continue
         loaded_yaml = load_yaml(fname, loader.secrets)
@@ -421,7 +608,7 @@ def _include_dir_list_yaml(
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
     return [
         loaded_yaml
-        for f in _find_files(loc, "*.yaml")
+        for f in _find_yaml_files(loc)
         if os.path.basename(f) != SECRET_YAML
         and (loaded_yaml := load_yaml(f, loader.secrets)) is not None
     ]
@@ -433,7 +620,7 @@ def _include_dir_merge_list_yaml(
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.get_name), node.value)
     merged_list: list[JSON_TYPE] = []
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_yaml_files(loc):
         if os.path.basename(fname) == SECRET_YAML:
             continue
         loaded_yaml = load_yaml(fname, loader.secrets)
@@ -502,6 +689,8 @@ def _handle_scalar_tag(
 def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
+    if (dependencies := _current_dependencies()) is not None:
+        dependencies.environment[args[0]] = os.environ.get(args[0])
 
     # Check for a default value
     if len(args) > 1:
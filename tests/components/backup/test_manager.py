@@ -8,9 +8,14 @@ from unittest.mock import AsyncMock, MagicMock, Mock, patch
 import pytest
 
 from homeassistant.components.backup import BackupManager
-from homeassistant.components.backup.manager import BackupPlatformProtocol
+from homeassistant.components.backup.const import SIGNAL_BACKUP_PROGRESS
+from homeassistant.components.backup.manager import (
+    BackupPlatformProtocol,
+    BackupProgress,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.setup import async_setup_component
 
 from .common import TEST_BACKUP
@@ -34,8 +39,9 @@ async def _mock_backup_generation(manager: BackupManager):
         patch(
             "homeassistant.components.backup.manager.SecureTarFile"
         ) as mocked_tarfile,
+        patch("homeassistant.components.backup.manager.add_stream"),
         patch("pathlib.Path.iterdir", _mock_iterdir),
-        patch("pathlib.Path.stat", MagicMock(st_size=123)),
+        patch("pathlib.Path.stat", MagicMock(return_value=MagicMock(st_size=123))),
         patch("pathlib.Path.is_file", lambda x: x.name != ".storage"),
         patch(
             "pathlib.Path.is_dir",
@@ -187,9 +193,14 @@ async def test_generate_backup(
     """Test generate backup."""
     manager = BackupManager(hass)
     manager.loaded_backups = True
+    progress: list[BackupProgress] = []
+    async_dispatcher_connect(hass, SIGNAL_BACKUP_PROGRESS, progress.append)
 
     await _mock_backup_generation(manager)
+    await hass.async_block_till_done()
 
+    assert progress[-1].done
+    assert progress[-1].bytes_done == progress[-1].bytes_total == 123
     assert "Generated new backup with slug " in caplog.text
     assert "Creating backup directory" in caplog.text
     assert "Loaded 0 platforms" in caplog.text
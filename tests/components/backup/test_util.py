@@ -0,0 +1,81 @@
+"""Tests for the Backup integration utilities."""
+
+from __future__ import annotations
+
+import gzip
+import io
+from pathlib import Path
+import tarfile
+
+import pytest
+
+from homeassistant.components.backup.const import EXCLUDE_FROM_BACKUP
+from homeassistant.components.backup.util import (
+    GZIP_BLOCK_SIZE,
+    GzipBlockWriter,
+    add_contents,
+    add_stream,
+    collect_contents,
+)
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_gzip_block_writer(workers: int) -> None:
+    """Test blocks compressed on their own join to a single gzip stream."""
+    data = b"".join(
+        f"{index} The quick brown fox jumps over the lazy dog\n".encode()
+        for index in range(60000)
+    )
+    assert len(data) > 2 * GZIP_BLOCK_SIZE
+
+    written: list[int] = []
+    fileobj = io.BytesIO()
+    with GzipBlockWriter(fileobj, workers=workers, on_write=written.append) as writer:
+        for start in range(0, len(data), 10000):
+            writer.write(data[start : start + 10000])
+        assert writer.tell() == len(data)
+
+    assert gzip.decompress(fileobj.getvalue()) == data
+    assert written == [GZIP_BLOCK_SIZE, 2 * GZIP_BLOCK_SIZE, len(data)]
+    # Compresses about as well as compressing the data at once
+    assert len(fileobj.getvalue()) < len(gzip.compress(data, 6)) * 1.01
+
+
+def test_add_contents(tmp_path: Path) -> None:
+    """Test streaming the contents of a directory into a tar file in a tar file."""
+    config_dir = tmp_path / "config"
+    (config_dir / ".storage").mkdir(parents=True)
+    (config_dir / "empty").mkdir()
+    (config_dir / "configuration.yaml").write_text("default_config:\n")
+    (config_dir / "home-assistant.log").write_text("Excluded")
+    (config_dir / "home-assistant_v2.db-shm").write_text("Excluded")
+    (config_dir / ".storage" / "core.config").write_text("{}")
+
+    contents, size = collect_contents(config_dir, EXCLUDE_FROM_BACKUP, "data")
+    assert size == len("default_config:\n") + len("{}")
+
+    backup_path = tmp_path / "backup.tar"
+    with tarfile.open(backup_path, "w:") as outer_tar:
+        with (
+            add_stream(outer_tar, "./homeassistant.tar.gz") as stream,
+            GzipBlockWriter(stream) as gzip_stream,
+            tarfile.open(fileobj=gzip_stream, mode="w:") as core_tar,
+        ):
+            add_contents(core_tar, contents)
+        outer_tar.addfile(tarfile.TarInfo("./after.json"))
+
+    with tarfile.open(backup_path, "r:") as outer_tar:
+        assert outer_tar.getnames() == ["./homeassistant.tar.gz", "./after.json"]
+        inner_file = outer_tar.extractfile("./homeassistant.tar.gz")
+        assert inner_file is not None
+        with tarfile.open(fileobj=inner_file, mode="r:gz") as core_tar:
+            assert sorted(core_tar.getnames()) == [
+                "data",
+                "data/.storage",
+                "data/.storage/core.config",
+                "data/configuration.yaml",
+                "data/empty",
+            ]
+            config_file = core_tar.extractfile("data/configuration.yaml")
+            assert config_file is not None
+            assert config_file.read() == b"default_config:\n"
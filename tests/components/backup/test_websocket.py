@@ -5,8 +5,11 @@ from unittest.mock import patch
 import pytest
 from syrupy import SnapshotAssertion
 
+from homeassistant.components.backup.const import SIGNAL_BACKUP_PROGRESS
+from homeassistant.components.backup.manager import BackupProgress
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from .common import TEST_BACKUP, setup_backup_integration
 
@@ -105,6 +108,31 @@ async def test_generate(
         assert snapshot == await client.receive_json()
 
 
+async def test_subscribe_progress(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test subscribing to the progress of generating backups."""
+    await setup_backup_integration(hass)
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": "backup/subscribe_progress"})
+    msg = await client.receive_json()
+    assert msg["success"]
+
+    async_dispatcher_send(
+        hass, SIGNAL_BACKUP_PROGRESS, BackupProgress("abc123", False, 512, 2048)
+    )
+    msg = await client.receive_json()
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "slug": "abc123",
+        "done": False,
+        "bytes_done": 512,
+        "bytes_total": 2048,
+    }
+
+
 @pytest.mark.parametrize(
     "access_token_fixture_name",
     ["hass_access_token", "hass_supervisor_access_token"],
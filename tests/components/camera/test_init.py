@@ -1,5 +1,7 @@
 """The tests for the camera component."""
 
+import asyncio
+import gc
 from http import HTTPStatus
 import io
 from types import ModuleType
@@ -8,6 +10,7 @@ from unittest.mock import AsyncMock, Mock, PropertyMock, mock_open, patch
 import pytest
 
 from homeassistant.components import camera
+from homeassistant.components.camera.broker import CameraFrameBroker
 from homeassistant.components.camera.const import (
     DOMAIN,
     PREF_ORIENTATION,
@@ -611,6 +614,108 @@ async def test_camera_proxy_stream(
             assert response.status == HTTPStatus.BAD_GATEWAY
 
 
+async def test_camera_proxy_shares_concurrent_fetches(
+    hass: HomeAssistant,
+    mock_camera,
+    hass_client: ClientSessionGenerator,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test concurrent image requests share a single fetch from the camera."""
+    client = await hass_client()
+    release = asyncio.Event()
+
+    async def _slow_image(*args, **kwargs) -> bytes:
+        await release.wait()
+        return b"shared"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=_slow_image,
+    ) as mock_image:
+        requests = [
+            asyncio.create_task(client.get("/api/camera_proxy/camera.demo_camera"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.1)
+        release.set()
+        responses = await asyncio.gather(*requests)
+
+    assert mock_image.call_count == 1
+    for response in responses:
+        assert response.status == HTTPStatus.OK
+        assert await response.read() == b"shared"
+
+    ws_client = await hass_ws_client(hass)
+    await ws_client.send_json_auto_id(
+        {"type": "camera/frame_stats", "entity_id": "camera.demo_camera"}
+    )
+    msg = await ws_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {
+        "camera.demo_camera": {"fetches": 1, "shared": 2, "reused": 0, "failures": 0}
+    }
+
+    await ws_client.send_json_auto_id(
+        {"type": "camera/frame_stats", "entity_id": "camera.missing"}
+    )
+    msg = await ws_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == "not_found"
+
+
+async def test_frame_broker_freshness() -> None:
+    """Test frames are reused within the freshness window only."""
+    broker = CameraFrameBroker()
+    fetch = AsyncMock(side_effect=[b"first", None, b"second"])
+
+    assert await broker.async_get_frame("still", fetch, 10) == b"first"
+    assert await broker.async_get_frame("still", fetch, 10) == b"first"
+    assert fetch.call_count == 1
+    # Without a freshness window the frame is always fetched
+    assert await broker.async_get_frame("still", fetch) is None
+    assert await broker.async_get_frame("still", fetch, 10) == b"second"
+
+    failing_fetch = AsyncMock(side_effect=HomeAssistantError)
+    with pytest.raises(HomeAssistantError):
+        await broker.async_get_frame("image", failing_fetch, 10)
+
+    assert broker.stats.as_dict() == {
+        "fetches": 4,
+        "shared": 0,
+        "reused": 1,
+        "failures": 2,
+    }
+
+
+async def test_frame_broker_fetch_fails_without_viewers() -> None:
+    """Test a failed fetch is retrieved when all its viewers went away."""
+    broker = CameraFrameBroker()
+    release = asyncio.Event()
+
+    async def _failing_fetch() -> bytes:
+        await release.wait()
+        raise HomeAssistantError
+
+    viewer = asyncio.create_task(broker.async_get_frame("still", _failing_fetch))
+    await asyncio.sleep(0)
+    viewer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await viewer
+
+    loop = asyncio.get_running_loop()
+    exception_handler = Mock()
+    loop.set_exception_handler(exception_handler)
+    try:
+        release.set()
+        for _ in range(3):
+            await asyncio.sleep(0)
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+    exception_handler.assert_not_called()
+    assert broker.stats.failures == 1
+
+
 async def test_websocket_web_rtc_offer(
     hass: HomeAssistant,
     hass_ws_client: WebSocketGenerator,
@@ -3,6 +3,7 @@
 from collections import defaultdict
 from unittest.mock import AsyncMock, patch
 
+from hassil.intents import Intents, TextSlotValue
 from hassil.recognize import Intent, IntentData, MatchEntity, RecognizeResult
 import pytest
 
@@ -1176,3 +1177,184 @@ async def test_name_wildcard_lower_priority(
     assert result.response.response_type == intent.IntentResponseType.ACTION_DONE
     assert not beer_handler.triggered
     assert food_handler.triggered
+
+
+async def test_slot_lists_updated_per_entity(
+    hass: HomeAssistant, init_components, entity_registry: er.EntityRegistry
+) -> None:
+    """Test entity names are updated in the slot lists without a full rebuild."""
+    kitchen_light = entity_registry.async_get_or_create(
+        "light", "demo", "1234", suggested_object_id="kitchen"
+    )
+    hass.states.async_set(
+        kitchen_light.entity_id, "on", {ATTR_FRIENDLY_NAME: "Kitchen Light"}
+    )
+    hass.states.async_set("light.bedroom", "on", {ATTR_FRIENDLY_NAME: "Bedroom Light"})
+    await hass.async_block_till_done()
+
+    agent = default_agent.async_get_default_agent(hass)
+
+    def get_names() -> set[str]:
+        return {value.value_out for value in agent._make_slot_lists()["name"].values}
+
+    assert get_names() == {"Kitchen Light", "Bedroom Light"}
+
+    with patch.object(
+        agent, "_get_entity_names", wraps=agent._get_entity_names
+    ) as mock_get_entity_names:
+        # Added entity
+        hass.states.async_set("light.office", "on", {ATTR_FRIENDLY_NAME: "Office"})
+        await hass.async_block_till_done()
+        assert get_names() == {"Kitchen Light", "Bedroom Light", "Office"}
+
+        # Renamed entity and new aliases
+        entity_registry.async_update_entity(
+            kitchen_light.entity_id, aliases={"Cooking Light"}
+        )
+        hass.states.async_set(
+            kitchen_light.entity_id, "on", {ATTR_FRIENDLY_NAME: "Stove Light"}
+        )
+        await hass.async_block_till_done()
+        assert get_names() == {
+            "Stove Light",
+            "Cooking Light",
+            "Bedroom Light",
+            "Office",
+        }
+
+        # State changes without a new name are ignored
+        hass.states.async_set(
+            kitchen_light.entity_id, "off", {ATTR_FRIENDLY_NAME: "Stove Light"}
+        )
+        await hass.async_block_till_done()
+
+        # Removed entity
+        hass.states.async_remove("light.bedroom")
+        await hass.async_block_till_done()
+        assert get_names() == {"Stove Light", "Cooking Light", "Office"}
+
+    assert [call.args[0] for call in mock_get_entity_names.mock_calls] == [
+        "light.office",
+        kitchen_light.entity_id,
+        kitchen_light.entity_id,
+        "light.bedroom",
+    ]
+
+    # Changing which entities are exposed rebuilds the names
+    expose_entity(hass, "light.office", False)
+    await hass.async_block_till_done()
+    assert get_names() == {"Stove Light", "Cooking Light"}
+
+
+@pytest.mark.parametrize(
+    ("sentence", "names"),
+    [
+        ("turn on the kitchen light", ["Kitchen Light"]),
+        ("Turn on the TV!", ["TV"]),
+        ("turn on the living-room lamp", ["Living Room Lamp"]),
+        ("turn on mr t", ["Mr. T"]),
+        ("turn on the bedroom light", []),
+    ],
+)
+def test_name_slot_list_for_sentence(sentence: str, names: list[str]) -> None:
+    """Test names are only kept when they can match the sentence."""
+    slot_list = default_agent.NameSlotList.from_keyed_values(
+        (
+            default_agent._name_key(name),
+            TextSlotValue.from_tuple((name, name), allow_template=False),
+        )
+        for name in ("Kitchen Light", "TV", "Living Room Lamp", "Mr. T")
+    )
+
+    assert [
+        value.value_out for value in slot_list.for_sentence(sentence).values
+    ] == names
+
+
+@pytest.mark.parametrize(
+    ("sentence", "templates"),
+    [
+        ("close the garage door", ["<close> [the] {name}", "{anything}"]),
+        (
+            "shut the blinds in the kitchen",
+            [
+                "<close> [the] {name} in [the] {area}",
+                "<close> [the] {name}",
+                "{anything}",
+            ],
+        ),
+        ("Turn on the TV!", ["(turn|switch) on [the] {name}", "{anything}"]),
+        ("what's the time", ["what's the time", "{anything}"]),
+        ("open the garage door", ["{anything}"]),
+    ],
+)
+def test_intents_index_for_sentence(sentence: str, templates: list[str]) -> None:
+    """Test sentence templates are only kept when they can match the sentence."""
+    intents = Intents.from_dict(
+        {
+            "language": "en",
+            "intents": {
+                "Close": {
+                    "data": [
+                        {
+                            "sentences": [
+                                "<close> [the] {name} in [the] {area}",
+                                "<close> [the] {name}",
+                            ]
+                        }
+                    ]
+                },
+                "TurnOn": {"data": [{"sentences": ["(turn|switch) on [the] {name}"]}]},
+                "Time": {"data": [{"sentences": ["what's the time"]}]},
+                "Anything": {"data": [{"sentences": ["{anything}"]}]},
+            },
+            "expansion_rules": {"close": "(close|shut)"},
+            "lists": {
+                "name": {"values": ["garage door", "blinds", "TV"]},
+                "area": {"values": ["kitchen"]},
+                "anything": {"wildcard": True},
+            },
+        }
+    )
+    index = default_agent.IntentsIndex(intents)
+
+    assert [
+        sentence.text
+        for intent_obj in index.for_sentence(sentence).intents.values()
+        for intent_data in intent_obj.data
+        for sentence in intent_data.sentences
+    ] == templates
+
+
+async def test_recognize_cache(
+    hass: HomeAssistant, init_components, entity_registry: er.EntityRegistry
+) -> None:
+    """Test recognition results are kept until the slot lists change."""
+    kitchen_light = entity_registry.async_get_or_create("light", "demo", "1234")
+    hass.states.async_set(
+        kitchen_light.entity_id, "off", {ATTR_FRIENDLY_NAME: "Kitchen Light"}
+    )
+    await hass.async_block_till_done()
+    async_mock_service(hass, "light", "turn_on")
+
+    agent = default_agent.async_get_default_agent(hass)
+    with patch.object(agent, "_recognize", wraps=agent._recognize) as mock_recognize:
+        for sentence in ("turn on kitchen light", " Turn on  Kitchen Light"):
+            result = await conversation.async_converse(
+                hass, sentence, None, Context(), None
+            )
+            assert (
+                result.response.response_type == intent.IntentResponseType.ACTION_DONE
+            )
+        assert mock_recognize.call_count == 1
+
+        # Renaming the entity changes the slot lists
+        hass.states.async_set(
+            kitchen_light.entity_id, "off", {ATTR_FRIENDLY_NAME: "Stove Light"}
+        )
+        await hass.async_block_till_done()
+        result = await conversation.async_converse(
+            hass, "turn on kitchen light", None, Context(), None
+        )
+        assert result.response.response_type == intent.IntentResponseType.ERROR
+        assert mock_recognize.call_count == 2
@@ -2,6 +2,7 @@
 
 import asyncio
 from datetime import timedelta
+from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
@@ -172,6 +173,202 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+@pytest.mark.parametrize(
+    ("significant_changes_only", "minimal_response", "no_attributes"),
+    [
+        (True, False, False),
+        (False, False, False),
+        (False, True, False),
+        (False, False, True),
+        (True, True, True),
+    ],
+)
+async def test_history_during_period_columnar(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Test history_during_period columnar results match the row results."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "on", attributes={"any": "attr"})
+    hass.states.async_set("climate.test", "heat", attributes={"temperature": 20})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "off", attributes={"any": "attr"})
+    hass.states.async_set("climate.test", "heat", attributes={"temperature": 21})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "off", attributes={"any": "changed"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "on", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    request = {
+        "type": "history/history_during_period",
+        "start_time": now.isoformat(),
+        "entity_ids": ["sensor.test", "climate.test"],
+        "include_start_time_state": True,
+        "significant_changes_only": significant_changes_only,
+        "minimal_response": minimal_response,
+        "no_attributes": no_attributes,
+    }
+    await client.send_json({"id": 1, **request})
+    response = await client.receive_json()
+    assert response["success"]
+    rows = response["result"]
+
+    await client.send_json({"id": 2, **request, "columnar": True})
+    response = await client.receive_json()
+    assert response["success"]
+    columns = response["result"]
+
+    assert list(columns) == list(rows) == ["sensor.test", "climate.test"]
+    for entity_id, entity_rows in rows.items():
+        entity_columns = columns[entity_id]
+        assert entity_columns["s"] == [row["s"] for row in entity_rows]
+        assert entity_columns["lu"] == [row["lu"] for row in entity_rows]
+        if no_attributes:
+            assert "a" not in entity_columns
+            assert "a0" not in entity_columns
+        elif minimal_response and entity_id == "sensor.test":
+            assert "a" not in entity_columns
+            # The unit and name of the first row are kept
+            assert entity_columns["a0"] == entity_rows[0]["a"] == {"any": "attr"}
+        else:
+            assert entity_columns["a"] == [row["a"] for row in entity_rows]
+            assert "a0" not in entity_columns
+        if significant_changes_only:
+            assert "lc" not in entity_columns
+        else:
+            assert entity_columns["lc"] == [row.get("lc") for row in entity_rows]
+
+
+async def test_history_during_period_partial_results(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period sends large results in partial results."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    entity_ids = [f"sensor.test_{idx}" for idx in range(5)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "on", attributes={"any": "attr"})
+    # The states of an entity can be split over multiple messages
+    hass.states.async_set("sensor.test_0", "off", attributes={"any": "attr"})
+    hass.states.async_set("sensor.test_0", "on", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {"partial_results": 1},
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    with patch(
+        "homeassistant.components.websocket_api.const.PARTIAL_RESULT_CHUNK_SIZE", 10
+    ):
+        await client.send_json(
+            {
+                "id": 2,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": entity_ids,
+            }
+        )
+        result: dict[str, list[dict[str, Any]]] = {}
+        partial_responses = 0
+        while True:
+            response = await client.receive_json()
+            assert response["id"] == 2
+            assert response["success"]
+            for entity_id, states in response["result"].items():
+                result.setdefault(entity_id, []).extend(states)
+            if not response.get("partial"):
+                break
+            partial_responses += 1
+
+    assert partial_responses == 6
+    assert list(result) == entity_ids
+    assert [state["s"] for state in result["sensor.test_0"]] == ["on", "off", "on"]
+    assert result["sensor.test_3"][0]["s"] == "on"
+    assert result["sensor.test_3"][0]["a"] == {"any": "attr"}
+
+
+async def test_history_during_period_columnar_partial_results(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test columnar history larger than the chunk size is split by rows."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for state in ("on", "off", "on", "off"):
+        hass.states.async_set("sensor.test_0", state, attributes={"any": state})
+        await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test_1", "on", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    request = {
+        "type": "history/history_during_period",
+        "start_time": now.isoformat(),
+        "entity_ids": ["sensor.test_0", "sensor.test_1"],
+        "significant_changes_only": False,
+        "columnar": True,
+    }
+    await client.send_json({"id": 1, **request})
+    response = await client.receive_json()
+    assert response["success"]
+    expected = response["result"]
+    assert len(expected["sensor.test_0"]["s"]) == 4
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "supported_features",
+            "features": {"partial_results": 1},
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    with patch(
+        "homeassistant.components.websocket_api.const.PARTIAL_RESULT_CHUNK_SIZE", 10
+    ):
+        await client.send_json({"id": 3, **request})
+        result: dict[str, dict[str, list[Any]]] = {}
+        partial_responses = 0
+        while True:
+            response = await client.receive_json()
+            assert response["id"] == 3
+            assert response["success"]
+            for entity_id, columns in response["result"].items():
+                # Every list column of a fragment has the same rows
+                assert len({len(column) for column in columns.values()}) == 1
+                entity_columns = result.setdefault(entity_id, {})
+                for name, column in columns.items():
+                    entity_columns.setdefault(name, []).extend(column)
+            if not response.get("partial"):
+                break
+            partial_responses += 1
+
+    # One message per row of sensor.test_0 and one for sensor.test_1
+    assert partial_responses == 4
+    assert result == expected
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -80,6 +80,38 @@ async def test_access_from_banned_ip(
         assert resp.status == HTTPStatus.FORBIDDEN
 
 
+async def test_access_from_banned_network(
+    hass: HomeAssistant, aiohttp_client: ClientSessionGenerator
+) -> None:
+    """Test accessing to server from a banned network."""
+    app = web.Application()
+    app[KEY_HASS] = hass
+    setup_bans(hass, app, 5)
+    set_real_ip = mock_real_ip(app)
+
+    with patch(
+        "homeassistant.components.http.ban.load_yaml_config_file",
+        return_value={
+            "198.51.100.0/24": {"banned_at": "2016-11-16T19:20:03"},
+            "2001:db8::/32": {"banned_at": "2016-11-16T19:20:03"},
+            "not-an-ip": {"banned_at": "2016-11-16T19:20:03"},
+        },
+    ):
+        client = await aiohttp_client(app)
+
+    assert len(app[KEY_BAN_MANAGER].ip_bans_lookup) == 2
+
+    for remote_addr in ("198.51.100.1", "198.51.100.254", "2001:db8::1"):
+        set_real_ip(remote_addr)
+        resp = await client.get("/")
+        assert resp.status == HTTPStatus.FORBIDDEN
+
+    for remote_addr in ("198.51.101.1", "2001:db9::1"):
+        set_real_ip(remote_addr)
+        resp = await client.get("/")
+        assert resp.status == HTTPStatus.NOT_FOUND
+
+
 async def test_access_from_banned_ip_with_partially_broken_yaml_file(
     hass: HomeAssistant,
     aiohttp_client: ClientSessionGenerator,
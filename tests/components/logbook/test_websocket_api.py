@@ -1567,6 +1567,160 @@ async def test_subscribe_unsubscribe_logbook_stream_entities(
     ) == listeners_without_writes(init_listeners)
 
 
+@patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
+async def test_logbook_streams_share_live_pipeline(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test live streams with the same filters share the rows of the events."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation", "script")
+        ]
+    )
+    await async_wait_recording_done(hass)
+    websocket_client = await hass_ws_client()
+    init_listeners = hass.bus.async_listeners()
+    entity_ids = ["light.small", "binary_sensor.is_light"]
+
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "logbook/event_stream",
+            "start_time": now.isoformat(),
+            "entity_ids": entity_ids,
+        }
+    )
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == TYPE_RESULT
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["event"]["partial"] is True
+    await async_wait_recording_done(hass)
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert "partial" not in msg["event"]
+
+    live_start = dt_util.utcnow()
+    hass.states.async_set("light.small", STATE_ON)
+    hass.states.async_set("light.small", STATE_OFF)
+    await hass.async_block_till_done()
+    state: State = hass.states.get("light.small")
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["event"]["events"] == [
+        {
+            "entity_id": "light.small",
+            "state": "off",
+            "when": state.last_updated_timestamp,
+        }
+    ]
+
+    # The second stream gets the recent rows without querying the database
+    with patch.object(
+        websocket_api, "_async_send_historical_events"
+    ) as mock_send_historical_events:
+        await websocket_client.send_json(
+            {
+                "id": 8,
+                "type": "logbook/event_stream",
+                "start_time": live_start.isoformat(),
+                "entity_ids": list(reversed(entity_ids)),
+            }
+        )
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 8
+        assert msg["type"] == TYPE_RESULT
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 8
+        assert "partial" not in msg["event"]
+        assert msg["event"]["events"] == [
+            {
+                "entity_id": "light.small",
+                "state": "off",
+                "when": state.last_updated_timestamp,
+            }
+        ]
+    mock_send_historical_events.assert_not_called()
+    assert len(hass.data[websocket_api.DATA_LIVE_PIPELINES]) == 1
+
+    with patch.object(
+        websocket_api.EventProcessor,
+        "humanify",
+        autospec=True,
+        side_effect=websocket_api.EventProcessor.humanify,
+    ) as mock_humanify:
+        hass.states.async_set("light.small", STATE_ON)
+        await hass.async_block_till_done()
+        state = hass.states.get("light.small")
+        live_events = [
+            {
+                "entity_id": "light.small",
+                "state": "on",
+                "when": state.last_updated_timestamp,
+            }
+        ]
+        msgs = [
+            await asyncio.wait_for(websocket_client.receive_json(), 2),
+            await asyncio.wait_for(websocket_client.receive_json(), 2),
+        ]
+    assert mock_humanify.call_count == 1
+    assert sorted(msg["id"] for msg in msgs) == [7, 8]
+    assert all(msg["event"]["events"] == live_events for msg in msgs)
+
+    for subscription in (7, 8):
+        await websocket_client.send_json(
+            {
+                "id": 9 + subscription,
+                "type": "unsubscribe_events",
+                "subscription": subscription,
+            }
+        )
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["success"]
+
+    assert not hass.data[websocket_api.DATA_LIVE_PIPELINES]
+    assert listeners_without_writes(
+        hass.bus.async_listeners()
+    ) == listeners_without_writes(init_listeners)
+
+
+async def test_logbook_live_pipeline_keyed_by_event_types(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test live streams only share a pipeline when the event types match."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_wait_recording_done(hass)
+    entity_ids = ["light.small"]
+
+    first, running = websocket_api._async_get_live_pipeline(hass, entity_ids, None)
+    assert not running
+    shared, running = websocket_api._async_get_live_pipeline(hass, entity_ids, None)
+    assert running
+    assert shared is first
+
+    # The event types change when a config entry is added for the entities
+    with patch.object(
+        websocket_api,
+        "async_determine_event_types",
+        return_value=(*first.event_types, "new_event_type"),
+    ):
+        second, running = websocket_api._async_get_live_pipeline(hass, entity_ids, None)
+    assert not running
+    assert second is not first
+    assert "new_event_type" in second.event_types
+    assert len(hass.data[websocket_api.DATA_LIVE_PIPELINES]) == 2
+
+    first.async_stop()
+    second.async_stop()
+    assert not hass.data[websocket_api.DATA_LIVE_PIPELINES]
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_unsubscribe_logbook_stream_entities_with_end_time(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
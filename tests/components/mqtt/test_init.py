@@ -23,6 +23,8 @@ from homeassistant.components.mqtt.client import (
     _LOGGER as CLIENT_LOGGER,
     RECONNECT_INTERVAL_SECONDS,
     EnsureJobAfterCooldown,
+    Subscription,
+    SubscriptionTrie,
 )
 from homeassistant.components.mqtt.models import (
     MessageCallbackType,
@@ -1384,6 +1386,90 @@ async def test_subscribe_special_characters(
     assert calls[0].payload == payload
 
 
+@pytest.mark.parametrize(
+    ("topic", "expected"),
+    [
+        ("sport/tennis/player1", {"sport/#", "sport/tennis/+", "+/tennis/#", "#"}),
+        ("sport/tennis", {"sport/#", "sport/+", "+/tennis/#", "#"}),
+        ("sport", {"sport/#", "#"}),
+        ("sport/", {"sport/#", "sport/+", "#"}),
+        ("finance/tennis/player1", {"+/tennis/#", "#"}),
+        ("$internal/tennis/player1", set()),
+        ("$SYS/monitor/clients", {"$SYS/#", "$SYS/monitor/+"}),
+    ],
+)
+def test_subscription_trie_matches(topic: str, expected: set[str]) -> None:
+    """Test the wildcard subscription trie matches topics like the MQTT spec."""
+    trie = SubscriptionTrie()
+    for topic_filter in (
+        "sport/#",
+        "sport/+",
+        "sport/tennis/+",
+        "+/tennis/#",
+        "#",
+        "$SYS/#",
+        "$SYS/monitor/+",
+    ):
+        trie.add(Subscription(topic_filter, ha.HassJob(lambda msg: None)))
+
+    assert {subscription.topic for subscription in trie.matches(topic)} == expected
+
+
+def test_subscription_trie_add_remove() -> None:
+    """Test adding and removing subscriptions from the subscription trie."""
+    trie = SubscriptionTrie()
+    sub1 = Subscription("home/+/state", ha.HassJob(lambda msg: None))
+    sub2 = Subscription("home/+/state", ha.HassJob(lambda msg: None))
+    sub3 = Subscription("home/#", ha.HassJob(lambda msg: None))
+    trie.add(sub1)
+    trie.add(sub2)
+    trie.add(sub3)
+
+    assert len(trie) == 3
+    assert set(trie) == {sub1, sub2, sub3}
+    assert "home/+/state" in trie
+    assert "home/+" not in trie
+    assert trie.matches("home/kitchen/state") == [sub3, sub1, sub2]
+
+    trie.remove(sub1)
+    assert trie.matches("home/kitchen/state") == [sub3, sub2]
+    trie.remove(sub2)
+    assert "home/+/state" not in trie
+    assert trie.matches("home/kitchen/state") == [sub3]
+    with pytest.raises(ValueError):
+        trie.remove(sub2)
+    trie.remove(sub3)
+
+    assert len(trie) == 0
+    assert list(trie) == []
+    assert trie.matches("home/kitchen/state") == []
+
+
+async def test_subscribe_overlapping_wildcard_topics(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test overlapping wildcard subscriptions all receive matching messages."""
+    await mqtt_mock_entry()
+    await mqtt.async_subscribe(hass, "zigbee2mqtt/+", record_calls)
+    unsub = await mqtt.async_subscribe(hass, "zigbee2mqtt/#", record_calls)
+    await mqtt.async_subscribe(hass, "tasmota/+/state", record_calls)
+
+    async_fire_mqtt_message(hass, "zigbee2mqtt/bulb", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+    calls.clear()
+    unsub()
+    async_fire_mqtt_message(hass, "zigbee2mqtt/bulb", "test-payload")
+    async_fire_mqtt_message(hass, "zigbee2mqtt/bulb/availability", "online")
+    async_fire_mqtt_message(hass, "tasmota/plug/state", "ON")
+    await hass.async_block_till_done()
+    assert [call.topic for call in calls] == ["zigbee2mqtt/bulb", "tasmota/plug/state"]
+
+
 @patch("homeassistant.components.mqtt.client.INITIAL_SUBSCRIBE_COOLDOWN", 0.0)
 @patch("homeassistant.components.mqtt.client.DISCOVERY_COOLDOWN", 0.0)
 @patch("homeassistant.components.mqtt.client.SUBSCRIBE_COOLDOWN", 0.0)
@@ -196,6 +196,81 @@ async def test_view_default_namespace(
     )
 
 
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_openmetrics(
+    client: ClientSessionGenerator, sensor_entities: dict[str, er.RegistryEntry]
+) -> None:
+    """Test prometheus metrics view in the OpenMetrics format."""
+    resp = await client.get(
+        prometheus.API_ENDPOINT,
+        headers={"Accept": "application/openmetrics-text; version=0.0.1"},
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["content-type"] == (
+        "application/openmetrics-text; version=0.0.1; charset=utf-8"
+    )
+    body = (await resp.text()).split("\n")
+
+    assert "# TYPE python_info gauge" in body
+    assert "# TYPE state_change counter" in body
+    assert (
+        'sensor_temperature_celsius{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 15.6' in body
+    )
+    assert (
+        'state_change_total{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 1.0' in body
+    )
+    assert body[-2:] == ["# EOF", ""]
+
+
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_gzip(
+    hass: HomeAssistant,
+    client: ClientSessionGenerator,
+    sensor_entities: dict[str, er.RegistryEntry],
+) -> None:
+    """Test prometheus metrics view compressed and after a state change."""
+    resp = await client.get(
+        prometheus.API_ENDPOINT, headers={"Accept-Encoding": "gzip"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["content-encoding"] == "gzip"
+    body = (await resp.text()).split("\n")
+
+    assert (
+        'sensor_temperature_celsius{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 15.6' in body
+    )
+
+    set_state_with_entry(
+        hass,
+        sensor_entities["sensor_1"],
+        17.2,
+        {ATTR_FRIENDLY_NAME: "Outside Temperature"},
+    )
+    await hass.async_block_till_done()
+
+    resp = await client.get(
+        prometheus.API_ENDPOINT, headers={"Accept-Encoding": "gzip"}
+    )
+    body = (await resp.text()).split("\n")
+
+    assert (
+        'sensor_temperature_celsius{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 17.2' in body
+    )
+    assert (
+        'state_change_total{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 2.0' in body
+    )
+
+
 @pytest.mark.parametrize("namespace", [""])
 async def test_sensor_unit(
     client: ClientSessionGenerator, sensor_entities: dict[str, er.RegistryEntry]
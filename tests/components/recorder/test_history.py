@@ -592,6 +592,65 @@ async def test_get_significant_states_minimal_response(
     )
 
 
+@pytest.mark.parametrize("minimal_response", [True, False])
+async def test_get_significant_states_columnar(
+    hass: HomeAssistant, minimal_response: bool
+) -> None:
+    """Test columnar significant states match the compressed state format."""
+    zero, four, states = record_states(hass)
+    await async_wait_recording_done(hass)
+
+    hist = history.get_significant_states(
+        hass,
+        zero,
+        four,
+        entity_ids=list(states),
+        minimal_response=minimal_response,
+        compressed_state_format=True,
+    )
+    columnar = history.get_significant_states_columnar(
+        hass,
+        zero,
+        four,
+        entity_ids=list(states),
+        minimal_response=minimal_response,
+    )
+
+    assert list(columnar) == list(hist)
+    for entity_id, entity_states in hist.items():
+        columns = columnar[entity_id]
+        assert columns["s"] == [state["s"] for state in entity_states]
+        assert columns["lu"] == [state["lu"] for state in entity_states]
+        assert "lc" not in columns
+        if minimal_response and not entity_id.startswith("thermostat."):
+            assert "a" not in columns
+            # The first state keeps its attributes like the row format
+            assert columns["a0"] == entity_states[0]["a"]
+            assert all("a" not in state for state in entity_states[1:])
+        else:
+            assert columns["a"] == [state["a"] for state in entity_states]
+            assert "a0" not in columns
+
+    assert columnar["thermostat.test"]["a"] == [
+        {"current_temperature": 19.5},
+        {"current_temperature": 19.8},
+        {"current_temperature": 20},
+    ]
+
+
+async def test_get_significant_states_columnar_no_matches(
+    hass: HomeAssistant,
+) -> None:
+    """Test columnar significant states with entities not in the db."""
+    now = dt_util.utcnow()
+    assert (
+        history.get_significant_states_columnar(hass, now, None, ["nonexistent.entity"])
+        == {}
+    )
+    with pytest.raises(ValueError, match="entity_ids must be provided"):
+        history.get_significant_states_columnar(hass, now, None)
+
+
 @pytest.mark.parametrize("time_zone", ["Europe/Berlin", "US/Hawaii", "UTC"])
 async def test_get_significant_states_with_initial(
     time_zone, hass: HomeAssistant
@@ -8,7 +8,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import sqlite3
 import threading
-from typing import cast
+from typing import Any, cast
 from unittest.mock import MagicMock, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
@@ -1467,6 +1467,139 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+async def test_saving_sets_old_state_chain_inside_commit_interval(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test old states are linked for many changes of one entity in one commit."""
+    for state in range(10):
+        hass.states.async_set("sensor.power", str(state), {"unit": "W"})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.power", "10", {"unit": "W"})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(States.state_id, States.old_state_id, States.state)
+            .order_by(States.state_id)
+            .all()
+        )
+        assert [state.state for state in states] == [str(idx) for idx in range(11)]
+        assert states[0].old_state_id is None
+        for old_state, state in zip(states, states[1:], strict=False):
+            assert state.old_state_id == old_state.state_id
+
+
+@pytest.mark.parametrize("bulk_insert", [True, False])
+async def test_saving_states_and_events_with_and_without_bulk_insert(
+    hass: HomeAssistant, setup_recorder: None, bulk_insert: bool
+) -> None:
+    """Test states and events are saved the same way with and without bulk insert."""
+    instance = recorder.get_instance(hass)
+    if bulk_insert and not instance._bulk_insert:
+        pytest.skip("Database does not support bulk insert with returning")
+    instance._bulk_insert = bulk_insert
+    context = Context(user_id="b36b1e1d4b0f4a51a6c96d50e7d1f6b9")
+
+    hass.bus.async_fire("test_event", {"data": 1}, context=context)
+    hass.bus.async_fire("test_event", {"data": 1}, context=context)
+    hass.bus.async_fire("test_event_no_data", context=context)
+    hass.states.async_set("test.one", "s1", {"attr": 1}, context=context)
+    hass.states.async_set("test.one", "s2", {"attr": 1}, context=context)
+    hass.states.async_set("test.two", "s3", {}, context=context)
+    hass.states.async_remove("test.two", context=context)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        events = list(
+            session.query(EventTypes.event_type, EventData.shared_data)
+            .select_from(Events)
+            .outerjoin(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .outerjoin(EventData, Events.data_id == EventData.data_id)
+            .filter(EventTypes.event_type.in_(("test_event", "test_event_no_data")))
+            .order_by(Events.event_id)
+        )
+        assert [tuple(event) for event in events] == [
+            ("test_event", '{"data":1}'),
+            ("test_event", '{"data":1}'),
+            ("test_event_no_data", None),
+        ]
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                States.context_user_id_bin,
+                StateAttributes.shared_attrs,
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+            .order_by(States.state_id)
+        )
+        assert [(state.entity_id, state.state) for state in states] == [
+            ("test.one", "s1"),
+            ("test.one", "s2"),
+            ("test.two", "s3"),
+            ("test.two", None),
+        ]
+        assert [state.shared_attrs for state in states[:2]] == ['{"attr":1}'] * 2
+        assert states[1].old_state_id == states[0].state_id
+        assert states[3].old_state_id == states[2].state_id
+        assert all(
+            state.context_user_id_bin == bytes.fromhex(context.user_id)
+            for state in states
+        )
+
+
+async def test_backlog_resolves_ids_in_batches(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test ids are resolved in batches when the recorder is behind."""
+    instance = recorder.get_instance(hass)
+    pre_process_startup_events = instance._pre_process_startup_events
+    batch_backlogs: list[tuple[int, int]] = []
+    batch_started = threading.Event()
+    release_batch = threading.Event()
+
+    def _pre_process_and_wait(task_or_events: list[Any]) -> None:
+        batch_backlogs.append((len(task_or_events), instance.backlog))
+        if not batch_started.is_set():
+            batch_started.set()
+            release_batch.wait(10)
+        pre_process_startup_events(task_or_events)
+
+    with (
+        patch.object(recorder.core, "PRE_PROCESS_BACKLOG_MIN_SIZE", 5),
+        patch.object(
+            instance,
+            "_pre_process_startup_events",
+            side_effect=_pre_process_and_wait,
+        ) as pre_process_mock,
+    ):
+        await async_block_recorder(hass, 0.1)
+        for state in range(20):
+            hass.states.async_set(f"test.entity_{state}", "on", {"idx": state})
+        await hass.async_add_executor_job(batch_started.wait, 10)
+
+        # The batch taken off the queue is still part of the backlog
+        # and block till done waits for it to be processed
+        block_till_done = hass.async_create_task(instance.async_block_till_done())
+        await asyncio.sleep(0.01)
+        assert not block_till_done.done()
+        release_batch.set()
+        await block_till_done
+        await async_wait_recording_done(hass)
+
+    assert pre_process_mock.called
+    # The whole batch is counted in the backlog while it is pre processed
+    assert all(backlog >= batch_size for batch_size, backlog in batch_backlogs)
+    assert instance.backlog == 0
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(States).count() == 20
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
@@ -1,5 +1,6 @@
 """The tests for the Recorder component."""
 
+from copy import deepcopy
 from datetime import datetime, timedelta
 from unittest.mock import PropertyMock
 
@@ -21,11 +22,16 @@ from homeassistant.components.recorder.models import (
     process_timestamp_to_utc_isoformat,
     ulid_to_bytes_or_none,
 )
+from homeassistant.components.recorder.models.state_attributes import (
+    AttributesCache,
+    DecodedAttributesCache,
+)
 from homeassistant.const import EVENT_STATE_CHANGED
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import InvalidEntityFormatError
 from homeassistant.util import dt as dt_util
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 
 def test_from_event_to_db_event() -> None:
@@ -292,6 +298,84 @@ async def test_lazy_state_can_decode_attributes(
     }
 
 
+async def test_lazy_state_shares_decoded_attributes_between_queries() -> None:
+    """Test decoded attributes are shared between queries and read-only."""
+    cache = DecodedAttributesCache(1024 * 1024)
+    row = PropertyMock(
+        entity_id="sensor.shared",
+        attributes='{"shared":"between queries","nested":{"list":[1,{"a":2}]}}',
+    )
+    first = LazyState(
+        row, AttributesCache(cache), None, row.entity_id, "", 1, False
+    ).attributes
+    second = LazyState(
+        row, AttributesCache(cache), None, row.entity_id, "", 1, False
+    ).attributes
+    assert first == {"shared": "between queries", "nested": {"list": [1, {"a": 2}]}}
+    assert second is first
+    assert cache.as_dict() == {
+        "entries": 1,
+        "size_bytes": cache.size_bytes,
+        "max_bytes": 1024 * 1024,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+    }
+    # The decoded size is accounted, not only the source length
+    assert cache.size_bytes > 2 * len(row.attributes)
+    with pytest.raises(RuntimeError):
+        first["shared"] = "modified"
+    with pytest.raises(RuntimeError):
+        first["nested"]["list"] = []
+    with pytest.raises(RuntimeError):
+        first["nested"]["list"].append(3)
+    with pytest.raises(RuntimeError):
+        first["nested"]["list"][1]["a"] = 3
+    assert first == {"shared": "between queries", "nested": {"list": [1, {"a": 2}]}}
+    # Copies are plain and mutable
+    copied = deepcopy(first)
+    copied["nested"]["list"].append(3)
+    assert first["nested"]["list"] == [1, {"a": 2}]
+
+    # Without a shared cache the attributes are decoded for each query
+    third = LazyState(row, {}, None, row.entity_id, "", 1, False).attributes
+    assert third == first
+    assert third is not first
+    third["shared"] = "modified"
+    assert cache.hits == 1
+
+
+def test_decoded_attributes_cache_evicts_least_recently_used() -> None:
+    """Test the decoded attributes cache is bounded by the accounted size."""
+    cache = DecodedAttributesCache(20)
+    cache.set('{"a":1}', ReadOnlyDict({"a": 1}), 8)
+    cache.set('{"b":2}', ReadOnlyDict({"b": 2}), 8)
+    assert cache.get('{"a":1}') == {"a": 1}
+    cache.set('{"c":3}', ReadOnlyDict({"c": 3}), 8)
+    assert len(cache) == 2
+    assert cache.size_bytes == 16
+    assert cache.evictions == 1
+    assert cache.get('{"b":2}') is None
+    assert cache.get('{"a":1}') == {"a": 1}
+    assert cache.get('{"c":3}') == {"c": 3}
+
+    # Entries larger than the cache are never cached
+    cache.set('{"d":4}', ReadOnlyDict({"d": 4}), 21)
+    assert cache.get('{"d":4}') is None
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.as_dict() == {
+        "entries": 0,
+        "size_bytes": 0,
+        "max_bytes": 20,
+        "hits": 0,
+        "misses": 0,
+        "evictions": 0,
+    }
+
+
 async def test_lazy_state_handles_different_last_updated_and_last_changed(
     caplog: pytest.LogCaptureFixture,
 ) -> None:
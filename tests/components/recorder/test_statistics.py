@@ -15,11 +15,13 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.components.recorder.statistics import (
     STATISTIC_UNIT_TO_UNIT_CONVERTER,
+    HourlyStatisticsAccumulator,
     _generate_max_mean_min_statistic_in_sub_period_stmt,
     _generate_statistics_at_time_stmt,
     _generate_statistics_during_period_stmt,
     async_add_external_statistics,
     async_import_statistics,
+    get_hourly_statistics_accumulator,
     get_last_short_term_statistics,
     get_last_statistics,
     get_latest_short_term_statistics_with_session,
@@ -374,6 +376,168 @@ async def test_compile_periodic_statistics_exception(
     }
 
 
+def test_hourly_statistics_accumulator() -> None:
+    """Test the hourly statistics accumulator summarizes a full hour."""
+    accumulator = HourlyStatisticsAccumulator()
+    hour_start = dt_util.as_utc(dt_util.parse_datetime("2022-10-03 10:00:00"))
+    for period in range(12):
+        start = hour_start + timedelta(minutes=5 * period)
+        assert accumulator.summary(hour_start) is None
+        accumulator.add_period(
+            start,
+            [
+                (1, {"start": start, "mean": period, "min": -period, "max": period}),
+                (
+                    2,
+                    {
+                        "start": start,
+                        "last_reset": hour_start,
+                        "state": 5,
+                        "sum": period,
+                    },
+                ),
+            ],
+        )
+
+    assert accumulator.row_count == 24
+    assert accumulator.summary(hour_start + timedelta(hours=1)) is None
+    assert accumulator.summary(hour_start) == {
+        1: {
+            "start_ts": hour_start.timestamp(),
+            "mean": 5.5,
+            "min": -11,
+            "max": 11,
+            "last_reset_ts": None,
+            "state": None,
+            "sum": None,
+        },
+        2: {
+            "start_ts": hour_start.timestamp(),
+            "mean": None,
+            "min": None,
+            "max": None,
+            "last_reset_ts": hour_start.timestamp(),
+            "state": 5,
+            "sum": 11,
+        },
+    }
+
+    accumulator.invalidate()
+    assert accumulator.summary(hour_start) is None
+    assert accumulator.row_count == 0
+
+
+@pytest.mark.parametrize(
+    "periods",
+    [
+        # Started in the middle of the hour
+        range(1, 12),
+        # Missed a period
+        [0, 1, 2, 4, 5, 6, 7, 8, 9, 10, 11],
+        # Compiled a period twice
+        [0, 1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11],
+    ],
+)
+def test_hourly_statistics_accumulator_incomplete_hour(periods: list[int]) -> None:
+    """Test the hourly statistics accumulator does not summarize incomplete hours."""
+    accumulator = HourlyStatisticsAccumulator()
+    hour_start = dt_util.as_utc(dt_util.parse_datetime("2022-10-03 10:00:00"))
+    for period in periods:
+        start = hour_start + timedelta(minutes=5 * period)
+        accumulator.add_period(start, [(1, {"start": start, "mean": period})])
+
+    assert accumulator.summary(hour_start) is None
+
+
+@pytest.mark.parametrize(
+    ("periods", "summarized_in_database"),
+    [(range(12), False), (range(1, 12), True)],
+)
+async def test_compile_hourly_statistics_from_accumulator(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    periods: range,
+    summarized_in_database: bool,
+) -> None:
+    """Test hourly statistics are compiled from memory when the hour is complete."""
+    await async_setup_component(hass, "sensor", {})
+    await async_wait_recording_done(hass)
+    hour_start = dt_util.as_utc(dt_util.parse_datetime("2022-10-03 10:00:00"))
+
+    def get_fake_stats(_hass, session, start, _end):
+        value = (start - hour_start).total_seconds() / 300
+        return statistics.PlatformCompiledStatistics(
+            [
+                {
+                    "meta": {
+                        "has_mean": True,
+                        "has_sum": False,
+                        "name": None,
+                        "statistic_id": "sensor.test1",
+                        "unit_of_measurement": "dogs",
+                    },
+                    "stat": {
+                        "start": start,
+                        "mean": value,
+                        "min": value - 1,
+                        "max": value + 1,
+                    },
+                }
+            ],
+            get_metadata(_hass, statistic_ids={"sensor.test1"}),
+        )
+
+    with (
+        patch(
+            "homeassistant.components.sensor.recorder.compile_statistics",
+            side_effect=get_fake_stats,
+        ),
+        patch(
+            "homeassistant.components.recorder.statistics._compile_hourly_statistics_summary",
+            wraps=statistics._compile_hourly_statistics_summary,
+        ) as summary_mock,
+    ):
+        for period in periods:
+            do_adhoc_statistics(hass, start=hour_start + timedelta(minutes=5 * period))
+            await async_wait_recording_done(hass)
+
+    assert summary_mock.called is summarized_in_database
+    stats = statistics_during_period(
+        hass, hour_start, period="hour", statistic_ids={"sensor.test1"}
+    )
+    first_period = periods[0]
+    assert stats == {
+        "sensor.test1": [
+            {
+                "start": hour_start.timestamp(),
+                "end": (hour_start + timedelta(hours=1)).timestamp(),
+                "mean": pytest.approx((first_period + 11) / 2),
+                "min": first_period - 1,
+                "max": 12,
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ]
+    }
+
+
+async def test_adjust_statistics_invalidates_hourly_accumulator(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test adjusting statistics invalidates the hourly statistics accumulator."""
+    hour_start = dt_util.as_utc(dt_util.parse_datetime("2022-10-03 10:00:00"))
+    accumulator = get_hourly_statistics_accumulator(hass)
+    accumulator.add_period(hour_start, [(1, {"start": hour_start, "sum": 1})])
+    assert accumulator.row_count == 1
+
+    recorder.get_instance(hass).async_adjust_statistics(
+        "sensor.unknown", hour_start, 5, "kWh"
+    )
+    await async_wait_recording_done(hass)
+    assert accumulator.row_count == 0
+
+
 async def test_rename_entity(
     hass: HomeAssistant, entity_registry: er.EntityRegistry, setup_recorder: None
 ) -> None:
@@ -2468,3 +2632,55 @@ async def test_change_with_none(
         types={"change"},
     )
     assert stats == {}
+
+
+async def test_reduce_statistics_per_day_missing_values(hass: HomeAssistant) -> None:
+    """Test reducing hourly statistics skips missing values of a period."""
+    await hass.config.async_set_time_zone("UTC")
+    day1 = dt_util.parse_datetime("2023-05-08 00:00:00+00:00").timestamp()
+    day2 = day1 + 86400
+    day4 = day2 + 2 * 86400
+
+    def hourly(start: float, mean: float | None) -> dict[str, float | None]:
+        return {"start": start, "mean": mean, "min": mean, "max": mean, "sum": start}
+
+    stats = {
+        "sensor.test": [
+            hourly(day1, 1.0),
+            hourly(day1 + 3600, None),
+            hourly(day1 + 7200, 3.0),
+            hourly(day2 + 3600, None),
+            hourly(day4, 4.0),
+        ]
+    }
+    reduced = statistics._reduce_statistics_per_day(
+        stats, {"max", "mean", "min", "sum"}
+    )
+    assert reduced == {
+        "sensor.test": [
+            {
+                "start": day1,
+                "end": day2,
+                "mean": 2.0,
+                "min": 1.0,
+                "max": 3.0,
+                "sum": day1 + 7200,
+            },
+            {
+                "start": day2,
+                "end": day2 + 86400,
+                "mean": None,
+                "min": None,
+                "max": None,
+                "sum": day2 + 3600,
+            },
+            {
+                "start": day4,
+                "end": day4 + 86400,
+                "mean": 4.0,
+                "min": 4.0,
+                "max": 4.0,
+                "sum": day4,
+            },
+        ]
+    }
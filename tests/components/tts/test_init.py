@@ -30,6 +30,7 @@ from .common import (
     SUPPORT_LANGUAGES,
     TEST_DOMAIN,
     MockProvider,
+    MockTTS,
     MockTTSEntity,
     get_media_source_url,
     mock_config_entry_setup,
@@ -37,7 +38,14 @@ from .common import (
     retrieve_media,
 )
 
-from tests.common import async_mock_service, mock_restore_cache
+from tests.common import (
+    MockModule,
+    async_fire_time_changed,
+    async_mock_service,
+    mock_integration,
+    mock_platform,
+    mock_restore_cache,
+)
 from tests.typing import ClientSessionGenerator, WebSocketGenerator
 
 ORIG_WRITE_TAGS = tts.SpeechManager.write_tags
@@ -1577,6 +1585,205 @@ async def test_fetching_in_async(
     )
 
 
+class EntityWithMessageAudio(MockTTSEntity):
+    """Entity that returns the message as audio."""
+
+    def get_tts_audio(
+        self, message: str, language: str, options: dict[str, Any]
+    ) -> tts.TtsAudioType:
+        """Return the message as audio."""
+        return ("mp3", message.encode())
+
+
+async def test_cache_evicts_least_recently_used(
+    hass: HomeAssistant, mock_tts_cache_dir
+) -> None:
+    """Test the least recently used audio is evicted above the cache sizes."""
+    await mock_config_entry_setup(hass, EntityWithMessageAudio(DEFAULT_LANG))
+    manager: tts.SpeechManager = hass.data[tts.DATA_TTS_MANAGER]
+    manager.memory_cache_max_bytes = 10
+    manager.disk_cache_max_bytes = 10
+
+    media_source_ids = {
+        message: tts.generate_media_source_id(hass, message, "tts.test", "en_US")
+        for message in ("one", "two", "three", "four")
+    }
+
+    async def get_audio(message: str) -> None:
+        media_source_id = media_source_ids[message]
+        assert await tts.async_get_media_source_audio(hass, media_source_id) == (
+            "mp3",
+            message.encode(),
+        )
+        await hass.async_block_till_done()
+
+    await get_audio("one")
+    await get_audio("two")
+    # Memory hit makes "one" the most recently used in memory
+    await get_audio("one")
+    await get_audio("three")
+    await get_audio("four")
+
+    info = manager.async_cache_info()
+    assert info["memory"]["entries"] == 2
+    assert info["memory"]["bytes"] == 9
+    assert info["disk"]["entries"] == 2
+    assert info["disk"]["bytes"] == 9
+    assert info["stats"] == {
+        "memory_hits": 1,
+        "shared": 0,
+        "disk_hits": 0,
+        "misses": 4,
+        "memory_evictions": 2,
+        "disk_evictions": 2,
+    }
+    assert sorted(path.read_bytes() for path in mock_tts_cache_dir.iterdir()) == [
+        b"four",
+        b"three",
+    ]
+
+    # "two" was evicted from memory and disk, "one" only from memory
+    await get_audio("two")
+    assert manager.stats.misses == 5
+    assert manager.stats.disk_hits == 0
+
+
+async def test_memory_cache_expires(
+    hass: HomeAssistant, mock_tts_cache_dir, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test audio is dropped from memory when it was not used for time_memory."""
+    await mock_config_entry_setup(hass, EntityWithMessageAudio(DEFAULT_LANG))
+    manager: tts.SpeechManager = hass.data[tts.DATA_TTS_MANAGER]
+    media_source_id = tts.generate_media_source_id(hass, "hello", "tts.test", "en_US")
+    await tts.async_get_media_source_audio(hass, media_source_id)
+    await hass.async_block_till_done()
+    assert len(manager.mem_cache) == 1
+
+    freezer.tick(manager.time_memory - 1)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(manager.mem_cache) == 1
+
+    # Using the audio keeps it in memory for longer
+    await tts.async_get_media_source_audio(hass, media_source_id)
+    freezer.tick(2)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(manager.mem_cache) == 1
+    assert manager.stats.memory_hits == 1
+
+    freezer.tick(manager.time_memory)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert not manager.mem_cache
+    assert manager.mem_cache_bytes == 0
+    assert manager.stats.memory_evictions == 1
+
+
+@pytest.mark.parametrize("mock_provider", [MockProvider(DEFAULT_LANG)])
+async def test_setup_cache_max_sizes(
+    hass: HomeAssistant, mock_tts_cache_dir, mock_provider: MockProvider
+) -> None:
+    """Test the maximum sizes of the caches are configured."""
+    mock_integration(hass, MockModule(domain=TEST_DOMAIN))
+    mock_platform(hass, f"{TEST_DOMAIN}.{tts.DOMAIN}", MockTTS(mock_provider))
+    assert await async_setup_component(
+        hass,
+        tts.DOMAIN,
+        {
+            tts.DOMAIN: {
+                "platform": TEST_DOMAIN,
+                "memory_max_size": 8,
+                "cache_max_size": 0,
+            }
+        },
+    )
+    await hass.async_block_till_done()
+
+    manager: tts.SpeechManager = hass.data[tts.DATA_TTS_MANAGER]
+    assert manager.memory_cache_max_bytes == 8 * 1024 * 1024
+    # No maximum for the file cache
+    assert manager.disk_cache_max_bytes == 0
+
+
+async def test_cache_index_skips_cache_dir_scan(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_tts_cache_dir,
+    mock_tts_get_cache_files: MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the cache index is used when the cache dir did not change."""
+    await mock_config_entry_setup(hass, EntityWithMessageAudio(DEFAULT_LANG))
+    manager: tts.SpeechManager = hass.data[tts.DATA_TTS_MANAGER]
+    media_source_id = tts.generate_media_source_id(hass, "hello", "tts.test", "en_US")
+    await tts.async_get_media_source_audio(hass, media_source_id)
+    await hass.async_block_till_done()
+
+    freezer.tick(tts.CACHE_INDEX_SAVE_DELAY + 1)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    index = hass_storage[tts.CACHE_INDEX_STORAGE_KEY]["data"]
+    assert index["cache_dir"] == str(mock_tts_cache_dir)
+    assert index["files"] == [
+        [cache_key, filename, 5] for cache_key, filename in manager.file_cache.items()
+    ]
+
+    mock_tts_get_cache_files.reset_mock()
+    new_manager = tts.SpeechManager(hass, True, str(mock_tts_cache_dir), 300)
+    await new_manager.async_init_cache()
+    mock_tts_get_cache_files.assert_not_called()
+    assert new_manager.file_cache == manager.file_cache
+    assert new_manager.file_cache_bytes == 5
+
+    # A file added behind our back invalidates the index
+    (mock_tts_cache_dir / f"{'0' * 40}_en-us_-_tts.test.mp3").write_bytes(b"data")
+    new_manager = tts.SpeechManager(hass, True, str(mock_tts_cache_dir), 300)
+    await new_manager.async_init_cache()
+    mock_tts_get_cache_files.assert_called_once()
+    assert len(new_manager.file_cache) == 2
+    assert new_manager.file_cache_bytes == 9
+
+
+async def test_ws_cache_info(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting the sizes and counters of the cache."""
+    await mock_config_entry_setup(hass, EntityWithMessageAudio(DEFAULT_LANG))
+    media_source_id = tts.generate_media_source_id(hass, "hello", "tts.test", "en_US")
+    await asyncio.gather(
+        tts.async_get_media_source_audio(hass, media_source_id),
+        tts.async_get_media_source_audio(hass, media_source_id),
+    )
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id({"type": "tts/cache/info"})
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {
+        "memory": {
+            "entries": 1,
+            "bytes": 5,
+            "max_bytes": tts.DEFAULT_MEMORY_MAX_SIZE * 1024 * 1024,
+        },
+        "disk": {
+            "entries": 1,
+            "bytes": 5,
+            "max_bytes": tts.DEFAULT_CACHE_MAX_SIZE * 1024 * 1024,
+        },
+        "stats": {
+            "memory_hits": 0,
+            "shared": 1,
+            "disk_hits": 0,
+            "misses": 1,
+            "memory_evictions": 0,
+            "disk_evictions": 0,
+        },
+    }
+
+
 @pytest.mark.parametrize(
     ("setup", "engine_id"),
     [
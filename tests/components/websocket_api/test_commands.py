@@ -2,6 +2,7 @@
 
 import asyncio
 from copy import deepcopy
+from datetime import timedelta
 import logging
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
@@ -16,7 +17,11 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
-from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
+from homeassistant.components.websocket_api.const import (
+    FEATURE_COALESCE_MESSAGES,
+    FEATURE_PARTIAL_RESULTS,
+    URL,
+)
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
@@ -25,6 +30,7 @@ from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -32,6 +38,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -1260,6 +1267,66 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_coalesce_interval(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test subscribe entities merges changes within the coalesce interval."""
+    hass.states.async_set("light.one", "off", {"color": "red"})
+    hass.states.async_set("light.two", "off")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "coalesce_interval": 1}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.one", "light.two"}
+
+    # The first change is sent right away
+    hass.states.async_set("light.one", "on", {"color": "red"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {"c": {"light.one": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}}
+
+    # The changes within the interval are merged into one message
+    hass.states.async_set("light.one", "off", {"color": "blue"})
+    hass.states.async_set("light.one", "dim", {"color": "green"})
+    hass.states.async_set("light.three", "on")
+    hass.states.async_set("light.four", "on")
+    hass.states.async_remove("light.two")
+    hass.states.async_remove("light.four")
+    await hass.async_block_till_done()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.three": {"s": "on", "a": {}, "c": ANY, "lc": ANY}},
+        "c": {
+            "light.one": {
+                "+": {"a": {"color": "green"}, "c": ANY, "lc": ANY, "s": "dim"}
+            }
+        },
+        "r": ["light.two"],
+    }
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "subscribe_entities", "coalesce_interval": 0}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_INVALID_FORMAT
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -2511,6 +2578,60 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_import_info(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+) -> None:
+    """Test the integration import info command."""
+    with patch(
+        "homeassistant.components.websocket_api.commands.async_get_import_times",
+        return_value={"august": 1.5, "august.config_flow": 0.25},
+    ):
+        await websocket_client.send_json({"id": 7, "type": "integration/import_info"})
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {"module": "august", "seconds": 1.5},
+        {"module": "august.config_flow", "seconds": 0.25},
+    ]
+
+
+async def test_integration_setup_timeline(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+) -> None:
+    """Test the integration setup timeline command."""
+    timeline = {
+        "events": [
+            {
+                "domain": "august",
+                "group": None,
+                "phase": "import",
+                "start": 0.5,
+                "end": 1.5,
+            }
+        ],
+        "dependencies": {"august": ["http"]},
+        "critical_path": ["august"],
+    }
+    with patch(
+        "homeassistant.components.websocket_api.commands.async_get_setup_timeline",
+        return_value=timeline,
+    ):
+        await websocket_client.send_json(
+            {"id": 7, "type": "integration/setup_timeline"}
+        )
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == timeline
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
@@ -2582,6 +2703,89 @@ async def test_validate_config_invalid(
     assert msg["result"] == {key: {"valid": False, "error": error}}
 
 
+async def test_get_states_partial_results(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test get_states sends large results in partial result messages."""
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {FEATURE_PARTIAL_RESULTS: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    for idx in range(10):
+        hass.states.async_set(f"light.partial_{idx}", "on", {"idx": idx})
+
+    with patch(
+        "homeassistant.components.websocket_api.const.PARTIAL_RESULT_CHUNK_SIZE", 500
+    ):
+        await websocket_client.send_json({"id": 5, "type": "get_states"})
+        states = []
+        while True:
+            msg = await websocket_client.receive_json()
+            assert msg["id"] == 5
+            assert msg["type"] == const.TYPE_RESULT
+            assert msg["success"]
+            states.extend(msg["result"])
+            if not msg.get("partial"):
+                break
+            assert msg["result"]
+
+    assert len(states) == 10
+    assert [state["entity_id"] for state in states] == [
+        state.entity_id for state in hass.states.async_all()
+    ]
+    assert states[3]["attributes"] == {"idx": 3}
+
+
+async def test_subscribe_entities_partial_results(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscribe_entities sends large snapshots in multiple events."""
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {FEATURE_PARTIAL_RESULTS: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    for idx in range(10):
+        hass.states.async_set(f"light.partial_{idx}", "on", {"idx": idx})
+
+    with patch(
+        "homeassistant.components.websocket_api.const.PARTIAL_RESULT_CHUNK_SIZE", 500
+    ):
+        await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == 7
+        assert msg["success"]
+
+        added = {}
+        events = 0
+        while len(added) < 10:
+            msg = await websocket_client.receive_json()
+            assert msg["id"] == 7
+            assert msg["type"] == "event"
+            added.update(msg["event"]["a"])
+            events += 1
+
+    assert events > 1
+    assert added["light.partial_3"]["a"] == {"idx": 3}
+
+    hass.states.async_set("light.partial_3", "off", {"idx": 3})
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.partial_3": {"+": {"c": ANY, "lc": ANY, "s": "off"}}}
+    }
+
+
 async def test_message_coalescing(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -1,15 +1,21 @@
 """Test Websocket API messages module."""
 
+from unittest.mock import patch
+
 import pytest
 
 from homeassistant.components.websocket_api.messages import (
     _partial_cached_event_message as lru_event_cache,
     _state_diff_event,
     cached_event_message,
+    dict_of_lists_fragments,
+    entities_init_messages,
     message_to_json_bytes,
+    partial_result_messages,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.util.json import json_loads
 
 from tests.common import async_capture_events
 
@@ -299,5 +305,112 @@ async def test_message_to_json_bytes(caplog: pytest.LogCaptureFixture) -> None:
     assert "Unable to serialize to JSON" in caplog.text
 
 
+@patch("homeassistant.components.websocket_api.const.PARTIAL_RESULT_CHUNK_SIZE", 10)
+async def test_partial_result_messages() -> None:
+    """Test large results are split into partial result messages."""
+    assert list(partial_result_messages(5, [])) == [
+        b'{"id":5,"type":"result","success":true,"result":[]}'
+    ]
+    assert list(partial_result_messages(5, [b'"a"', b'"b"'])) == [
+        b'{"id":5,"type":"result","success":true,"result":["a","b"]}'
+    ]
+
+    fragments = [b'"item_%d"' % idx for idx in range(5)]
+    msgs = [json_loads(msg) for msg in partial_result_messages(5, fragments)]
+    assert len(msgs) == 5
+    assert all(msg["partial"] for msg in msgs[:-1])
+    assert "partial" not in msgs[-1]
+    assert all(msg["id"] == 5 and msg["success"] for msg in msgs)
+    assert [item for msg in msgs for item in msg["result"]] == [
+        f"item_{idx}" for idx in range(5)
+    ]
+
+    fragments = [b'"key_%d":%d' % (idx, idx) for idx in range(5)]
+    msgs = [
+        json_loads(msg) for msg in partial_result_messages(5, fragments, is_object=True)
+    ]
+    assert len(msgs) == 5
+    assert {key: value for msg in msgs for key, value in msg["result"].items()} == {
+        f"key_{idx}": idx for idx in range(5)
+    }
+
+
+@patch("homeassistant.components.websocket_api.const.PARTIAL_RESULT_CHUNK_SIZE", 30)
+async def test_entities_init_messages() -> None:
+    """Test the initial entities are split into entity additions events."""
+    fragments = [b'"light.%d":{"s":"on"}' % idx for idx in range(3)]
+    msgs = [json_loads(msg) for msg in entities_init_messages(7, fragments)]
+    assert msgs == [
+        {"id": 7, "type": "event", "event": {"a": {"light.0": {"s": "on"}}}},
+        {"id": 7, "type": "event", "event": {"a": {"light.1": {"s": "on"}}}},
+        {"id": 7, "type": "event", "event": {"a": {"light.2": {"s": "on"}}}},
+    ]
+    assert list(entities_init_messages(7, [])) == [
+        b'{"id":7,"type":"event","event":{"a":{}}}'
+    ]
+
+
+@patch("homeassistant.components.websocket_api.const.PARTIAL_RESULT_CHUNK_SIZE", 30)
+async def test_dict_of_lists_fragments() -> None:
+    """Test large lists of an object result are split over partial messages."""
+    result = {
+        "sensor.small": [{"s": "on"}],
+        "sensor.large": [{"s": str(idx)} for idx in range(10)],
+        "sensor.after": [{"s": "off"}],
+    }
+    fragments = dict_of_lists_fragments(result)
+    assert next(fragments) == b'"sensor.small":[{"s":"on"}]'
+    # Serialized entities are dropped from the result
+    assert list(result) == ["sensor.large", "sensor.after"]
+
+    msgs = [
+        json_loads(msg) for msg in partial_result_messages(5, fragments, is_object=True)
+    ]
+    assert len(msgs) == 4
+    assert [list(msg["result"]) for msg in msgs] == [
+        ["sensor.large"],
+        ["sensor.large"],
+        ["sensor.large"],
+        ["sensor.after"],
+    ]
+    assert [item for msg in msgs for item in msg["result"]["sensor.large"]] == [
+        {"s": str(idx)} for idx in range(10)
+    ]
+    assert result == {}
+
+
+@patch("homeassistant.components.websocket_api.const.PARTIAL_RESULT_CHUNK_SIZE", 30)
+async def test_dict_of_lists_fragments_columns() -> None:
+    """Test large dicts of columns are split into the same rows of every column."""
+    large = {
+        "s": [str(idx) for idx in range(10)],
+        "lu": [float(idx) for idx in range(10)],
+        "a0": {"unit": "W"},
+    }
+    result = {
+        "sensor.large": {**large},
+        "sensor.empty": {"s": [], "lu": []},
+    }
+    msgs = [
+        json_loads(msg)
+        for msg in partial_result_messages(
+            5, dict_of_lists_fragments(result), is_object=True
+        )
+    ]
+    assert [msg["result"] for msg in msgs] == [
+        {
+            "sensor.large": {
+                "a0": {"unit": "W"},
+                "s": ["0", "1", "2", "3"],
+                "lu": [0.0, 1.0, 2.0, 3.0],
+            }
+        },
+        {"sensor.large": {"s": ["4", "5", "6", "7"], "lu": [4.0, 5.0, 6.0, 7.0]}},
+        {"sensor.large": {"s": ["8", "9"], "lu": [8.0, 9.0]}},
+        {"sensor.empty": {"s": [], "lu": []}},
+    ]
+    assert result == {}
+
+
 class _Unserializeable:
     """A class that cannot be serialized."""
@@ -418,6 +418,24 @@ def test_get_filter() -> None:
     assert underlying_filter("switch.kitchen")
 
 
+def test_filter_results_are_cached() -> None:
+    """Test filters matching domains or globs remember their results."""
+    testfilter = generate_filter(
+        ["light"], ["switch.kitchen"], [], ["light.kitchen"], None, ["light.hall_*"]
+    )
+
+    for _ in range(2):
+        assert testfilter("light.any")
+        assert not testfilter("light.kitchen")
+        assert not testfilter("light.hall_1")
+        assert testfilter("switch.kitchen")
+    assert testfilter.cache_info().hits == 4
+
+    # Filters only matching entity ids are cheap enough without a cache
+    testfilter = generate_filter([], ["switch.kitchen"], [], ["light.kitchen"])
+    assert not hasattr(testfilter, "cache_info")
+
+
 def test_complex_include_exclude_filter() -> None:
     """Test a complex include exclude filter."""
     conf = {
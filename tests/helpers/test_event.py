@@ -24,6 +24,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_state_change_listener_stats,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -31,6 +32,7 @@ from homeassistant.helpers.event import (
     async_track_same_state,
     async_track_state_added_domain,
     async_track_state_change,
+    async_track_state_change_domain,
     async_track_state_change_event,
     async_track_state_change_filtered,
     async_track_state_removed_domain,
@@ -634,6 +636,141 @@ async def test_async_track_state_added_domain_with_empty_list(
     unsub_single()
 
 
+async def test_async_track_state_change_filtered_domain_added_no_churn(
+    hass: HomeAssistant,
+) -> None:
+    """Test entities added to a tracked domain do not resubscribe the listeners."""
+    tracker = []
+
+    @ha.callback
+    def run_callback(event: Event[EventStateChangedData]) -> None:
+        tracker.append(event.data["entity_id"])
+
+    hass.states.async_set("light.existing", "on")
+    stats = async_get_state_change_listener_stats(hass)
+    subscribed = stats.subscribed
+    track = async_track_state_change_filtered(
+        hass,
+        TrackStates(False, {"light.existing", "switch.kitchen"}, {"light"}),
+        run_callback,
+    )
+    # One domain listener and one entity listener for the switch
+    assert stats.subscribed == subscribed + 2
+
+    for idx in range(10):
+        hass.states.async_set(f"light.new_{idx}", "on")
+    hass.states.async_set("light.existing", "off")
+    hass.states.async_set("switch.kitchen", "on")
+    hass.states.async_set("sensor.other", "on")
+    await hass.async_block_till_done()
+    assert tracker == [
+        *(f"light.new_{idx}" for idx in range(10)),
+        "light.existing",
+        "switch.kitchen",
+    ]
+    assert stats.subscribed == subscribed + 2
+
+    # Only the difference in entities is resubscribed
+    unsubscribed = stats.unsubscribed
+    track.async_update_listeners(
+        TrackStates(False, {"switch.kitchen", "sensor.other"}, {"light"})
+    )
+    assert stats.subscribed == subscribed + 3
+    assert stats.unsubscribed == unsubscribed
+    hass.states.async_set("sensor.other", "off")
+    await hass.async_block_till_done()
+    assert tracker[-1] == "sensor.other"
+
+    track.async_remove()
+    assert stats.unsubscribed == unsubscribed + 3
+    hass.states.async_set("light.existing", "on")
+    await hass.async_block_till_done()
+    assert tracker[-1] == "sensor.other"
+
+
+async def test_async_track_state_change_domain(hass: HomeAssistant) -> None:
+    """Test async_track_state_change_domain."""
+    single_entity_id_tracker = []
+    match_all_entity_id_tracker = []
+
+    @ha.callback
+    def single_run_callback(event: Event[EventStateChangedData]) -> None:
+        single_entity_id_tracker.append(
+            (event.data["old_state"], event.data["new_state"])
+        )
+
+    @ha.callback
+    def match_all_run_callback(event: Event[EventStateChangedData]) -> None:
+        match_all_entity_id_tracker.append(
+            (event.data["old_state"], event.data["new_state"])
+        )
+
+    unsub_single = async_track_state_change_domain(hass, "Light", single_run_callback)
+    unsub_match_all = async_track_state_change_domain(
+        hass, MATCH_ALL, match_all_run_callback
+    )
+    stats = async_get_state_change_listener_stats(hass)
+    events = stats.events
+
+    hass.states.async_set("light.Bowl", "on")
+    await hass.async_block_till_done()
+    assert len(single_entity_id_tracker) == 1
+    assert single_entity_id_tracker[-1][0] is None
+    assert len(match_all_entity_id_tracker) == 1
+    assert stats.events == events + 1
+    assert stats.max_fan_out >= 2
+
+    hass.states.async_set("light.Bowl", "off")
+    await hass.async_block_till_done()
+    assert len(single_entity_id_tracker) == 2
+    assert single_entity_id_tracker[-1][0] is not None
+    assert single_entity_id_tracker[-1][1] is not None
+
+    hass.states.async_remove("light.bowl")
+    await hass.async_block_till_done()
+    assert len(single_entity_id_tracker) == 3
+    assert single_entity_id_tracker[-1][1] is None
+
+    hass.states.async_set("switch.kitchen", "on")
+    await hass.async_block_till_done()
+    assert len(single_entity_id_tracker) == 3
+    assert len(match_all_entity_id_tracker) == 4
+
+    unsub_single()
+    unsub_match_all()
+    hass.states.async_set("light.Bowl", "on")
+    await hass.async_block_till_done()
+    assert len(single_entity_id_tracker) == 3
+    assert len(match_all_entity_id_tracker) == 4
+
+
+async def test_state_change_listener_stats_only_count_state_change_dispatch(
+    hass: HomeAssistant,
+) -> None:
+    """Test only state change listeners with jobs are counted in the stats."""
+    stats = async_get_state_change_listener_stats(hass)
+    unsub_added = async_track_state_added_domain(
+        hass, "light", ha.callback(lambda event: None)
+    )
+    unsub_changed = async_track_state_change_domain(
+        hass, "light", ha.callback(lambda event: None)
+    )
+    events = stats.events
+    jobs = stats.jobs
+
+    # The state added tracker is not counted
+    hass.states.async_set("light.bowl", "on")
+    await hass.async_block_till_done()
+    assert stats.events == events + 1
+    assert stats.jobs == jobs + 1
+
+    unsub_changed()
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+    assert stats.events == events + 1
+    unsub_added()
+
+
 async def test_async_track_state_removed_domain_with_empty_list(
     hass: HomeAssistant,
 ) -> None:
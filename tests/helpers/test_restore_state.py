@@ -6,6 +6,7 @@ import logging
 from typing import Any
 from unittest.mock import Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
@@ -17,6 +18,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    LAST_SEEN_REFRESH_INTERVAL,
     STORAGE_KEY,
     RestoreEntity,
     RestoreStateData,
@@ -269,6 +271,36 @@ async def test_hass_starting(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
 
+async def test_dump_keeps_last_seen(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the last seen time of current entities is refreshed periodically."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b1"
+    await platform.async_add_entities([entity])
+    data = async_get(hass)
+
+    async def dump_last_seen() -> datetime:
+        with patch(
+            "homeassistant.helpers.restore_state.Store.async_save"
+        ) as mock_write_data:
+            await data.async_dump_states()
+        (written_state,) = mock_write_data.mock_calls[0][1][0]
+        return written_state["last_seen"]
+
+    first_seen = dt_util.utcnow()
+    assert await dump_last_seen() == first_seen
+
+    # Unchanged states are stored unchanged between refreshes
+    freezer.tick(timedelta(minutes=30))
+    assert await dump_last_seen() == first_seen
+
+    freezer.tick(LAST_SEEN_REFRESH_INTERVAL)
+    assert await dump_last_seen() == dt_util.utcnow()
+
+
 async def test_dump_data(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
@@ -3,6 +3,7 @@
 import asyncio
 from datetime import timedelta
 import json
+from operator import itemgetter
 import os
 from typing import Any, NamedTuple
 from unittest.mock import Mock, patch
@@ -839,6 +840,69 @@ async def test_json_load_failure(tmpdir: py.path.local) -> None:
         await hass.async_stop(force=True)
 
 
+async def test_journal(tmpdir: py.path.local) -> None:
+    """Test saves append the changes to a journal until the final write."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_item_key=itemgetter("id")
+        )
+        journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+        items = [{"id": str(index), "value": "x" * 100} for index in range(10)]
+        await store.async_save({"items": items, "deleted": [], "counter": 1})
+
+        def read_file() -> dict[str, Any]:
+            with open(store.path, encoding="utf8") as fdesc:
+                return json.load(fdesc)
+
+        first_file = await hass.async_add_executor_job(read_file)
+        assert first_file["data"] == {"items": items, "deleted": [], "counter": 1}
+        assert not await hass.async_add_executor_job(os.path.exists, journal_path)
+
+        items[2] = {"id": "2", "value": "changed"}
+        deleted = [items.pop(5)]
+        items.append({"id": "10", "value": "new"})
+        data = {"items": items, "deleted": deleted, "counter": 2}
+        await store.async_save(data)
+
+        # Only the changes were written
+        assert await hass.async_add_executor_job(read_file) == first_file
+
+        def read_journal() -> dict[str, Any]:
+            with open(journal_path, encoding="utf8") as fdesc:
+                return json.load(fdesc)
+
+        assert await hass.async_add_executor_job(read_journal) == {
+            "base": first_file["journal"],
+            "version": MOCK_VERSION,
+            "minor_version": 1,
+            "set": {
+                "items": [
+                    {"id": "2", "value": "changed"},
+                    {"id": "10", "value": "new"},
+                ],
+                "deleted": deleted,
+            },
+            "remove": {"items": ["5"]},
+            "values": {"counter": 2},
+        }
+
+        new_store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal_item_key=itemgetter("id")
+        )
+        assert await new_store.async_load() == data
+
+        # The final write leaves a plain JSON file behind
+        hass.set_state(CoreState.stopping)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        assert not await hass.async_add_executor_job(os.path.exists, journal_path)
+        assert (await hass.async_add_executor_job(read_file))["data"] == data
+
+        await hass.async_stop(force=True)
+
+
 async def test_read_only_store(
     hass: HomeAssistant, read_only_store: storage.Store, hass_storage: dict[str, Any]
 ) -> None:
@@ -1177,3 +1241,44 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_writes_are_batched(tmpdir: py.path.local) -> None:
+    """Test stores due at the same time are written by one batch."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        manager = storage.get_internal_store_manager(hass)
+        stores = [
+            storage.Store(hass, MOCK_VERSION, f"{MOCK_KEY}-{index}", atomic_writes=True)
+            for index in range(3)
+        ]
+
+        with patch(
+            "homeassistant.helpers.storage.fsync_directory"
+        ) as mock_fsync_directory:
+            for store in stores:
+                store.async_delay_save(lambda: MOCK_DATA, 1)
+            async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+            await hass.async_block_till_done()
+
+        assert manager.write_batches == 1
+        assert mock_fsync_directory.call_count == 1
+        write_stats = storage.async_get_write_stats(hass)
+        for store in stores:
+            assert (
+                await storage.Store(hass, MOCK_VERSION, store.key).async_load()
+                == MOCK_DATA
+            )
+            stats = write_stats[store.key].as_dict()
+            assert stats["writes"] == 1
+            assert stats["bytes_written"] == await hass.async_add_executor_job(
+                os.path.getsize, store.path
+            )
+            assert stats["max_seconds"] == stats["seconds"] >= 0
+
+        await stores[0].async_save(MOCK_DATA2)
+        assert manager.write_batches == 2
+        assert write_stats[stores[0].key].writes == 2
+
+        await hass.async_stop(force=True)
@@ -1474,3 +1474,53 @@ def test_should_rollover_is_always_false():
         ).shouldRollover(Mock())
         is False
     )
+
+
+def test_import_plan_waves() -> None:
+    """Test the import plan orders independent domains by critical path."""
+    plan = {
+        "dependencies": {
+            "slow_leaf": ["base"],
+            "fast_leaf": ["base"],
+            "unrelated_dep": ["not_setup"],
+        },
+        "durations": {
+            "base": 1.0,
+            "slow_leaf": 5.0,
+            "fast_leaf": 0.1,
+            "independent": 2.0,
+            "unrelated_dep": 0.5,
+        },
+    }
+    assert bootstrap._import_plan_waves(
+        plan, {"base", "slow_leaf", "fast_leaf", "independent", "unrelated_dep"}
+    ) == [
+        ["base", "independent", "unrelated_dep"],
+        ["slow_leaf", "fast_leaf"],
+    ]
+
+
+async def test_import_plan_saved_and_used(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the import plan is saved after startup and used on the next start."""
+    hass.set_state(CoreState.not_running)
+    mock_integration(hass, MockModule(domain="plan_dep"))
+    mock_integration(hass, MockModule(domain="plan_root", dependencies=["plan_dep"]))
+
+    await bootstrap._async_set_up_integrations(hass, {"plan_root": {}})
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    plan = hass_storage[bootstrap.IMPORT_PLAN_STORAGE_KEY]["data"]
+    assert plan["ha_version"] == bootstrap.__version__
+    assert plan["dependencies"] == {"plan_root": ["plan_dep"]}
+    assert plan["durations"].keys() >= {"plan_root", "plan_dep"}
+
+    with patch(
+        "homeassistant.bootstrap._async_preimport_integrations"
+    ) as mock_preimport:
+        await bootstrap._async_set_up_integrations(hass, {"plan_root": {}})
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert len(mock_preimport.mock_calls) == 1
+    assert mock_preimport.mock_calls[0][1][1] == plan
@@ -2,8 +2,10 @@
 
 import asyncio
 import os
+import pathlib
 import sys
 import threading
+from types import ModuleType
 from typing import Any
 from unittest.mock import MagicMock, Mock, patch
 
@@ -1027,6 +1029,87 @@ async def test_import_platform_executor(
     assert await config_flow_task1_result._async_has_devices(hass) is True
 
 
+def test_manifest_cache(hass: HomeAssistant, tmp_path: pathlib.Path) -> None:
+    """Test manifests are resolved from the cache until they change."""
+    root_module = ModuleType("homeassistant.components")
+    root_module.__path__ = [str(tmp_path)]
+    integration_path = tmp_path / "cached_domain"
+    integration_path.mkdir()
+    (integration_path / "__init__.py").write_text("")
+    manifest_path = integration_path / "manifest.json"
+    manifest_path.write_text(json_dumps({"domain": "cached_domain", "name": "One"}))
+
+    cache = hass.data[loader.DATA_MANIFEST_CACHE] = loader.ManifestCache()
+    integration = loader.Integration.resolve_from_root(
+        hass, root_module, "cached_domain"
+    )
+    assert integration.name == "One"
+    assert cache.dirty
+
+    with patch("homeassistant.loader.json_loads") as mock_json_loads:
+        integration = loader.Integration.resolve_from_root(
+            hass, root_module, "cached_domain"
+        )
+    assert not mock_json_loads.called
+    assert integration.name == "One"
+    assert integration.platforms_exists(["__init__"]) == ["__init__"]
+    assert integration.is_built_in
+
+    manifest_path.write_text(json_dumps({"domain": "cached_domain", "name": "Changed"}))
+    integration = loader.Integration.resolve_from_root(
+        hass, root_module, "cached_domain"
+    )
+    assert integration.name == "Changed"
+
+    assert loader.Integration.resolve_from_root(hass, root_module, "missing") is None
+
+    data = cache.as_dict()
+    assert not cache.dirty
+    stat = cache.stat_integration(integration_path)
+    restored = loader.ManifestCache(data)
+    assert restored.get_integration(integration_path, stat)[0]["name"] == "Changed"
+    outdated = loader.ManifestCache({**data, "ha_version": "0.1.0"})
+    assert outdated.get_integration(integration_path, stat) is None
+
+
+async def test_manifest_cache_custom_components_directories(
+    hass: HomeAssistant, tmp_path: pathlib.Path
+) -> None:
+    """Test the sub directories are cached until the directory changes."""
+    (tmp_path / "first").mkdir()
+    (tmp_path / "not_a_dir").write_text("")
+    cache = loader.ManifestCache()
+    assert cache.get_sub_directories(tmp_path) == ["first"]
+
+    with patch.object(pathlib.Path, "iterdir") as mock_iterdir:
+        assert cache.get_sub_directories(tmp_path) == ["first"]
+    assert not mock_iterdir.called
+
+    (tmp_path / "second").mkdir()
+    os.utime(tmp_path, ns=(0, 1))
+    assert sorted(cache.get_sub_directories(tmp_path)) == ["first", "second"]
+
+
+async def test_manifest_cache_load_save(
+    hass: HomeAssistant, hass_storage: dict[str, Any], tmp_path: pathlib.Path
+) -> None:
+    """Test the manifest cache is only saved when it changed."""
+    await loader.async_load_manifest_cache(hass)
+    await loader.async_save_manifest_cache(hass)
+    assert loader.MANIFEST_CACHE_STORAGE_KEY not in hass_storage
+
+    (tmp_path / "first").mkdir()
+    hass.data[loader.DATA_MANIFEST_CACHE].get_sub_directories(tmp_path)
+    await loader.async_save_manifest_cache(hass)
+    data = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]
+    assert data["directories"][str(tmp_path)]["dirs"] == ["first"]
+
+    await loader.async_load_manifest_cache(hass)
+    assert hass.data[loader.DATA_MANIFEST_CACHE].get_sub_directories(tmp_path) == [
+        "first"
+    ]
+
+
 async def test_get_custom_components_recovery_mode(hass: HomeAssistant) -> None:
     """Test that we get empty custom components in recovery mode."""
     hass.config.recovery_mode = True
@@ -1309,6 +1392,24 @@ async def test_async_get_component_preloads_config_and_config_flow(
     }
 
 
+async def test_async_get_component_records_import_times(hass: HomeAssistant) -> None:
+    """Verify the import times of components and platforms are recorded."""
+    integration = _get_test_integration(
+        hass, "executor_import", True, import_executor=True
+    )
+
+    with (
+        patch("homeassistant.loader.importlib.import_module"),
+        patch.object(integration, "platforms_exists", return_value=["config_flow"]),
+    ):
+        await integration.async_get_component()
+
+    import_times = loader.async_get_import_times(hass)
+    assert set(import_times) == {"executor_import", "executor_import.config_flow"}
+    assert all(seconds >= 0 for seconds in import_times.values())
+    assert "diagnostics" not in loader.BASE_PRELOAD_PLATFORMS
+
+
 async def test_async_get_component_loads_loop_if_already_in_sys_modules(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
@@ -1109,6 +1109,45 @@ async def test_async_get_setup_timings(hass) -> None:
     }
 
 
+async def test_async_get_setup_timeline(hass: HomeAssistant) -> None:
+    """Test the setup timeline records the phases and dependency waits."""
+    hass.set_state(CoreState.not_running)
+    mock_integration(hass, MockModule("timeline_dep"))
+    mock_integration(
+        hass, MockModule("timeline_integration", dependencies=["timeline_dep"])
+    )
+    assert await setup.async_setup_component(hass, "timeline_integration", {})
+    await hass.async_block_till_done()
+
+    timeline = setup.async_get_setup_timeline(hass)
+    phases = {(event["domain"], event["phase"]) for event in timeline["events"]}
+    assert {
+        ("timeline_integration", setup.SetupPhases.WAIT_DEPENDENCIES),
+        ("timeline_integration", setup.SetupPhases.REQUIREMENTS),
+        ("timeline_integration", setup.SetupPhases.IMPORT),
+        ("timeline_integration", setup.SetupPhases.SETUP),
+        ("timeline_dep", setup.SetupPhases.IMPORT),
+        ("timeline_dep", setup.SetupPhases.SETUP),
+    } <= phases
+    assert all(
+        event["end"] is not None and event["end"] >= event["start"] >= 0
+        for event in timeline["events"]
+    )
+    assert timeline["dependencies"] == {"timeline_integration": ["timeline_dep"]}
+    assert timeline["critical_path"] == ["timeline_dep", "timeline_integration"]
+
+
+async def test_setup_timeline_not_recorded_when_running(hass: HomeAssistant) -> None:
+    """Test the setup timeline only covers startup."""
+    mock_integration(hass, MockModule("timeline_integration"))
+    assert await setup.async_setup_component(hass, "timeline_integration", {})
+    assert setup.async_get_setup_timeline(hass) == {
+        "events": [],
+        "dependencies": {},
+        "critical_path": [],
+    }
+
+
 async def test_setup_config_entry_from_yaml(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
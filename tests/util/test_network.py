@@ -54,6 +54,31 @@ def test_is_local() -> None:
     assert not network_util.is_local(ip_address("::ffff:208.5.4.2"))
 
 
+def test_ip_network_set() -> None:
+    """Test checking addresses against a set of addresses and networks."""
+    networks = network_util.IPNetworkSet(
+        ["10.0.0.0/8", "192.168.1.20", ip_address("fd00::1"), "2001:db8::/32"]
+    )
+    assert len(networks) == 4
+    assert ip_address("10.1.2.3") in networks
+    assert ip_address("192.168.1.20") in networks
+    assert ip_address("fd00::1") in networks
+    assert ip_address("2001:db8:1::1") in networks
+    assert ip_address("11.0.0.1") not in networks
+    assert ip_address("192.168.1.21") not in networks
+    assert ip_address("fd00::2") not in networks
+    assert ip_address("2001:db9::1") not in networks
+    # An IPv4 mapped IPv6 address does not match IPv4 networks
+    assert ip_address("::ffff:10.1.2.3") not in networks
+
+    networks = network_util.IPNetworkSet()
+    assert not networks
+    assert ip_address("8.8.8.8") not in networks
+    networks.add("0.0.0.0/0")
+    assert ip_address("8.8.8.8") in networks
+    assert ip_address("::1") not in networks
+
+
 def test_is_ip_address() -> None:
     """Test if strings are IP addresses."""
     assert network_util.is_ip_address("192.168.0.1")
@@ -5,6 +5,7 @@ import importlib
 import io
 import os
 import pathlib
+import time
 from typing import Any
 import unittest
 from unittest.mock import Mock, patch
@@ -729,3 +730,90 @@ def test_load_yaml_dict_fail(try_both_loaders, mock_hass_config_yaml: None) -> N
     """Test item without a key."""
     with pytest.raises(yaml_loader.YamlTypeError):
         yaml_loader.load_yaml_dict(YAML_CONFIG_FILE)
+
+
+def test_load_yaml_cache(
+    try_both_loaders, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test parsed files are kept until they or what they depend on changes."""
+    changed = time.time_ns() - 10 * yaml_loader.RACY_INTERVAL_NS
+
+    def write(path: pathlib.Path, content: str) -> None:
+        nonlocal changed
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(content)
+        changed += 1_000_000_000
+        os.utime(path, ns=(changed, changed))
+
+    config_path = tmp_path / YAML_CONFIG_FILE
+    write(
+        config_path,
+        "light: !include light.yaml\n"
+        "automation: !include_dir_merge_list automations\n"
+        "password: !secret password\n"
+        "token: !env_var YAML_CACHE_TOKEN none\n",
+    )
+    write(tmp_path / "light.yaml", "platform: demo\n")
+    write(tmp_path / "automations" / "a.yaml", "- id: a\n")
+    write(tmp_path / yaml.SECRET_YAML, "password: pwd\n")
+    monkeypatch.delenv("YAML_CACHE_TOKEN", raising=False)
+
+    def load() -> tuple[dict, list[str]]:
+        with patch.object(
+            yaml_loader, "parse_yaml", wraps=yaml_loader.parse_yaml
+        ) as parse_yaml:
+            config = yaml.load_yaml_dict(config_path, yaml.Secrets(tmp_path))
+        return config, sorted(
+            os.path.basename(call.args[0].name) for call in parse_yaml.call_args_list
+        )
+
+    config, parsed = load()
+    assert config == {
+        "light": {"platform": "demo"},
+        "automation": [{"id": "a"}],
+        "password": "pwd",
+        "token": "none",
+    }
+    assert parsed == ["a.yaml", "configuration.yaml", "light.yaml", "secrets.yaml"]
+
+    # Changing the loaded configuration does not change the kept one
+    config["light"]["platform"] = "changed"
+    config["automation"].append({"id": "b"})
+
+    config, parsed = load()
+    assert config["light"] == {"platform": "demo"}
+    assert config["light"].__config_file__ == str(config_path)
+    assert config["light"].__line__ == 1
+    assert config["automation"] == [{"id": "a"}]
+    assert parsed == []
+
+    write(tmp_path / "automations" / "a.yaml", "- id: c\n")
+    config, parsed = load()
+    assert config["automation"] == [{"id": "c"}]
+    assert parsed == ["a.yaml", "configuration.yaml"]
+
+    write(tmp_path / "automations" / "b.yaml", "- id: b\n")
+    config, parsed = load()
+    assert config["automation"] == [{"id": "c"}, {"id": "b"}]
+    assert parsed == ["b.yaml", "configuration.yaml"]
+
+    write(tmp_path / yaml.SECRET_YAML, "password: secret\n")
+    config, parsed = load()
+    assert config["password"] == "secret"
+    assert parsed == ["configuration.yaml", "secrets.yaml"]
+
+    monkeypatch.setenv("YAML_CACHE_TOKEN", "abc")
+    config, parsed = load()
+    assert config["token"] == "abc"
+    assert parsed == ["configuration.yaml"]
+
+    # A file changed just now is parsed until it can be told if it changes again
+    (tmp_path / "light.yaml").write_text("platform: template\n")
+    for _ in range(2):
+        config, parsed = load()
+        assert config["light"] == {"platform": "template"}
+        assert parsed == ["configuration.yaml", "light.yaml"]
+
+    # Secrets are not supported without the secrets
+    with pytest.raises(HomeAssistantError, match="Secrets not supported"):
+        yaml.load_yaml(config_path)